@@ -0,0 +1,129 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List
+
+from bench.run import start_stub
+from bench.stub_server import OSRS_PATH, RS3_PATH, add_stub_arguments
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def engine_env() -> dict:
+    """Environment that finds the engine package from any working directory."""
+    path = os.environ.get("PYTHONPATH")
+    return dict(os.environ, PYTHONPATH=ROOT + (os.pathsep + path if path else ""))
+
+
+def engine_command(temp_dir: str, *args: str) -> List[str]:
+    """``python -m engine job ...`` on the scenario's jobs and progress files."""
+    return [
+        sys.executable, "-m", "engine", "job", "--jobs-file", os.path.join(temp_dir, "jobs.db"), *args,
+    ]
+
+
+def checker_options(temp_dir: str, base_url: str, args) -> List[str]:
+    return [
+        "--source", args.source,
+        "--engine", args.engine,
+        "--rate", str(args.rate),
+        "--progress-file", os.path.join(temp_dir, "progress.db"),
+        "--hiscores-url", f"osrs={base_url}{OSRS_PATH},rs3={base_url}{RS3_PATH}",
+    ]
+
+
+def read_results(path: str) -> List[dict]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def run_scenario(args, base_url: str) -> List[str]:
+    """Start a job, pause it from another process, resume it; return what went wrong."""
+    failures = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        names = [f"j{index:03d}" for index in range(args.names)]
+        names_file = os.path.join(temp_dir, "names.txt")
+        with open(names_file, 'w', encoding='utf-8') as f:
+            f.write("\n".join(names) + "\n")
+        options = checker_options(temp_dir, base_url, args)
+        # Run from the temporary directory so the engine's logs/ stay out of the repository
+        env = engine_env()
+
+        first = os.path.join(temp_dir, "first.jsonl")
+        with open(first, 'w', encoding='utf-8') as out:
+            run = subprocess.Popen(
+                engine_command(temp_dir, "start", "scenario", "--file", names_file, *options),
+                stdout=out, stderr=subprocess.DEVNULL, cwd=temp_dir, env=env,
+            )
+            # Pause once part of the input is checked, with lookups still in flight
+            deadline = time.monotonic() + 30
+            while len(read_results(first)) < args.pause_after and run.poll() is None and time.monotonic() < deadline:
+                time.sleep(0.05)
+            subprocess.run(engine_command(temp_dir, "pause", "scenario"), cwd=temp_dir, env=env, check=True)
+            run.wait(timeout=60)
+
+        jobs = subprocess.run(
+            engine_command(temp_dir, "list"), cwd=temp_dir, env=env, capture_output=True, text=True, check=True,
+        ).stdout
+        if " paused " not in jobs:
+            failures.append(f"job was not paused:\n{jobs}")
+
+        second = os.path.join(temp_dir, "second.jsonl")
+        with open(second, 'w', encoding='utf-8') as out:
+            resumed = subprocess.run(
+                engine_command(temp_dir, "resume", "scenario", *options),
+                stdout=out, stderr=subprocess.PIPE, text=True, cwd=temp_dir, env=env,
+            )
+        if resumed.returncode != 0:
+            failures.append(f"resume failed: {resumed.stderr.strip()}")
+
+        results = [row for row in read_results(first) + read_results(second) if row.get('outcome') != 'cancelled']
+        missing = sorted(set(names) - {row['name'] for row in results})
+        if missing:
+            failures.append(f"{len(missing)} names never checked: {', '.join(missing[:10])}")
+        jobs = subprocess.run(
+            engine_command(temp_dir, "list"), cwd=temp_dir, env=env, capture_output=True, text=True, check=True,
+        ).stdout
+        if " done " not in jobs:
+            failures.append(f"job is not done after resuming:\n{jobs}")
+        print(
+            f"{len(read_results(first))} results before the pause, {len(read_results(second))} after, "
+            f"{len(names) - len(missing)}/{len(names)} names checked",
+            file=sys.stderr,
+        )
+    return failures
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m bench.resume",
+        description="Pause a job mid-run and resume it against a local stub, failing if any name is lost.",
+    )
+    parser.add_argument("-s", "--source", choices=["osrs", "rs3", "both"], default="both", help="hiscores to check (default: both)")
+    parser.add_argument("--engine", choices=["threads", "async"], default="threads", help="checker engine (default: threads)")
+    parser.add_argument("--names", type=int, default=60, help="names in the job (default: 60)")
+    parser.add_argument("--pause-after", type=int, default=15, help="results to wait for before pausing (default: 15)")
+    parser.add_argument("-r", "--rate", type=float, default=20.0, help="rate limit, low so the pause lands mid-run (default: 20)")
+    add_stub_arguments(parser)
+    parser.set_defaults(latency="fixed:50")
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    stub = start_stub(args)
+    try:
+        failures = run_scenario(args, f"http://127.0.0.1:{stub.port}")
+    finally:
+        stub.kill()
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
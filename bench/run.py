@@ -0,0 +1,225 @@
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from bench.stub_server import OSRS_PATH, RS3_PATH, add_stub_arguments, stub_options
+
+try:
+    import resource
+except ImportError:  # Windows: CPU time still works, peak RSS is not reported
+    resource = None
+
+
+def percentile(values: List[float], fraction: float) -> Optional[float]:
+    """Nearest-rank percentile of a list of values, or None if it is empty."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def timed(checker_class, latencies: List[float]):
+    """Subclass a checker so every lookup's duration is appended to ``latencies``."""
+
+    class TimedChecker(checker_class):
+        def check_name_availability(self, name, source):
+            started = time.perf_counter()
+            try:
+                return super().check_name_availability(name, source)
+            finally:
+                latencies.append(time.perf_counter() - started)
+
+        async def check_name_availability_async(self, session, name, source):
+            started = time.perf_counter()
+            try:
+                return await super().check_name_availability_async(session, name, source)
+            finally:
+                latencies.append(time.perf_counter() - started)
+
+    return TimedChecker
+
+
+def run_case(case: dict) -> dict:
+    """Run one benchmark case in this process and return its measurements."""
+    from engine.checker import OSRS_SOURCE, RS3_SOURCE, SOURCES, NameChecker
+
+    # Same log calls as a real run, without writing log files
+    logging.getLogger("rsn_checker").addHandler(logging.NullHandler())
+
+    base_url = case['base_url']
+    options = dict(
+        rate_limit=case['rate'],
+        burst=max(1, case['workers']),
+        max_retries=case['retries'],
+        keep_results=False,
+        base_urls={OSRS_SOURCE: base_url + OSRS_PATH, RS3_SOURCE: base_url + RS3_PATH},
+    )
+    latencies: List[float] = []
+    outcomes: Counter = Counter()
+
+    if case['engine'] == "async":
+        from engine.async_checker import AsyncNameChecker
+        checker_class, options['concurrency'] = AsyncNameChecker, case['workers']
+    else:
+        checker_class, options['max_workers'] = NameChecker, case['workers']
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # A fresh progress store, so no name is skipped as already checked
+        checker = timed(checker_class, latencies)(
+            progress_file=os.path.join(temp_dir, "progress.db"),
+            legacy_progress_file=os.path.join(temp_dir, "progress.json"),
+            on_result=lambda row: outcomes.update([row.get('outcome') or row['status']]),
+            **options,
+        )
+        names = (f"b{index:07d}" for index in range(case['names']))
+
+        cpu_started = time.process_time()
+        started = time.perf_counter()
+        checker.search_name(names, SOURCES[case['source']])
+        seconds = time.perf_counter() - started
+        cpu_seconds = time.process_time() - cpu_started
+        checker.store.close()
+
+    peak_rss_mb = None
+    if resource is not None:
+        # ru_maxrss is in KiB on Linux and bytes on macOS
+        scale = 1 if sys.platform == "darwin" else 1024
+        peak_rss_mb = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / (1 << 20), 1)
+
+    return dict(
+        case,
+        seconds=round(seconds, 3),
+        names_per_sec=round(case['names'] / seconds, 1) if seconds else None,
+        requests=len(latencies),
+        latency_ms={
+            'p50': _ms(percentile(latencies, 0.50)),
+            'p90': _ms(percentile(latencies, 0.90)),
+            'p99': _ms(percentile(latencies, 0.99)),
+            'max': _ms(max(latencies) if latencies else None),
+        },
+        cpu_seconds=round(cpu_seconds, 3),
+        cpu_per_name_ms=round(cpu_seconds * 1000 / case['names'], 3) if case['names'] else None,
+        peak_rss_mb=peak_rss_mb,
+        outcomes=dict(outcomes),
+    )
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    return None if seconds is None else round(seconds * 1000, 2)
+
+
+def start_stub(args) -> subprocess.Popen:
+    """Start the stub server in its own process, so its CPU time is not measured."""
+    command = [sys.executable, "-m", "bench.stub_server", "--port", "0"]
+    for option, value in stub_options(args).items():
+        command += [f"--{option.replace('_', '-')}", str(value)]
+    stub = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    line = stub.stdout.readline()
+    if not line.startswith("listening on "):
+        stub.kill()
+        raise RuntimeError("stub server did not start")
+    stub.port = int(line.split()[-1])
+    return stub
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def int_list(spec: str) -> List[int]:
+    return [int(value) for value in spec.split(",") if value.strip()]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m bench",
+        description="Measure checker throughput against a local stub of the hiscores.",
+    )
+    parser.add_argument("--engines", default="threads,async", help="engines to run (default: threads,async)")
+    parser.add_argument("--workers", type=int_list, default=[1, 5, 20], help="worker counts (async: lookups in flight) (default: 1,5,20)")
+    parser.add_argument("--names", type=int_list, default=[200, 1000], help="batch sizes (default: 200,1000)")
+    parser.add_argument("-s", "--source", choices=["osrs", "rs3", "both"], default="osrs", help="hiscores to check (default: osrs)")
+    parser.add_argument("-r", "--rate", type=float, default=100_000.0, help="rate limit in requests/second; high by default so it does not cap throughput")
+    parser.add_argument("--retries", type=int, default=3, help="in-run retries of transient failures (default: 3)")
+    parser.add_argument("--repeat", type=int, default=1, help="runs of every case (default: 1)")
+    parser.add_argument("-o", "--output", help="write the JSON report to this file instead of stdout")
+    parser.add_argument("--case", help=argparse.SUPPRESS)  # Internal: run one case and print its JSON
+    add_stub_arguments(parser)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.case:
+        print(json.dumps(run_case(json.loads(args.case))))
+        return 0
+
+    stub = start_stub(args)
+    results: List[Dict] = []
+    try:
+        for engine in filter(None, args.engines.split(",")):
+            for workers in args.workers:
+                for names in args.names:
+                    for run in range(args.repeat):
+                        case = dict(
+                            engine=engine,
+                            workers=workers,
+                            names=names,
+                            source=args.source,
+                            rate=args.rate,
+                            retries=args.retries,
+                            run=run,
+                            base_url=f"http://127.0.0.1:{stub.port}",
+                        )
+                        # Every case gets a fresh process so CPU time and peak RSS are its own
+                        completed = subprocess.run(
+                            [sys.executable, "-m", "bench", "--case", json.dumps(case)],
+                            capture_output=True, text=True,
+                        )
+                        if completed.returncode != 0:
+                            print(completed.stderr, file=sys.stderr)
+                            raise RuntimeError(f"benchmark case failed: {case}")
+                        result = json.loads(completed.stdout.strip().splitlines()[-1])
+                        del result['base_url']
+                        results.append(result)
+                        print(
+                            f"{engine:>7} workers={workers:<4} names={names:<6} "
+                            f"{result['names_per_sec']:>8} names/s  p50={result['latency_ms']['p50']}ms "
+                            f"p99={result['latency_ms']['p99']}ms  cpu={result['cpu_seconds']}s  rss={result['peak_rss_mb']}MB",
+                            file=sys.stderr,
+                        )
+    finally:
+        stub.terminate()
+        stub.wait()
+
+    report = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'stub': stub_options(args),
+        'results': results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
@@ -0,0 +1,204 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from bench.run import git_revision
+
+# Modules timed on import, each in a fresh interpreter
+IMPORT_TARGETS = ["engine.checker", "engine.cli", "engine.async_checker", "main"]
+
+# Heavy libraries a module must not load on import; they are imported on first use
+DEFERRED = {
+    "engine.checker": ["asyncio", "aiohttp", "http.server", "rs3_api", "osrs_api", "pandas", "openpyxl"],
+    "engine.cli": ["asyncio", "aiohttp", "http.server", "rs3_api", "osrs_api", "pandas", "openpyxl"],
+    "main": ["rs3_api", "osrs_api", "pandas", "openpyxl"],
+}
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_IMPORT_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+try:
+    import {module}
+    error = None
+except Exception as e:
+    error = f"{{type(e).__name__}}: {{e}}"
+seconds = time.perf_counter() - started
+print(json.dumps({{"seconds": seconds, "error": error, "loaded": [m for m in {deferred!r} if m in sys.modules]}}))
+"""
+
+_STARTUP_PROBE = """
+import json, os, time
+started = time.perf_counter()
+from engine.checker import NameChecker
+checker = NameChecker(progress_file={progress_file!r}, legacy_progress_file=os.devnull + ".json")
+constructed = time.perf_counter()
+checker.load_progress()
+loaded = time.perf_counter()
+print(json.dumps({{"construct": constructed - started, "load_progress": loaded - constructed}}))
+"""
+
+_GUI_PROBE = """
+import json, os, time
+started = time.perf_counter()
+import main
+app = main.RunescapeNameChecker()
+app.root.update()
+shown = time.perf_counter()
+print(json.dumps({{"window_shown": shown - started}}))
+app.root.destroy()
+"""
+
+
+def probe(code: str) -> dict:
+    """Run a snippet in a fresh interpreter and return the JSON it prints.
+
+    The snippet runs in an empty temporary directory, so the files the app
+    creates or migrates there (progress.db, jobs.db, progress.json) are not
+    the repository's.
+    """
+    path = os.environ.get("PYTHONPATH")
+    env = dict(os.environ, PYTHONPATH=ROOT + (os.pathsep + path if path else ""))
+    with tempfile.TemporaryDirectory() as temp_dir:
+        completed = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, cwd=temp_dir, env=env,
+        )
+    if completed.returncode != 0:
+        return {"error": (completed.stderr.strip().splitlines() or ["failed"])[-1]}
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def median_ms(samples: List[float]) -> Optional[float]:
+    return round(statistics.median(samples) * 1000, 1) if samples else None
+
+
+def time_import(module: str, repeat: int) -> dict:
+    """Median import time of a module and the deferred libraries it loaded anyway."""
+    samples: List[float] = []
+    loaded: List[str] = []
+    error = None
+    for _ in range(repeat):
+        result = probe(_IMPORT_PROBE.format(module=module, deferred=DEFERRED.get(module, [])))
+        error = result.get("error")
+        if error:
+            break
+        samples.append(result["seconds"])
+        loaded = result["loaded"]
+    return {"module": module, "median_ms": median_ms(samples), "eagerly_loaded": loaded, "error": error}
+
+
+def build_progress_db(path: str, names: int):
+    """Fill a progress database with ``names`` checked names, as after a long sweep."""
+    from engine.store import ProgressStore
+
+    store = ProgressStore(path)
+    timestamp = datetime.now().isoformat()
+    for index in range(names):
+        store.put(f"s{index:07d}", {'status': 'checked', 'available': index % 5 == 0, 'source': "OSRS Hiscores", 'timestamp': timestamp})
+    store.close()
+
+
+def time_startup(progress_names: int, repeat: int) -> dict:
+    """Median time to create the engine and to load a progress history of the given size."""
+    construct: List[float] = []
+    load: List[float] = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        progress_file = os.path.join(temp_dir, "progress.db")
+        build_progress_db(progress_file, progress_names)
+        for _ in range(repeat):
+            result = probe(_STARTUP_PROBE.format(progress_file=progress_file))
+            if "error" in result:
+                return {"progress_names": progress_names, "error": result["error"]}
+            construct.append(result["construct"])
+            load.append(result["load_progress"])
+    return {
+        "progress_names": progress_names,
+        "construct_ms": median_ms(construct),
+        "load_progress_ms": median_ms(load),
+    }
+
+
+def time_gui(repeat: int) -> dict:
+    """Median time until the GUI window is drawn; needs a display."""
+    if sys.platform.startswith("linux") and not os.environ.get("DISPLAY"):
+        return {"window_shown_ms": None, "error": "no display"}
+    samples: List[float] = []
+    for _ in range(repeat):
+        result = probe(_GUI_PROBE)
+        if "error" in result:
+            return {"window_shown_ms": None, "error": result["error"]}
+        samples.append(result["window_shown"])
+    return {"window_shown_ms": median_ms(samples)}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m bench.startup",
+        description="Measure import and startup time, failing when a budget is exceeded.",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement; the median is reported (default: 5)")
+    parser.add_argument("--progress-names", type=int, default=100_000, help="names in the progress history loaded at startup (default: 100000)")
+    parser.add_argument("--max-import-ms", type=float, help="fail if any module takes longer than this to import")
+    parser.add_argument("--max-construct-ms", type=float, help="fail if creating the engine takes longer than this")
+    parser.add_argument("--gui", action="store_true", help="also time the GUI until its window is drawn (needs a display)")
+    parser.add_argument("-o", "--output", help="write the JSON report to this file instead of stdout")
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+
+    imports = [time_import(module, args.repeat) for module in IMPORT_TARGETS]
+    startup = time_startup(args.progress_names, args.repeat)
+    report: Dict = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'imports': imports,
+        'startup': startup,
+    }
+    if args.gui:
+        report['gui'] = time_gui(args.repeat)
+
+    # Regressions: deferred libraries loaded on import, or a time budget exceeded
+    failures = []
+    for result in imports:
+        if result['eagerly_loaded']:
+            failures.append(f"{result['module']} imports {', '.join(result['eagerly_loaded'])} at load time")
+        if args.max_import_ms is not None and (result['median_ms'] or 0) > args.max_import_ms:
+            failures.append(f"{result['module']} took {result['median_ms']} ms to import (budget {args.max_import_ms} ms)")
+    if args.max_construct_ms is not None and (startup.get('construct_ms') or 0) > args.max_construct_ms:
+        failures.append(f"creating the engine took {startup['construct_ms']} ms (budget {args.max_construct_ms} ms)")
+    report['failures'] = failures
+
+    for result in imports:
+        status = result['error'] or f"{result['median_ms']} ms"
+        print(f"import {result['module']:<22} {status}", file=sys.stderr)
+    print(
+        f"engine created in {startup.get('construct_ms')} ms, "
+        f"{args.progress_names} names of history loaded in {startup.get('load_progress_ms')} ms",
+        file=sys.stderr,
+    )
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
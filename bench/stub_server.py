@@ -0,0 +1,185 @@
+import argparse
+import hashlib
+import random
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+from urllib.parse import parse_qs, urlsplit
+
+# Paths of the real endpoints, so base URLs only differ in host and port
+OSRS_PATH = "/m=hiscore_oldschool/index_lite.ws"
+RS3_PATH = "/m=hiscore/index_lite.ws"
+WEBHOOK_PATH = "/webhook"
+
+# A taken name gets a body the size of a real index_lite response
+_SKILL_LINE = b"1234567,99,13034431\n"
+_BODY_LINES = {OSRS_PATH: 100, RS3_PATH: 60}
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """Parse a latency distribution in milliseconds into a sampler returning seconds.
+
+    Accepted forms: "fixed:50", "uniform:20:80", "exp:50" (mean) and
+    "lognormal:50:0.5" (median and sigma, a long tail like real networks).
+    """
+    kind, *values = spec.split(":")
+    values = [float(value) for value in values]
+    if kind == "fixed" and len(values) == 1:
+        return lambda rng: values[0] / 1000
+    if kind == "uniform" and len(values) == 2:
+        return lambda rng: rng.uniform(values[0], values[1]) / 1000
+    if kind == "exp" and len(values) == 1:
+        return lambda rng: rng.expovariate(1 / values[0]) / 1000 if values[0] else 0.0
+    if kind == "lognormal" and len(values) == 2:
+        return lambda rng: rng.lognormvariate(0, values[1]) * values[0] / 1000
+    raise ValueError(f"invalid latency distribution: {spec!r}")
+
+
+def name_is_free(name: str, free_ratio: float) -> bool:
+    """Whether a name is "not found": fixed per name, so every run sees the same answers."""
+    digest = hashlib.blake2b(name.lower().encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little") / 2 ** 64 < free_ratio
+
+
+class StubHiscores(ThreadingHTTPServer):
+    """Local stand-in for the OSRS and RS3 index_lite endpoints.
+
+    Every request sleeps for a sampled latency, then answers 404 for a fixed
+    share of names and 200 with a full skills body for the rest. A share of
+    requests can instead get 429, 503, or have the connection dropped.
+    """
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(
+        self,
+        address,
+        latency: str = "fixed:50",
+        free_ratio: float = 0.2,
+        rate_limit_ratio: float = 0.0,
+        error_ratio: float = 0.0,
+        drop_ratio: float = 0.0,
+        seed: int = 0,
+    ):
+        super().__init__(address, StubHandler)
+        self.latency = parse_latency(latency)
+        self.free_ratio = free_ratio
+        self.rate_limit_ratio = rate_limit_ratio
+        self.error_ratio = error_ratio
+        self.drop_ratio = drop_ratio
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+
+    def draw(self):
+        """Sample a latency and a fault roll for one request."""
+        with self.rng_lock:
+            return self.latency(self.rng), self.rng.random()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, like the real endpoints
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path not in _BODY_LINES:
+            self.respond(404, b"")
+            return
+        name = parse_qs(url.query).get("player", [""])[0]
+        server = self.server
+        delay, roll = server.draw()
+        time.sleep(delay)
+
+        # Faults are drawn from one roll so their ratios add up
+        if roll < server.drop_ratio:
+            self.close_connection = True
+            self.connection.close()
+            return
+        roll -= server.drop_ratio
+        if roll < server.rate_limit_ratio:
+            self.respond(429, b"Too many requests")
+            return
+        roll -= server.rate_limit_ratio
+        if roll < server.error_ratio:
+            self.respond(503, b"Service unavailable")
+            return
+
+        if name_is_free(name, server.free_ratio):
+            self.respond(404, b"")
+        else:
+            self.respond(200, _SKILL_LINE * _BODY_LINES[url.path])
+
+    def do_POST(self):
+        """Webhook receiver: print each posted body on its own line (for ``engine watch --webhook``)."""
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if urlsplit(self.path).path != WEBHOOK_PATH:
+            self.respond(404, b"")
+            return
+        print(body.decode("utf-8", "replace"), flush=True)
+        self.respond(204, b"")
+
+    def respond(self, status: int, body: bytes):
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def setup(self):
+        super().setup()
+        # Headers and body are separate writes; without this Nagle's algorithm
+        # and delayed ACKs add ~40 ms to every response
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def handle(self):
+        try:
+            super().handle()
+        except ConnectionError:
+            pass  # Clients closing kept-alive connections is normal
+
+    def log_message(self, format, *args):
+        pass
+
+
+def add_stub_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--latency", default="lognormal:50:0.5", help="response latency in ms: fixed:50, uniform:20:80, exp:50 or lognormal:50:0.5 (default)")
+    parser.add_argument("--free-ratio", type=float, default=0.2, help="share of names answered with 404 (default: 0.2)")
+    parser.add_argument("--rate-limit-ratio", type=float, default=0.0, help="share of requests answered with 429 (default: 0)")
+    parser.add_argument("--error-ratio", type=float, default=0.0, help="share of requests answered with 503 (default: 0)")
+    parser.add_argument("--drop-ratio", type=float, default=0.0, help="share of connections dropped without a response (default: 0)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for latencies and faults (default: 0)")
+
+
+def stub_options(args) -> dict:
+    return dict(
+        latency=args.latency,
+        free_ratio=args.free_ratio,
+        rate_limit_ratio=args.rate_limit_ratio,
+        error_ratio=args.error_ratio,
+        drop_ratio=args.drop_ratio,
+        seed=args.seed,
+    )
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m bench.stub_server", description="Local stub of the hiscores index_lite endpoints.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0, help="port to listen on (default: any free port)")
+    add_stub_arguments(parser)
+    args = parser.parse_args(argv)
+
+    server = StubHiscores((args.host, args.port), **stub_options(args))
+    # The benchmark runner reads the port from this line
+    print(f"listening on {server.server_address[1]}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
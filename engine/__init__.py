@@ -0,0 +1 @@
+# Engine package
@@ -0,0 +1,4 @@
+import sys
+from engine.cli import main
+
+sys.exit(main())
@@ -0,0 +1,151 @@
+import aiohttp
+import asyncio
+import signal
+import time
+from typing import Iterable, Iterator, Optional, Tuple
+from urllib.parse import quote
+import functions.time
+from engine.checker import NameChecker, merge_source_results, source_list
+from engine.outcomes import DEFINITIVE, Outcome, classify_status
+
+
+class AsyncNameChecker(NameChecker):
+    """Checker that keeps hundreds of lookups in flight on one event loop.
+
+    Instead of one blocking API call per thread, every lookup is a request on a
+    shared ``aiohttp`` connection pool against the index_lite endpoints. Results
+    keep the same dict shape as ``NameChecker.check_single_name``. When checking
+    several sources, ``source_workers`` caps the lookups in flight per source.
+    """
+
+    def __init__(self, concurrency: int = 100, **kwargs):
+        super().__init__(**kwargs)
+        self.concurrency = concurrency  # Lookups kept in flight at once
+
+    async def check_name_availability_async(self, session: aiohttp.ClientSession, name: str, source: str) -> Tuple[Outcome, Optional[str]]:
+        """Look a name up once, returning the same values as check_name_availability."""
+        url = f"{self.base_urls[source]}?player={quote(name)}"
+        try:
+            async with session.get(url) as response:
+                # The body is not needed, only whether the player exists
+                outcome = classify_status(response.status)
+                return outcome, None if outcome in DEFINITIVE else f"HTTP {response.status}"
+        except asyncio.TimeoutError:
+            return Outcome.TIMEOUT, "Request timed out"
+        except aiohttp.ClientError as e:
+            return Outcome.NETWORK_ERROR, str(e)[:50] or type(e).__name__
+        except Exception as e:
+            # Anything else (a malformed URL or response) fails this lookup, not the run
+            return Outcome.NETWORK_ERROR, str(e)[:50] or type(e).__name__
+
+    async def check_single_name_async(self, session: aiohttp.ClientSession, name: str, source: str) -> dict:
+        """Check a single name with in-run retries and record its detailed status."""
+        attempt = 0
+        while True:
+            attempt += 1
+
+            # Wait for the circuit breaker and a token from the shared bucket
+            if not await self.breaker.acquire_async(self.stop_event):
+                return self.build_result(name, source, Outcome.CANCELLED, 'Cancelled by user', attempt)
+            waited_from = time.perf_counter()
+            await self.rate_limiter.acquire_async()
+            self.metrics.observe_limiter_wait(time.perf_counter() - waited_from)
+            if self.stop_event.is_set():
+                return self.build_result(name, source, Outcome.CANCELLED, 'Cancelled by user', attempt)
+
+            self.metrics.request_started()
+            started = time.perf_counter()
+            outcome, detail = await self.check_name_availability_async(session, name, source)
+            self.metrics.request_finished(source, outcome.value, time.perf_counter() - started)
+            self.report_outcome(name, source, outcome)
+
+            # Transient failures are retried after an exponential, jittered backoff; the
+            # coroutine keeps its concurrency slot while it sleeps
+            delay = self.should_retry(name, source, outcome, attempt)
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
+
+        result_dict = self.build_result(name, source, outcome, detail, attempt)
+        self.update_status(result_dict)
+        self.log_result(result_dict)
+        return result_dict
+
+    async def check_source_async(self, session: aiohttp.ClientSession, limit: asyncio.Semaphore, name: str, source: str) -> dict:
+        """Check one source of a multi-source search, reusing a result that is still fresh."""
+        result_dict = self.fresh_result(name, source)
+        if result_dict:
+            return result_dict
+        async with limit:
+            return await self.check_single_name_async(session, name, source)
+
+    def names_in_flight(self, source: str) -> int:
+        """Every worker coroutine holds one name, whatever the sources."""
+        return self.concurrency
+
+    async def _run(self, valid_names: Iterator[str], source: str):
+        """Drain the names lazily with a fixed number of worker coroutines."""
+        sources = source_list(source)
+        limits = {item: asyncio.Semaphore(self.source_workers.get(item, self.concurrency)) for item in sources}
+
+        async def check(session, name):
+            if len(sources) == 1:
+                return await self.check_single_name_async(session, name, source)
+            # Every source is looked up at the same time, each within its own limit
+            parts = await asyncio.gather(*(self.check_source_async(session, limits[item], name, item) for item in sources))
+            return merge_source_results(name, source, dict(zip(sources, parts)))
+
+        async def worker(session):
+            # Workers share one iterator, so each name is taken exactly once
+            # and at most ``concurrency`` names are held at any time
+            for name in valid_names:
+                if self.stop_event.is_set():
+                    return
+                result_dict = await check(session, name)
+                try:
+                    self.record_result(result_dict)
+                except Exception as e:
+                    self.on_log(f"[error] {name}: {str(e)}")
+                    self.logger.error(f"Exception processing result for {name}: {e}")
+
+        # Ctrl+C stops the run like stop() instead of cancelling the lookups in flight,
+        # so they still finish and are recorded (only possible on the main thread, not on Windows)
+        loop = asyncio.get_running_loop()
+        try:
+            loop.add_signal_handler(signal.SIGINT, self.stop)
+            handles_sigint = True
+        except (NotImplementedError, RuntimeError, ValueError):
+            handles_sigint = False
+
+        connector = aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=self.concurrency)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        try:
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+                await asyncio.gather(*(worker(session) for _ in range(self.concurrency)))
+        finally:
+            if handles_sigint:
+                loop.remove_signal_handler(signal.SIGINT)
+
+        if self.stop_event.is_set():
+            self.on_log(f"{functions.time.get_time()}: Search stopped by user")
+            self.logger.info(f"Search stopped by user after {self.run_stats['completed']} names")
+
+    def search_name(self, names: Iterable[str], source: str) -> bool:
+        """Check every name in ``names`` on an asyncio event loop; False if it failed."""
+        try:
+            self.start_search()
+            self.on_log(f"[info] Starting async check with {self.concurrency} lookups in flight")
+            asyncio.run(self._run(self.filter_names(names, source), source))
+            self.finish_search()
+            return True
+
+        except Exception as e:
+            # Handle any unexpected errors
+            self.on_log(f"[FATAL ERROR] {str(e)}")
+            self.on_progress("Error occurred")
+            self.logger.error(f"Fatal error in search_name: {e}")
+            return False
+        finally:
+            # Commit whatever was stored, even when the run was interrupted
+            self.save_progress()
+            self.end_search()
@@ -0,0 +1,93 @@
+import re
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+DAY = 24 * 60 * 60
+
+# How long a result stays valid before the name is checked again (seconds)
+DEFAULT_TTLS = {
+    'available': 1 * DAY,  # Free names get taken, so re-verify them soon
+    'taken': 90 * DAY,  # Taken names are rarely freed
+    'error': 0,  # Errors are always retried
+}
+
+_DURATION = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([smhdw]?)\s*$")
+_UNITS = {'': 1, 's': 1, 'm': 60, 'h': 60 * 60, 'd': DAY, 'w': 7 * DAY}
+
+
+def parse_duration(text: str) -> float:
+    """Parse a duration such as "90", "30m", "12h" or "7d" into seconds."""
+    match = _DURATION.match(text.lower())
+    if not match:
+        raise ValueError(f"invalid duration: {text!r}")
+    return float(match.group(1)) * _UNITS[match.group(2)]
+
+
+def outcome_of(info: dict) -> str:
+    """Classify a stored status as 'available', 'taken' or 'error'."""
+    if info.get('status') == 'checked':
+        return 'available' if info.get('available') else 'taken'
+    return 'error'
+
+
+class ResultCache:
+    """Bounded, expiring view of the progress store.
+
+    Recently used entries stay in an LRU of at most ``max_entries``; everything
+    else is read from the store on demand, so memory no longer grows with the
+    history. Each outcome has its own TTL, and expired results are reported as
+    stale so the name is re-verified instead of skipped forever.
+    """
+
+    def __init__(self, store, ttls: Optional[Dict[str, float]] = None, max_entries: int = 100_000):
+        self.store = store
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[Tuple[str, str], Optional[dict]]" = OrderedDict()
+        self.lock = threading.Lock()
+
+    def _remember(self, key: Tuple[str, str], info: Optional[dict]):
+        self.entries[key] = info
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def get(self, name: str, source: str) -> Optional[dict]:
+        """Return the stored status of a canonical name on a source (fresh or not), or None."""
+        key = (name, source)
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                return self.entries[key]
+        info = self.store.get(name, source)
+        with self.lock:
+            self._remember(key, info)
+        return info
+
+    def put(self, name: str, info: dict):
+        """Write a status through to the store and keep it in the LRU."""
+        self.store.put(name, info)
+        with self.lock:
+            self._remember((name, info['source']), info)
+
+    def is_fresh(self, info: dict) -> bool:
+        """Whether a stored result is still within the TTL of its outcome."""
+        ttl = self.ttls[outcome_of(info)]
+        if ttl <= 0 or not info.get('timestamp'):
+            return False
+        try:
+            checked_at = datetime.fromisoformat(info['timestamp'])
+        except ValueError:
+            return False
+        return (datetime.now() - checked_at).total_seconds() < ttl
+
+    def lookup(self, name: str, source: str) -> Tuple[Optional[dict], bool]:
+        """Return ``(info, fresh)`` for a canonical name on a source."""
+        info = self.get(name, source)
+        return info, info is not None and self.is_fresh(info)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
@@ -0,0 +1,767 @@
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+import threading
+import time
+import functions.time
+import os
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import logging
+from engine.ratelimit import TokenBucket
+from engine.scheduler import FanOutExecutor, run_windowed
+from engine.bloom import BloomFilter
+from engine.cache import ResultCache
+from engine.hiscores_client import HiscoresClient
+from engine.logs import LOG_MODES, OutcomeSummary, rotating_file_handler, start_queue_logging
+from engine.metrics import Metrics, MetricsFileWriter
+from engine.names import canonical_name, validate_name
+from engine.outcomes import DEFINITIVE, THROTTLING, TRANSIENT, Outcome, classify_exception, classify_message, classify_status
+from engine.priority import prioritized
+from engine.retry import CircuitBreaker, retry_delay
+from engine.store import ProgressStore, migrate_legacy_progress
+
+OSRS_SOURCE = "OSRS Hiscores"
+RS3_SOURCE = "RS3 Hiscores"
+
+# Checks every name on both hiscores in one pass, with one merged result row
+BOTH_SOURCES = "OSRS + RS3 Hiscores"
+
+# Short source names accepted on the command line
+SOURCES = {"osrs": OSRS_SOURCE, "rs3": RS3_SOURCE, "both": BOTH_SOURCES}
+
+# index_lite endpoints: 200 means the player exists, 404 means the name is free
+HISCORE_URLS = {
+    OSRS_SOURCE: "https://secure.runescape.com/m=hiscore_oldschool/index_lite.ws",
+    RS3_SOURCE: "https://secure.runescape.com/m=hiscore/index_lite.ws",
+}
+
+
+def setup_logging(
+    console: bool = True,
+    max_bytes: int = 10 * 1024 * 1024,
+    backup_count: int = 5,
+    when: Optional[str] = None,
+    compress: bool = False,
+) -> logging.Logger:
+    """Setup file logging for each run, written by a background thread.
+
+    The log file rotates at ``max_bytes`` (0: never) or, with ``when``, on a
+    schedule such as "midnight"; ``compress`` gzips rotated files.
+    """
+    # Create logs directory if it doesn't exist
+    if not os.path.exists('logs'):
+        os.makedirs('logs')
+
+    # Create log file with timestamp
+    log_filename = f"logs/rsn_checker_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+
+    handlers = [rotating_file_handler(log_filename, max_bytes, backup_count, when, compress)]
+    if console:
+        handlers.append(logging.StreamHandler())  # Also print to console
+
+    # Workers only enqueue records; one listener thread formats and writes them
+    start_queue_logging(handlers)
+
+    logger = logging.getLogger("rsn_checker")
+    logger.info("RSNChecker v1.8 started")
+    logger.info(f"Log file: {log_filename}")
+    return logger
+
+
+def source_list(source: str) -> List[str]:
+    """Return the hiscores a source selection covers."""
+    if source == BOTH_SOURCES:
+        return [OSRS_SOURCE, RS3_SOURCE]
+    return [source]
+
+
+def merge_source_results(name: str, source: str, parts: Dict[str, dict]) -> dict:
+    """Combine the per-source results of one name into a single result row.
+
+    A name is available only if no source found it and taken as soon as any
+    source did; otherwise an error on any source leaves it unknown, and the
+    merged outcome is ``cancelled`` if any lookup was cancelled (the first
+    error outcome otherwise). The per-source outcomes are kept under
+    ``'sources'``.
+    """
+    outcomes = [part['available'] for part in parts.values()]
+    errors = [f"{part_source}: {part['error']}" for part_source, part in parts.items() if part['status'] == 'error']
+    if False in outcomes:
+        available, status, outcome = False, 'checked', Outcome.FOUND.value
+    elif all(available is True for available in outcomes):
+        available, status, outcome = True, 'checked', Outcome.NOT_FOUND.value
+    else:
+        available, status = None, 'error'
+        failed = [part.get('outcome') for part in parts.values() if part['status'] == 'error']
+        outcome = Outcome.CANCELLED.value if Outcome.CANCELLED.value in failed else next(filter(None, failed), None)
+    return {
+        'name': name,
+        'source': source,
+        'available': available,
+        'error': "; ".join(errors) or None,
+        'status': status,
+        'outcome': outcome,
+        'sources': {
+            part_source: {'available': part['available'], 'status': part['status'], 'outcome': part.get('outcome'), 'error': part['error']}
+            for part_source, part in parts.items()
+        },
+    }
+
+
+def _describe(info: dict) -> str:
+    if info.get('status') == 'checked':
+        return 'Available' if info.get('available') else 'Taken'
+    return 'recent error'
+
+
+def _noop(*args):
+    pass
+
+
+class NameChecker:
+    """Headless checking engine shared by the GUI and the command line.
+
+    Results are reported through plain callbacks so no display server is
+    needed; the GUI wires them to ``root.after`` while the CLI prints them.
+    """
+
+    def __init__(
+        self,
+        progress_file: str = "progress.db",
+        legacy_progress_file: str = "progress.json",
+        max_workers: int = 5,
+        rate_limit: float = 10.0,
+        burst: int = 10,
+        max_retries: int = 3,
+        breaker_threshold: float = 0.5,
+        breaker_window: int = 50,
+        breaker_cooldown: float = 30.0,
+        window: Optional[int] = None,
+        keep_results: bool = True,
+        taken_index_file: Optional[str] = None,
+        ttls: Optional[Dict[str, float]] = None,
+        cache_size: int = 100_000,
+        source_workers: Optional[Dict[str, int]] = None,
+        client: str = "direct",
+        base_urls: Optional[Dict[str, str]] = None,
+        timeout: float = 10.0,
+        metrics_file: Optional[str] = None,
+        metrics_interval: float = 5.0,
+        log_mode: str = "full",
+        log_summary_interval: float = 30.0,
+        priority: Optional[Callable[[str], object]] = None,
+        lookahead: int = 10_000,
+        on_log: Callable[[str], None] = _noop,
+        on_result: Callable[[dict], None] = _noop,
+        on_progress: Callable[[str], None] = _noop,
+        on_filtered: Callable[[str, bool], None] = _noop,
+    ):
+        self.logger = logging.getLogger("rsn_checker")
+
+        # Callbacks for log lines, finished names and progress text
+        self.on_log = on_log
+        self.on_result = on_result
+        self.on_progress = on_progress
+        # Called for every input name: True once it is handed to the workers, False if skipped
+        self.on_filtered = on_filtered
+
+        # Initialize stop flag for thread control
+        self.stop_event = threading.Event()
+
+        # Thread lock for shared data structures
+        self.data_lock = threading.Lock()
+
+        # Thread lock for executor access
+        self.executor_lock = threading.Lock()
+
+        # Track active executor for proper shutdown
+        self.active_executor = None
+
+        # Initialize progress tracking
+        self.progress_file = progress_file
+        self.results_data = []  # Store results for export
+        self.keep_results = keep_results  # Streaming callers can skip results_data
+        self.run_stats = {'completed': 0, 'checked': 0, 'available': 0, 'errors': 0, 'retries': 0, 'shared': 0}
+        self.in_flight = {}  # {canonical name: equivalent spellings waiting on its result}
+        self.lookup_sources = {}  # {canonical name in flight: sources it needs a request on}
+        self.max_workers = max_workers  # Number of concurrent threads
+        self.source_workers = dict(source_workers or {})  # Per-source override of max_workers when checking both
+        self.window = window  # Names in flight at once (default: 4 per worker)
+
+        # Shared request budget for all workers (requests/second and burst size)
+        self.rate_limiter = TokenBucket(rate_limit, burst)
+
+        # Transient failures are retried within the run; a spike of failures pauses it
+        self.max_retries = max_retries
+        self.breaker = CircuitBreaker(breaker_window, breaker_threshold, breaker_cooldown)
+
+        # Detailed name status tracking: {name: {"status": "pending/checked/error", "available": True/False/None, "error": str, "timestamp": str}}
+        self.legacy_progress_file = legacy_progress_file  # Imported once into the store
+        self.store = ProgressStore(progress_file)
+
+        # Expiring, size-bounded view of the store used for skip decisions
+        self.cache = ResultCache(self.store, ttls, cache_size)
+
+        # "direct" asks index_lite for the status code only; "library" uses the API wrappers
+        self.client = client
+        self.timeout = timeout
+        # Endpoint per source; override to point at a local stub server
+        self.base_urls = dict(HISCORE_URLS, **(base_urls or {}))
+        self.hiscores = HiscoresClient(self.base_urls, timeout)
+
+        # Latency histograms, outcome counters and gauges; metrics_file is rewritten during runs
+        self.metrics = Metrics()
+        self.metrics.add_gauge("rsn_names_in_flight", "Names handed to the workers and not finished yet.", lambda: len(self.in_flight))
+        self.metrics.add_gauge("rsn_names_completed", "Names finished in the current run.", lambda: self.run_stats['completed'])
+        self.metrics.add_gauge("rsn_rate_limit", "Current rate limit in requests per second.", lambda: self.rate_limiter.rate)
+        self.metrics.add_gauge("rsn_circuit_breaker_open", "1 while the circuit breaker pauses the run.", lambda: int(self.breaker.opened_until is not None))
+        self.metrics_file = metrics_file
+        self.metrics_interval = metrics_interval
+        self.metrics_writer: Optional[MetricsFileWriter] = None
+
+        # "sampled" logs only available names and errors, plus periodic summaries
+        if log_mode not in LOG_MODES:
+            raise ValueError(f"unknown log mode {log_mode!r} (use {' or '.join(LOG_MODES)})")
+        self.log_mode = log_mode
+        self.log_summary = OutcomeSummary(log_summary_interval) if log_mode == "sampled" else None
+
+        # Optional scorer ordering the next `lookahead` input names best-first (see engine.priority)
+        self.priority = priority
+        self.lookahead = lookahead
+
+        # Optional Bloom filter of names known to be taken, skipped without a request
+        self.taken_index_file = taken_index_file
+        self.taken_index: Optional[BloomFilter] = None
+
+    def check_name_availability(self, name: str, source: str) -> Tuple[Outcome, Optional[str]]:
+        """Look a name up once and return its outcome and an error detail, if any."""
+        if self.client == "library":
+            return self.check_name_availability_library(name, source)
+        try:
+            status = self.hiscores.status(name, source)
+        except Exception as e:
+            return classify_exception(e), str(e)[:50] or type(e).__name__
+        outcome = classify_status(status)
+        return outcome, None if outcome in DEFINITIVE else f"HTTP {status}"
+
+    def check_name_availability_library(self, name: str, source: str) -> Tuple[Outcome, Optional[str]]:
+        """Check a name with the rs3_api / osrs_api wrappers (downloads and parses all skills)."""
+        try:
+            # Imported on first use: the default client never loads the wrappers
+            if source == RS3_SOURCE:
+                from rs3_api.hiscores import Hiscore
+                Hiscore().user(name)
+            else:
+                from osrs_api import Hiscores
+                Hiscores(username=name)
+            return Outcome.FOUND, None
+        except ImportError as e:
+            return Outcome.PARSE_ERROR, f"{e.name or 'API library'} is not installed"
+        except Exception as e:
+            # The wrappers only report failures as exception text
+            if type(e).__name__ == "UserNotFoundException":
+                return Outcome.NOT_FOUND, None
+            outcome = classify_message(str(e)) or classify_exception(e)
+            return outcome, None if outcome in DEFINITIVE else (str(e)[:50] or type(e).__name__)
+
+    def load_progress(self):
+        """Open the progress store, importing a legacy progress.json once."""
+        try:
+            if self.taken_index_file:
+                if os.path.exists(self.taken_index_file):
+                    self.taken_index = BloomFilter.load(self.taken_index_file)
+                    self.on_log(f"{functions.time.get_time()}: Loaded taken-name index - {len(self.taken_index)} names")
+                else:
+                    self.taken_index = BloomFilter()
+
+            imported = migrate_legacy_progress(self.store, self.legacy_progress_file)
+            if imported:
+                self.on_log(f"{functions.time.get_time()}: Imported {imported} names from {self.legacy_progress_file}")
+                self.logger.info(f"Imported {imported} names from {self.legacy_progress_file} into {self.progress_file}")
+
+            counts = self.store.counts()
+            if counts:
+                checked_count = counts.get('checked', 0)
+                error_count = counts.get('error', 0)
+                self.on_log(f"{functions.time.get_time()}: Loaded progress - {checked_count} checked, {error_count} errors")
+                self.logger.info(f"Loaded progress: {checked_count} checked, {error_count} errors")
+        except Exception as e:
+            self.logger.error(f"Error loading progress: {e}")
+
+    def save_progress(self):
+        """Commit the results written since the last save (thread-safe)."""
+        try:
+            self.store.flush()
+            self.logger.debug("Progress saved")
+        except Exception as e:
+            self.logger.error(f"Error saving progress: {e}")
+
+    def save_taken_index(self):
+        """Persist the taken-name index, including names found taken in this run."""
+        if self.taken_index is None or not self.taken_index_file:
+            return
+        try:
+            self.taken_index.save(self.taken_index_file)
+        except Exception as e:
+            self.logger.error(f"Error saving taken-name index: {e}")
+
+    def clear_progress(self):
+        """Clear the progress store."""
+        self.store.clear()
+        self.cache.clear()
+        self.logger.info("Progress cleared by user")
+
+    def update_status(self, result_dict: dict):
+        """Record the detailed status of a finished check (thread-safe)."""
+        self.cache.put(canonical_name(result_dict['name']), {
+            'status': result_dict['status'],
+            'available': result_dict['available'],
+            'source': result_dict['source'],
+            'timestamp': datetime.now().isoformat(),
+            'error': result_dict.get('error')
+        })
+
+    def build_result(self, name: str, source: str, outcome: Outcome, detail: Optional[str], attempts: int = 1) -> dict:
+        """Turn a lookup outcome into a result dict."""
+        return {
+            'name': name,
+            'source': source,
+            'available': {Outcome.NOT_FOUND: True, Outcome.FOUND: False}.get(outcome),
+            'error': detail,
+            'status': 'checked' if outcome in DEFINITIVE else 'error',
+            'outcome': outcome.value,
+            'attempts': attempts
+        }
+
+    def report_outcome(self, name: str, source: str, outcome: Outcome):
+        """Feed an outcome back into the rate limiter and the circuit breaker."""
+        if outcome in THROTTLING:
+            self.rate_limiter.throttled()
+        elif outcome in DEFINITIVE:
+            self.rate_limiter.succeeded()
+        if self.breaker.record(outcome not in DEFINITIVE):
+            self.metrics.count_breaker_trip()
+            self.on_log(
+                f"{functions.time.get_time()}: [paused] Too many failed lookups (last: {name} on {source}: {outcome.value})"
+                f" - pausing for {self.breaker.cooldown:g}s"
+            )
+            self.logger.warning(f"Circuit breaker opened after {outcome.value} on {name} ({source}); pausing {self.breaker.cooldown:g}s")
+
+    def should_retry(self, name: str, source: str, outcome: Outcome, attempt: int) -> Optional[float]:
+        """Return the backoff before retrying a failed lookup, or None if it is final."""
+        if outcome not in TRANSIENT or attempt > self.max_retries or self.stop_event.is_set():
+            return None
+        delay = retry_delay(attempt)
+        self.metrics.count_retry(source, outcome.value)
+        with self.data_lock:
+            self.run_stats['retries'] += 1
+        if self.log_summary is None:
+            self.logger.info(f"Retrying {name} ({source}) after {outcome.value}, attempt {attempt + 1} in {delay:.1f}s")
+        return delay
+
+    def log_result(self, result_dict: dict):
+        """Write the outcome of a finished lookup to the log file."""
+        name, source = result_dict['name'], result_dict['source']
+        if self.log_summary is not None:
+            # Sampled: taken names only show up in the periodic summary
+            summary = self.log_summary.add(result_dict['outcome'])
+            if summary:
+                self.logger.info(summary)
+            if result_dict['available'] is False:
+                return
+        if result_dict['status'] == 'checked':
+            self.logger.info(f"Checked {name} ({source}): {'Available' if result_dict['available'] else 'Taken'}")
+        else:
+            self.logger.error(f"Error checking {name} ({source}): {result_dict['outcome']} {result_dict['error']}")
+
+    def count_shared(self, source: str, count: int = 1):
+        """Count requests saved by attaching a spelling to a lookup already in flight."""
+        self.metrics.count_shared(source, count)
+        with self.data_lock:
+            self.run_stats['shared'] += count
+
+    def check_single_name(self, name: str, source: str) -> dict:
+        """Check a single name with rate limiting, in-run retries and detailed status tracking."""
+        attempt = 0
+        while True:
+            attempt += 1
+
+            # Wait for the circuit breaker and a token from the shared bucket,
+            # unless stop was requested meanwhile
+            if self.stop_event.is_set() or not self.breaker.acquire(self.stop_event):
+                return self.build_result(name, source, Outcome.CANCELLED, 'Cancelled by user', attempt)
+            waited_from = time.perf_counter()
+            acquired = self.rate_limiter.acquire(self.stop_event)
+            self.metrics.observe_limiter_wait(time.perf_counter() - waited_from)
+            if not acquired:
+                return self.build_result(name, source, Outcome.CANCELLED, 'Cancelled by user', attempt)
+
+            self.metrics.request_started()
+            started = time.perf_counter()
+            try:
+                outcome, detail = self.check_name_availability(name, source)
+            except Exception as e:
+                outcome, detail = classify_exception(e), str(e)[:50]
+            self.metrics.request_finished(source, outcome.value, time.perf_counter() - started)
+            self.report_outcome(name, source, outcome)
+
+            # Transient failures are retried after an exponential, jittered backoff; the
+            # worker thread keeps its pool slot while it sleeps
+            delay = self.should_retry(name, source, outcome, attempt)
+            if delay is None:
+                break
+            if self.stop_event.wait(delay):
+                break
+
+        result_dict = self.build_result(name, source, outcome, detail, attempt)
+
+        # Update name status (errors can be retried in a later run)
+        self.update_status(result_dict)
+        self.log_result(result_dict)
+        return result_dict
+
+    def fresh_result(self, name: str, source: str) -> Optional[dict]:
+        """Return the stored result of a name on a source as a result dict if it is still fresh."""
+        status_info, fresh = self.cache.lookup(canonical_name(name), source)
+        if not fresh:
+            return None
+        return self.stored_result(name, source, status_info)
+
+    @staticmethod
+    def stored_result(name: str, source: str, status_info: dict) -> dict:
+        """Build a result dict for a name from its stored status on a source."""
+        return {
+            'name': name,
+            'source': source,
+            'available': status_info['available'],
+            'error': status_info.get('error'),
+            'status': status_info['status'],
+            'outcome': None if status_info['status'] != 'checked' else (
+                Outcome.NOT_FOUND if status_info['available'] else Outcome.FOUND
+            ).value
+        }
+
+    def check_source(self, name: str, source: str) -> dict:
+        """Check one source of a multi-source search, reusing a result that is still fresh."""
+        return self.fresh_result(name, source) or self.check_single_name(name, source)
+
+    def filter_names(self, names: Iterable[str], source: str) -> Iterator[str]:
+        """Yield names that still need checking, logging skips and validation failures.
+
+        Equivalent spellings of a name that is already being checked are not
+        yielded again; they are attached to the running check and get their own
+        result row when it finishes. A name whose stored result is still fresh
+        is reported from the store without a lookup; with several sources only
+        when its result is fresh on all of them.
+        """
+        sources = source_list(source)
+        if self.priority is not None:
+            names = prioritized(names, self.priority, self.lookahead)
+        for name in names:
+            stripped_name = name.strip()
+
+            # Skip empty names
+            if not stripped_name:
+                continue
+
+            problem = validate_name(stripped_name)
+            if problem:
+                self.on_log(f"[validation] {stripped_name} {problem}")
+                self.on_filtered(stripped_name, False)
+                continue
+
+            canonical = canonical_name(stripped_name)
+            if self.taken_index is not None and all((canonical, item) in self.taken_index for item in sources):
+                self.on_log(f"[skipped] {stripped_name} - in taken-name index")
+                self.on_filtered(stripped_name, False)
+                continue
+
+            with self.data_lock:
+                aliases = self.in_flight.get(canonical)
+                if aliases is not None:
+                    # Same equivalence class is already queued: share its request
+                    aliases.append(stripped_name)
+                    saved = self.lookup_sources.get(canonical, [])
+            if aliases is not None:
+                self.on_filtered(stripped_name, True)
+                # Only sources that needed a request saved one; fresh ones cost nothing
+                for item in saved:
+                    self.count_shared(item)
+                continue
+
+            # Thread-safe check for name status on every source
+            lookups = {item: self.cache.lookup(canonical, item) for item in sources}
+
+            # Skip if the previous results are still within their TTL
+            if all(fresh for _, fresh in lookups.values()):
+                if len(sources) == 1:
+                    status_info = lookups[source][0]
+                    if status_info.get('status') == 'checked':
+                        self.on_log(f"[skipped] {stripped_name} - already checked ({_describe(status_info)})")
+                    else:
+                        self.on_log(f"[skipped] {stripped_name} - recent error")
+                else:
+                    described = ", ".join(f"{item}: {_describe(info)}" for item, (info, _) in lookups.items())
+                    self.on_log(f"[skipped] {stripped_name} - already checked ({described})")
+                self.on_filtered(stripped_name, False)
+                self.report_stored(stripped_name, canonical, source, lookups)
+                continue
+
+            for item, (status_info, fresh) in lookups.items():
+                status = (status_info or {}).get('status', 'pending')
+                on_source = f" on {item}" if len(sources) > 1 else ""
+                if fresh:
+                    continue
+
+                # Re-verify expired results
+                if status == 'checked':
+                    self.on_log(f"[recheck] {stripped_name} - result{on_source} from {status_info.get('timestamp', 'unknown')[:10]} expired")
+
+                # Allow retries for errors
+                if status == 'error':
+                    self.on_log(f"[retry] {stripped_name} - retrying{on_source} after previous error")
+
+            with self.data_lock:
+                self.in_flight[canonical] = []
+                self.lookup_sources[canonical] = [item for item, (_, fresh) in lookups.items() if not fresh]
+            self.on_filtered(stripped_name, True)
+            yield stripped_name
+
+    def report_stored(self, name: str, canonical: str, source: str, lookups: Dict[str, Tuple[dict, bool]]):
+        """Report the stored results of a skipped name, so every input spelling gets a row."""
+        parts = {item: self.stored_result(name, item, info) for item, (info, _) in lookups.items()}
+        result_dict = parts[source] if len(parts) == 1 else merge_source_results(name, source, parts)
+        result_dict['canonical'] = canonical
+        if self.keep_results:
+            with self.data_lock:
+                self.results_data.append(result_dict)
+        self.on_result(result_dict)
+
+    def start_search(self):
+        """Reset the stop flag, results and run counters before a new search."""
+        self.stop_event.clear()
+        if self.log_summary is not None:
+            self.log_summary = OutcomeSummary(self.log_summary.interval)
+        # Clear previous results (thread-safe)
+        with self.data_lock:
+            self.results_data = []
+            self.in_flight = {}
+            self.lookup_sources = {}
+            self.run_stats = {'completed': 0, 'checked': 0, 'available': 0, 'errors': 0, 'retries': 0, 'shared': 0}
+
+        # Keep the metrics file current while the run is active
+        if self.metrics_file:
+            self.metrics_writer = MetricsFileWriter(self.metrics, self.metrics_file, self.metrics_interval)
+            self.metrics_writer.start()
+
+    def end_search(self):
+        """Release per-run resources, whether the run finished, stopped or failed."""
+        if self.log_summary is not None:
+            summary = self.log_summary.flush()
+            if summary:
+                self.logger.info(summary)
+        if self.metrics_writer is not None:
+            try:
+                self.metrics_writer.stop()
+            except Exception as e:
+                self.logger.error(f"Error writing metrics file: {e}")
+            self.metrics_writer = None
+
+    def record_result(self, result_dict: dict, total_names: Optional[int] = None):
+        """Store a finished result, report it and save progress periodically.
+
+        The result is reported once for the checked spelling and once more for
+        every equivalent spelling that arrived while it was in flight.
+        """
+        name = result_dict['name']
+        source = result_dict['source']
+        canonical = result_dict.setdefault('canonical', canonical_name(name))
+
+        if result_dict.get('outcome') == Outcome.CANCELLED.value:
+            # Stopped before the lookup ran: neither a result nor an error
+            with self.data_lock:
+                self.in_flight.pop(canonical, None)
+                self.lookup_sources.pop(canonical, None)
+            return
+
+        # Thread-safe: Update run counters and results data
+        with self.data_lock:
+            aliases = self.in_flight.pop(canonical, [])
+            self.lookup_sources.pop(canonical, None)
+            rows = [result_dict] + [dict(result_dict, name=alias) for alias in aliases]
+            if result_dict['status'] == 'checked':
+                self.run_stats['checked'] += 1
+                if result_dict['available'] is True:
+                    self.run_stats['available'] += 1
+                elif self.taken_index is not None:
+                    for part_source, part in result_dict.get('sources', {source: result_dict}).items():
+                        if part['available'] is False:
+                            self.taken_index.add(canonical, part_source)
+            elif result_dict['status'] == 'error':
+                self.run_stats['errors'] += 1
+            self.run_stats['completed'] += 1
+            completed = self.run_stats['completed']
+            if self.keep_results:
+                self.results_data.extend(rows)
+
+        for row in rows:
+            self.on_result(row)
+
+        # Log based on result
+        spelled = ", ".join([name] + aliases)
+        if result_dict['status'] == 'checked':
+            if result_dict['available'] is True:
+                self.on_log(f"[result] {spelled} not found on {source} -> potentially available")
+            elif result_dict['available'] is False:
+                if 'sources' in result_dict:
+                    # Name the hiscores that actually found the player
+                    source = " + ".join(item for item, part in result_dict['sources'].items() if part['available'] is False)
+                self.on_log(f"[result] {spelled} found on {source} -> taken")
+        elif result_dict['status'] == 'error':
+            outcome = f"{result_dict['outcome']} " if result_dict.get('outcome') else ""
+            self.on_log(f"[error] {spelled}: {outcome}{result_dict['error']}")
+
+        if total_names:
+            self.on_progress(f"Checked {completed}/{total_names} names")
+        else:
+            self.on_progress(f"Checked {completed} names")
+
+        # Save progress every 10 names for better performance
+        if completed % 10 == 0:
+            self.save_progress()
+
+    def finish_search(self):
+        """Save final progress and report the run summary."""
+        with self.data_lock:
+            stats = dict(self.run_stats)
+
+        if stats['completed'] == 0 and not self.stop_event.is_set():
+            self.on_log("[info] No valid names to check")
+            self.on_progress("No valid names")
+            return
+
+        # Save final progress
+        self.save_progress()
+        self.save_taken_index()
+
+        # Search completed
+        if not self.stop_event.is_set():
+            summary = f"Complete: {stats['checked']} checked, {stats['available']} available, {stats['errors']} errors"
+            if stats['retries']:
+                summary += f", {stats['retries']} retries"
+            if stats['shared']:
+                summary += f", {stats['shared']} duplicate lookups shared"
+            self.on_progress(summary)
+            self.on_log(f"{functions.time.get_time()}: Search completed - {summary}")
+            self.logger.info(f"Search completed: {summary}")
+
+    def worker_pools(self, source: str) -> Dict[str, int]:
+        """Thread pool size per source for a search of ``source``."""
+        sources = source_list(source)
+        if len(sources) > 1:
+            return {item: self.source_workers.get(item, self.max_workers) for item in sources}
+        return {source: self.max_workers}
+
+    def names_in_flight(self, source: str) -> int:
+        """Most names handed to the workers and not finished at once in a search of ``source``."""
+        return self.window or max(self.worker_pools(source).values()) * 4
+
+    def names_unfinished(self, source: str) -> int:
+        """Most names read from the input but not finished at once, which a stopped run can leave unchecked."""
+        held = self.names_in_flight(source)
+        if self.priority is not None:
+            held += self.lookahead  # Names waiting in the priority queue were read but not checked
+        return held
+
+    def search_name(self, names: Iterable[str], source: str) -> bool:
+        """Check every name in ``names`` concurrently and report through the callbacks.
+
+        Names are pulled lazily, so ``names`` can be any iterator (a file, stdin
+        or a generator) and only a bounded window of them is held in memory.
+        With ``BOTH_SOURCES`` each source gets its own thread pool (sized by
+        ``source_workers``), both lookups of a name run at the same time and
+        one merged row is reported per name. Returns False if the run ended on
+        an unexpected error, True otherwise (also when it was stopped).
+        """
+        try:
+            self.start_search()
+
+            # Filter and validate names lazily as slots free up
+            valid_names = self.filter_names(names, source)
+
+            sources = source_list(source)
+            pools = self.worker_pools(source)
+            window = self.names_in_flight(source)
+            workers = ", ".join(f"{count} {item}" for item, count in pools.items()) if len(sources) > 1 else self.max_workers
+            self.on_log(f"[info] Starting check with {workers} workers ({window} names in flight)")
+
+            # Use ThreadPoolExecutor for concurrent checking
+            if len(sources) > 1:
+                executor = FanOutExecutor(
+                    {item: ThreadPoolExecutor(max_workers=count) for item, count in pools.items()},
+                    lambda name, parts: merge_source_results(name, source, parts),
+                )
+                check, args = self.check_source, ()
+            else:
+                executor = ThreadPoolExecutor(max_workers=self.max_workers)
+                check, args = self.check_single_name, (source,)
+
+            with executor:
+                # Track active executor for proper shutdown (thread-safe)
+                with self.executor_lock:
+                    self.active_executor = executor
+
+                # Process tasks as they complete, submitting new names as slots free up
+                stopping = False
+                try:
+                    for name, future in run_windowed(executor, check, valid_names, window, self.stop_event, *args):
+                        if self.stop_event.is_set() and not stopping:
+                            stopping = True
+                            self.on_log(f"{functions.time.get_time()}: Search stopped by user")
+                            self.logger.info(f"Search stopped by user after {self.run_stats['completed']} names")
+
+                            # Force executor shutdown; lookups already running are still recorded
+                            executor.shutdown(wait=False, cancel_futures=True)
+                        if future.cancelled():
+                            continue
+
+                        try:
+                            self.record_result(future.result())
+                        except Exception as e:
+                            self.on_log(f"[error] {name}: {str(e)}")
+                            self.logger.error(f"Exception processing result for {name}: {e}")
+                except KeyboardInterrupt:
+                    # Cancel the queued lookups before leaving the executor waits for the running ones
+                    self.stop()
+                    raise
+
+            self.finish_search()
+            return True
+
+        except Exception as e:
+            # Handle any unexpected errors
+            self.on_log(f"[FATAL ERROR] {str(e)}")
+            self.on_progress("Error occurred")
+            self.logger.error(f"Fatal error in search_name: {e}")
+            return False
+        finally:
+            # Clear active executor reference (thread-safe)
+            with self.executor_lock:
+                self.active_executor = None
+            # Commit whatever was stored, even when the run was interrupted
+            self.save_progress()
+            # Worker threads are gone, so are their kept-alive connections
+            self.hiscores.close()
+            self.end_search()
+
+    def stop(self):
+        """Stop the current search operation."""
+        self.stop_event.set()
+
+        # Force shutdown of active executor if it exists (thread-safe)
+        with self.executor_lock:
+            if self.active_executor:
+                try:
+                    self.active_executor.shutdown(wait=False, cancel_futures=True)
+                    self.logger.info("Active executor shutdown initiated")
+                except Exception as e:
+                    self.logger.error(f"Error shutting down executor: {e}")
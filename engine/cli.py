@@ -0,0 +1,555 @@
+import argparse
+import json
+import os
+import socket
+import sys
+import time
+from typing import Callable, Dict, Iterable, Iterator, Optional, TextIO
+from engine.cache import DEFAULT_TTLS, parse_duration
+from engine.checker import NameChecker, SOURCES, setup_logging, source_list
+from engine.export import ResultExporter, export_columns, open_exporter
+from engine.ingest import iter_file_names
+from engine.logs import LOG_MODES
+from engine.priority import build_scorer
+
+
+def iter_names(stream: TextIO) -> Iterator[str]:
+    """Yield names from a stream, one per line (commas are also accepted)."""
+    for line in stream:
+        for name in line.split(","):
+            if name.strip():
+                yield name
+
+
+def emit_result(result_dict: dict):
+    """Write one JSONL result to stdout as soon as a name finishes."""
+    sys.stdout.write(json.dumps(result_dict, ensure_ascii=False) + "\n")
+    sys.stdout.flush()
+
+
+def parse_source_map(spec: str, convert: Callable[[str], object], example: str) -> Dict[str, object]:
+    """Parse per-source values such as "osrs=5,rs3=3" into {source label: value}."""
+    values = {}
+    for part in filter(None, (part.strip() for part in spec.split(","))):
+        key, _, value = part.partition("=")
+        try:
+            if key.strip() not in ("osrs", "rs3") or not value.strip():
+                raise ValueError
+            values[SOURCES[key.strip()]] = convert(value.strip())
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid value: {part!r} (expected e.g. {example})")
+    return values
+
+
+def parse_source_workers(spec: str) -> Dict[str, int]:
+    """Parse per-source worker counts such as "osrs=5,rs3=3"."""
+    return parse_source_map(spec, int, "osrs=5,rs3=3")
+
+
+def parse_hiscores_urls(spec: str) -> Dict[str, str]:
+    """Parse per-source endpoints such as "osrs=http://127.0.0.1:8000/o"."""
+    return parse_source_map(spec, str, "osrs=http://127.0.0.1:8000/o")
+
+
+def parse_priority(spec: str) -> Callable[[str], object]:
+    """Build the --priority scorer, e.g. from "words:common.txt,length"."""
+    try:
+        return build_scorer(spec)
+    except (ValueError, OSError) as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def build_checker(args) -> NameChecker:
+    """Create the checker selected by the common command line options."""
+    setup_logging(
+        console=args.verbose,
+        max_bytes=int(args.log_max_mb * 1024 * 1024),
+        backup_count=args.log_backups,
+        when="midnight" if args.log_rotate_daily else None,
+        compress=args.log_compress,
+    )
+    options = dict(
+        progress_file=args.progress_file,
+        max_workers=args.workers,
+        rate_limit=args.rate,
+        burst=args.burst,
+        max_retries=args.retries,
+        breaker_threshold=args.breaker_threshold,
+        breaker_cooldown=parse_duration(args.breaker_cooldown),
+        keep_results=False,  # Results are streamed to stdout instead
+        taken_index_file=args.taken_index,
+        ttls={outcome: parse_duration(getattr(args, f"ttl_{outcome}")) for outcome in DEFAULT_TTLS},
+        source_workers=args.source_workers,
+        client=args.client,
+        base_urls=args.hiscores_url,
+        metrics_file=args.metrics_file,
+        metrics_interval=parse_duration(args.metrics_interval),
+        log_mode=args.log_mode,
+        log_summary_interval=parse_duration(args.log_summary_interval),
+        priority=args.priority,
+        lookahead=args.lookahead,
+        on_log=(lambda message: print(message, file=sys.stderr)) if args.verbose else lambda message: None,
+        on_result=emit_result,
+    )
+    if args.engine == "async":
+        # Imported here so the thread engine does not need aiohttp
+        from engine.async_checker import AsyncNameChecker
+        checker = AsyncNameChecker(concurrency=args.concurrency, **options)
+    else:
+        checker = NameChecker(**options)
+    if args.metrics_port is not None:
+        from engine.metrics import serve_metrics
+        server = serve_metrics(checker.metrics, args.metrics_port)
+        print(f"Metrics on http://127.0.0.1:{server.server_address[1]}/metrics", file=sys.stderr)
+    checker.load_progress()
+    return checker
+
+
+def attach_exporter(checker: NameChecker, args) -> Optional[ResultExporter]:
+    """Also append every result to the --export file as it arrives."""
+    if not args.export:
+        return None
+    exporter = open_exporter(args.export, export_columns(source_list(SOURCES[args.source])))
+    emit = checker.on_result
+
+    def on_result(result_dict: dict):
+        emit(result_dict)
+        exporter.write(result_dict)
+
+    checker.on_result = on_result
+    return exporter
+
+
+def run_names(checker: NameChecker, names: Iterable[str], args) -> int:
+    """Check a stream of names, stopping cleanly on Ctrl+C."""
+    exporter = attach_exporter(checker, args)
+    try:
+        checker.search_name(names, SOURCES[args.source])
+    except KeyboardInterrupt:
+        checker.stop()
+    finally:
+        if exporter:
+            exporter.close()
+    return 0
+
+
+def run_check(args):
+    """Check names from a file or stdin and stream the results."""
+    checker = build_checker(args)
+    names = iter_names(sys.stdin) if args.input == "-" else iter_file_names(args.input)
+    return run_names(checker, names, args)
+
+
+def run_leased_sweep(args, space) -> int:
+    """Claim shards of a shared sweep job until every shard is done."""
+    from generate.sweep import Sweep
+    from engine.leases import LeaseKeeper, LeaseStore
+
+    if args.count:
+        # Read-only: a job no worker has joined yet still has every name left
+        remaining = len(space)
+        if os.path.exists(args.coordinator):
+            leases = LeaseStore(args.coordinator)
+            counts = leases.status(args.job)
+            leases.close()
+            if counts['pending'] + counts['leased'] + counts['done']:
+                remaining = counts['remaining']
+        print(remaining)
+        return 0
+
+    leases = LeaseStore(args.coordinator)
+    shards = leases.create_job(args.job, space.to_dict(), len(space), args.shard_size)
+
+    checker = build_checker(args)
+    owner = args.worker_id or f"{socket.gethostname()}:{os.getpid()}"
+    ttl = parse_duration(args.lease_ttl)
+    checker.on_log(f"[info] {owner} joined job {args.job} ({shards} shards of {args.shard_size} names)")
+    exporter = attach_exporter(checker, args)
+    # Names the previous owner of a shard may have handed out without finishing
+    rewind = checker.names_unfinished(SOURCES[args.source])
+
+    status = 0
+    while True:
+        lease = leases.claim(args.job, owner, ttl, rewind=rewind)
+        if lease is None:
+            # Shards leased by other workers may still expire and need a new owner
+            if leases.status(args.job)['leased'] == 0:
+                break
+            try:
+                time.sleep(min(ttl / 2, 5.0))
+            except KeyboardInterrupt:
+                break
+            continue
+
+        sweep = Sweep(space, lease.position, lease.stop)
+        keeper = LeaseKeeper(leases, args.job, lease, owner, ttl, lambda: sweep.position, on_lost=checker.stop)
+        checker.on_log(f"[info] Shard {lease.shard}: names {lease.position}-{lease.stop - 1}")
+        keeper.start()
+        interrupted = succeeded = False
+        try:
+            succeeded = checker.search_name(sweep, SOURCES[args.source])
+        except KeyboardInterrupt:
+            checker.stop()
+            interrupted = True
+        finally:
+            keeper.stop()
+
+        if keeper.lost:
+            checker.on_log(f"[info] Lost the lease on shard {lease.shard} to another worker")
+            checker.stop_event.clear()
+        elif interrupted or not succeeded or checker.stop_event.is_set():
+            # A failed shard goes back to the pool instead of being marked done
+            leases.release(args.job, lease.shard, owner, sweep.position)
+            if not (interrupted or succeeded):
+                status = 1
+            break
+        else:
+            leases.complete(args.job, lease.shard, owner)
+
+    leases.close()
+    if exporter:
+        exporter.close()
+    return status
+
+
+def run_sweep(args):
+    """Check every name of a character set and length range exactly once."""
+    from generate.sweep import NameSpace, Sweep, parse_charset
+
+    if args.coordinator:
+        space = NameSpace(parse_charset(args.charset), args.min_length, args.max_length, args.separators)
+        return run_leased_sweep(args, space)
+
+    checker = None if args.count else build_checker(args)
+    if args.cursor and not args.restart and os.path.exists(args.cursor):
+        # Names handed out just before a restart may not have finished; the
+        # progress store skips the ones that did
+        rewind = checker.names_unfinished(SOURCES[args.source]) if checker else 0
+        sweep = Sweep.resume(args.cursor, rewind=rewind)
+    else:
+        space = NameSpace(parse_charset(args.charset), args.min_length, args.max_length, args.separators)
+        start, stop = 0, None
+        if args.shard:
+            shard, shards = (int(part) for part in args.shard.split("/"))
+            start, stop = space.shard_range(shard, shards)
+        sweep = Sweep(space, start, stop, cursor_file=args.cursor)
+
+    if args.count:
+        print(len(sweep))
+        return 0
+
+    checker.on_log(f"[info] Sweeping {len(sweep)} names from index {sweep.position}")
+    return run_names(checker, sweep, args)
+
+
+def parse_pattern_lists(specs) -> Dict[str, list]:
+    """Read the --list NAME=FILE word lists of a pattern."""
+    from generate.pattern import read_list
+
+    lists = {}
+    for spec in specs:
+        name, _, path = spec.partition("=")
+        if not name or not path:
+            raise SystemExit(f"invalid --list {spec!r} (expected e.g. word=words.txt)")
+        lists[name.strip().lower()] = read_list(path)
+    return lists
+
+
+def run_pattern(args) -> int:
+    """Check every name spelled by a pattern, generated lazily."""
+    from generate.pattern import Pattern, PatternError
+
+    try:
+        pattern = Pattern(args.pattern, parse_pattern_lists(args.list))
+    except PatternError as e:
+        print(f"invalid pattern: {e}", file=sys.stderr)
+        return 2
+    # Ambiguous patterns can spell a name twice; the duplicates are skipped
+    total = f"{len(pattern)}" if pattern.unique else f"at most {len(pattern)}"
+    if args.count:
+        print(len(pattern) if pattern.unique else total)
+        return 0
+
+    checker = build_checker(args)
+    checker.on_log(f"[info] Pattern {args.pattern} spells {total} names")
+    return run_names(checker, pattern, args)
+
+
+def run_watch(args) -> int:
+    """Re-check a watchlist on a schedule until interrupted, reporting names that free up."""
+    from engine.watch import EventSink, WatchMonitor
+
+    events = EventSink(args.events, args.webhook)
+    checker = build_checker(args)
+    monitor = WatchMonitor(
+        checker,
+        args.watchlist,
+        SOURCES[args.source],
+        parse_duration(args.interval),
+        events,
+        reload_interval=parse_duration(args.reload),
+    )
+    try:
+        monitor.run()
+    except (OSError, ValueError) as e:
+        print(f"could not read watchlist: {e}", file=sys.stderr)
+        return 1
+    finally:
+        events.close()
+    return 0
+
+
+def run_job(store, job: str, args) -> int:
+    """Run a job until its input is checked, it is paused or Ctrl+C is pressed."""
+    from engine.jobs import JobRun
+
+    checker = build_checker(args)
+    try:
+        runner = JobRun(store, job, on_pause=checker.stop)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+    runner.attach(checker)
+    runner.start()
+    try:
+        run_names(checker, runner.names(), args)
+    finally:
+        state = runner.finish()
+        store.close()
+    print(f"job {job}: {state}", file=sys.stderr)
+    return 0
+
+
+def run_job_start(args) -> int:
+    """Create a job from a file, a pattern or stdin and run it."""
+    from engine.jobs import JobStore
+
+    if args.file:
+        kind, spec, total, names = "file", {'path': os.path.abspath(args.file)}, None, ()
+    elif args.pattern:
+        from generate.pattern import Pattern, PatternError
+
+        lists = dict(item.partition("=")[::2] for item in args.list)
+        try:
+            pattern = Pattern(args.pattern, parse_pattern_lists(args.list))
+        except PatternError as e:
+            print(f"invalid pattern: {e}", file=sys.stderr)
+            return 2
+        spec = {'pattern': args.pattern, 'lists': {name.strip().lower(): os.path.abspath(path) for name, path in lists.items()}}
+        kind, total, names = "pattern", len(pattern), ()
+    else:
+        kind, spec, total, names = "list", {}, None, list(iter_names(sys.stdin))
+
+    store = JobStore(args.jobs_file)
+    try:
+        store.create(args.job, kind, spec, args.source, total, names)
+    except ValueError as e:
+        print(f"{e} (resume it with: job resume {args.job})", file=sys.stderr)
+        store.close()
+        return 1
+    return run_job(store, args.job, args)
+
+
+def run_job_resume(args) -> int:
+    """Carry on with a paused or interrupted job: its unfinished names first, then the rest of its input."""
+    from engine.jobs import JobStore
+
+    store = JobStore(args.jobs_file)
+    info = store.get(args.job)
+    if info is None:
+        print(f"no job named {args.job!r}", file=sys.stderr)
+        store.close()
+        return 1
+    args.source = info['source']  # A job keeps the hiscores it was started on
+    return run_job(store, args.job, args)
+
+
+def run_job_pause(args) -> int:
+    from engine.jobs import JobStore
+
+    store = JobStore(args.jobs_file)
+    paused = store.pause(args.job)
+    store.close()
+    if not paused:
+        print(f"no unfinished job named {args.job!r}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def run_job_remove(args) -> int:
+    from engine.jobs import JobStore
+
+    store = JobStore(args.jobs_file)
+    removed = store.remove(args.job)
+    store.close()
+    if not removed:
+        print(f"no job named {args.job!r}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def run_job_list(args) -> int:
+    """Print every job with its state and how many names it has left."""
+    from engine.jobs import JobStore
+
+    store = JobStore(args.jobs_file)
+    jobs = store.list()
+    store.close()
+    print(f"{'JOB':<16} {'KIND':<8} {'SOURCE':<6} {'STATE':<12} {'DONE':>10} {'LEFT':>10}  CREATED")
+    for info in jobs:
+        left = info['pending'] + info['in_flight']
+        if not info['input_read']:
+            left = f"{info['total'] - info['done']}" if info['total'] is not None else f"{left}+"
+        print(f"{info['job']:<16} {info['kind']:<8} {info['source']:<6} {info['state']:<12} {info['done']:>10} {left:>10}  {info['created']}")
+    return 0
+
+
+def run_index(args):
+    """Build or extend the taken-name index from past results and name lists."""
+    from engine.bloom import BloomFilter, add_taken_from_store
+    from engine.store import ProgressStore
+
+    if os.path.exists(args.index) and not args.rebuild:
+        bloom = BloomFilter.load(args.index)
+    else:
+        bloom = BloomFilter(args.capacity, args.error_rate)
+
+    added = 0
+    for progress_file in args.from_progress:
+        store = ProgressStore(progress_file)
+        added += add_taken_from_store(bloom, store)
+        store.close()
+    for list_file in args.from_list:
+        for item in source_list(SOURCES[args.source]):
+            added += bloom.update(iter_file_names(list_file), item)
+
+    bloom.save(args.index)
+    size_mb = len(bloom.bits) / (1 << 20)
+    print(f"{args.index}: added {added} names, {len(bloom)} total, {size_mb:.1f} MB", file=sys.stderr)
+    return 0
+
+
+def add_checker_arguments(parser: argparse.ArgumentParser):
+    """Options shared by every command that runs the checker."""
+    parser.add_argument("-s", "--source", choices=sorted(SOURCES), default="osrs", help="hiscores to check, or both in one pass (default: osrs)")
+    parser.add_argument("-w", "--workers", type=int, default=5, help="concurrent workers (default: 5)")
+    parser.add_argument("--source-workers", type=parse_source_workers, default={}, help="per-source workers (async: lookups in flight) with --source both, e.g. osrs=5,rs3=3")
+    parser.add_argument("-r", "--rate", type=float, default=10.0, help="maximum requests per second across all workers (default: 10)")
+    parser.add_argument("--burst", type=int, default=10, help="requests allowed in a burst above the rate (default: 10)")
+    parser.add_argument("--retries", type=int, default=3, help="retries of rate-limited, timed out or failed lookups within the run (default: 3)")
+    parser.add_argument("--breaker-threshold", type=float, default=0.5, help="pause the run when this share of the last 50 lookups failed (default: 0.5)")
+    parser.add_argument("--breaker-cooldown", default="30s", help="how long the first pause lasts; doubles while failures continue (default: 30s)")
+    parser.add_argument("--client", choices=["direct", "library"], default="direct", help="thread engine lookups: built-in index_lite client or the rs3_api/osrs_api wrappers (default: direct)")
+    parser.add_argument("--hiscores-url", type=parse_hiscores_urls, default={}, help="override index_lite endpoints, e.g. osrs=http://127.0.0.1:8000/o (for local testing)")
+    parser.add_argument("--engine", choices=["threads", "async"], default="threads", help="thread pool or asyncio engine (default: threads)")
+    parser.add_argument("-c", "--concurrency", type=int, default=100, help="lookups in flight with --engine async (default: 100)")
+    parser.add_argument("--progress-file", default="progress.db", help="progress database used to skip checked names (default: progress.db)")
+    parser.add_argument("--taken-index", help="Bloom filter of known-taken names to skip (created if missing)")
+    parser.add_argument("--ttl-available", default="1d", help="re-check available names after this long (default: 1d)")
+    parser.add_argument("--ttl-taken", default="90d", help="re-check taken names after this long (default: 90d)")
+    parser.add_argument("--ttl-error", default="0", help="skip names that errored within this long (default: 0, always retry)")
+    parser.add_argument("--priority", type=parse_priority, help="check names best-first: comma-separated length, words:FILE and weights:FILE, earlier ones first (e.g. words:common.txt,length)")
+    parser.add_argument("--lookahead", type=int, default=10_000, help="names read ahead and ordered by --priority (default: 10000)")
+    parser.add_argument("--export", help="also append results to this .csv, .parquet (needs pyarrow) or .xlsx file as they arrive")
+    parser.add_argument("--metrics-port", type=int, help="serve Prometheus metrics on this local port while running (0: any free port)")
+    parser.add_argument("--metrics-file", help="rewrite this file with Prometheus metrics while a run is active")
+    parser.add_argument("--metrics-interval", default="5s", help="how often --metrics-file is rewritten (default: 5s)")
+    parser.add_argument("--log-mode", choices=LOG_MODES, default="full", help="log every name, or only available names and errors plus periodic summaries (default: full)")
+    parser.add_argument("--log-summary-interval", default="30s", help="how often --log-mode sampled writes a summary (default: 30s)")
+    parser.add_argument("--log-max-mb", type=float, default=10.0, help="rotate the log file at this size, 0 to never rotate by size (default: 10)")
+    parser.add_argument("--log-rotate-daily", action="store_true", help="rotate the log file at midnight instead of by size")
+    parser.add_argument("--log-backups", type=int, default=5, help="rotated log files to keep (default: 5)")
+    parser.add_argument("--log-compress", action="store_true", help="gzip rotated log files")
+    parser.add_argument("-v", "--verbose", action="store_true", help="print log messages to stderr")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m engine",
+        description="Headless RuneScape name checker (no display server needed).",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    check = subparsers.add_parser("check", help="check names and print one JSON result per line")
+    check.add_argument("input", nargs="?", default="-", help="file with one name per line, or - for stdin (default)")
+    add_checker_arguments(check)
+    check.set_defaults(func=run_check)
+
+    sweep = subparsers.add_parser("sweep", help="check every name of a character set and length range")
+    sweep.add_argument("--charset", default="a-z0-9", help="characters to use, ranges allowed (default: a-z0-9)")
+    sweep.add_argument("--min-length", type=int, default=1, help="shortest name length (default: 1)")
+    sweep.add_argument("--max-length", type=int, default=3, help="longest name length (default: 3)")
+    sweep.add_argument("--separators", default="_", help="separators allowed between characters (default: _)")
+    sweep.add_argument("--shard", help="only sweep slice I of N equal index ranges, given as I/N")
+    sweep.add_argument("--cursor", help="cursor file used to save and resume the sweep position")
+    sweep.add_argument("--restart", action="store_true", help="ignore an existing cursor file and start over")
+    sweep.add_argument("--count", action="store_true", help="print the number of names left and exit")
+    sweep.add_argument("--coordinator", help="shared lease database; workers on any host claim shards of --job from it")
+    sweep.add_argument("--job", default="sweep", help="job name in the coordinator database (default: sweep)")
+    sweep.add_argument("--shard-size", type=int, default=10_000, help="names per shard when the job is created (default: 10000)")
+    sweep.add_argument("--lease-ttl", default="60s", help="a shard is handed to another worker when its lease is not renewed for this long (default: 60s)")
+    sweep.add_argument("--worker-id", help="name of this worker in the coordinator (default: host:pid)")
+    add_checker_arguments(sweep)
+    sweep.set_defaults(func=run_sweep)
+
+    pattern = subparsers.add_parser("pattern", help='check every name spelled by a pattern such as "[a-z]{2}[0-9]" or "{word}_{digit}"')
+    pattern.add_argument("pattern", help="[a-z] classes, {letter}/{digit}/{alnum}/{vowel}/{consonant}/{sep} or --list placeholders, x? optional, x{1,3} repeats, (a|b) branches")
+    pattern.add_argument("--list", action="append", default=[], help="word list for a {NAME} placeholder, as NAME=FILE (repeatable), e.g. word=words.txt")
+    pattern.add_argument("--count", action="store_true", help="print how many names the pattern spells and exit")
+    add_checker_arguments(pattern)
+    pattern.set_defaults(func=run_pattern)
+
+    watch = subparsers.add_parser("watch", help="keep re-checking a watchlist and report names that become available")
+    watch.add_argument("watchlist", help='file with one name per line, optionally with its own interval: "zezima,1h"')
+    watch.add_argument("--interval", default="1d", help="how often names without their own interval are checked (default: 1d)")
+    watch.add_argument("--events", help="append an event (JSON line) to this file when a name becomes available")
+    watch.add_argument("--webhook", help="POST each event as JSON to this URL")
+    watch.add_argument("--reload", default="30s", help="how often the watchlist file is checked for changes (default: 30s)")
+    add_checker_arguments(watch)
+    watch.set_defaults(func=run_watch)
+
+    job = subparsers.add_parser("job", help="named jobs that survive a crash or restart: start, resume, pause, list, remove")
+    job.add_argument("--jobs-file", default="jobs.db", help="database of jobs (default: jobs.db)")
+    job_commands = job.add_subparsers(dest="job_command", required=True)
+
+    job_start = job_commands.add_parser("start", help="create a job and run it")
+    job_start.add_argument("job", help="name of the new job")
+    job_input = job_start.add_mutually_exclusive_group()
+    job_input.add_argument("--file", help="names file (read from where the job stopped when resumed)")
+    job_input.add_argument("--pattern", help="name pattern, as in the pattern command")
+    job_start.add_argument("--list", action="append", default=[], help="word list for a --pattern placeholder, as NAME=FILE (repeatable)")
+    add_checker_arguments(job_start)
+    job_start.set_defaults(func=run_job_start)
+
+    job_resume = job_commands.add_parser("resume", help="carry on with a paused or interrupted job")
+    job_resume.add_argument("job", help="name of the job")
+    add_checker_arguments(job_resume)
+    job_resume.set_defaults(func=run_job_resume)
+
+    job_pause = job_commands.add_parser("pause", help="stop a running job after its current lookups")
+    job_pause.add_argument("job", help="name of the job")
+    job_pause.set_defaults(func=run_job_pause)
+
+    job_list = job_commands.add_parser("list", help="show every job and how far it got")
+    job_list.set_defaults(func=run_job_list)
+
+    job_remove = job_commands.add_parser("remove", help="delete a job (its results stay in the progress file)")
+    job_remove.add_argument("job", help="name of the job")
+    job_remove.set_defaults(func=run_job_remove)
+
+    index = subparsers.add_parser("index", help="build or extend the taken-name index")
+    index.add_argument("index", help="index file to create or extend")
+    index.add_argument("--from-progress", action="append", default=[], help="progress database whose taken names are added (repeatable)")
+    index.add_argument("--from-list", action="append", default=[], help="file of names known to be taken, one per line (repeatable)")
+    index.add_argument("-s", "--source", choices=sorted(SOURCES), default="osrs", help="hiscores the --from-list names are taken on (default: osrs)")
+    index.add_argument("--capacity", type=int, default=10_000_000, help="names the index is sized for (default: 10000000)")
+    index.add_argument("--error-rate", type=float, default=0.001, help="false positive rate at capacity (default: 0.001)")
+    index.add_argument("--rebuild", action="store_true", help="start a new index instead of extending the existing one")
+    index.set_defaults(func=run_index)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
@@ -0,0 +1,195 @@
+import csv
+import os
+import threading
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Optional
+
+# Columns of every export; per-source columns are added when both hiscores were checked
+BASE_COLUMNS = ['NAME', 'AVAILABLE', 'STATUS']
+TRAILING_COLUMNS = ['OUTCOME', 'ERROR']
+
+
+def availability_text(available: Optional[bool]) -> str:
+    return 'YES' if available else ('NO' if available is False else 'ERROR')
+
+
+def export_columns(sources: Iterable[str]) -> List[str]:
+    """Column names for results of the given hiscores."""
+    sources = list(sources)
+    per_source = [f"{source.split()[0]} AVAILABLE" for source in sources] if len(sources) > 1 else []
+    return BASE_COLUMNS + per_source + TRAILING_COLUMNS
+
+
+def export_row(result_dict: dict, columns: List[str]) -> list:
+    """Flatten a result dict into the values of ``columns``."""
+    values = {
+        'NAME': result_dict['name'],
+        'AVAILABLE': availability_text(result_dict['available']),
+        'STATUS': (result_dict.get('status') or '').upper(),
+        'OUTCOME': result_dict.get('outcome') or '',
+        'ERROR': result_dict.get('error') or '',
+    }
+    for source, part in (result_dict.get('sources') or {}).items():
+        values[f"{source.split()[0]} AVAILABLE"] = availability_text(part['available'])
+    return [values.get(column, '') for column in columns]
+
+
+class ResultExporter(ABC):
+    """Appends results to a file as they arrive; safe to call from worker threads.
+
+    Only the current batch of rows is held in memory, so an export of any size
+    uses the same memory, and rows written before a crash stay readable.
+    """
+
+    def __init__(self, path: str, columns: List[str]):
+        self.path = path
+        self.columns = columns
+        self.lock = threading.Lock()
+        self.rows_written = 0
+
+    def write(self, result_dict: dict):
+        with self.lock:
+            self._write(export_row(result_dict, self.columns))
+            self.rows_written += 1
+
+    def write_all(self, results: Iterable[dict]) -> int:
+        """Write a sequence of results and return how many were written."""
+        count = 0
+        for result_dict in results:
+            self.write(result_dict)
+            count += 1
+        return count
+
+    def write_rows(self, rows: Iterable[list]) -> int:
+        """Write rows already flattened to ``columns`` (e.g. read back from a CSV export)."""
+        count = 0
+        for row in rows:
+            with self.lock:
+                self._write(row)
+                self.rows_written += 1
+            count += 1
+        return count
+
+    @abstractmethod
+    def _write(self, row: list):
+        """Append one row of values to the file."""
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class CsvExporter(ResultExporter):
+    """CSV file flushed line by line, so it is complete up to the last finished name."""
+
+    def __init__(self, path: str, columns: List[str]):
+        super().__init__(path, columns)
+        self.file = open(path, 'w', encoding='utf-8', newline='', buffering=1)
+        self.writer = csv.writer(self.file, lineterminator='\n')
+        self.writer.writerow(columns)
+
+    def _write(self, row: list):
+        self.writer.writerow(row)
+
+    def close(self):
+        with self.lock:
+            if not self.file.closed:
+                self.file.close()
+
+
+class ParquetExporter(ResultExporter):
+    """Parquet dataset written one row group at a time (requires ``pyarrow``).
+
+    A Parquet file is only readable once its footer is written, so every row
+    group goes to its own part file in the ``path`` directory; all finished
+    parts stay readable after a crash. Read the whole export with
+    ``pandas.read_parquet(path)``.
+    """
+
+    def __init__(self, path: str, columns: List[str], row_group_size: int = 10_000):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise RuntimeError("Parquet export needs pyarrow: pip install pyarrow")
+        super().__init__(path, columns)
+        self.pyarrow = pyarrow
+        self.parquet = pyarrow.parquet
+        self.schema = pyarrow.schema([(column, pyarrow.string()) for column in columns])
+        self.row_group_size = row_group_size
+        self.buffer: List[list] = []
+        self.parts = 0
+        os.makedirs(path, exist_ok=True)
+
+    def _write(self, row: list):
+        self.buffer.append(row)
+        if len(self.buffer) >= self.row_group_size:
+            self._flush()
+
+    def _flush(self):
+        if not self.buffer:
+            return
+        table = self.pyarrow.Table.from_arrays(
+            [self.pyarrow.array(values, type=self.pyarrow.string()) for values in zip(*self.buffer)],
+            schema=self.schema,
+        )
+        part_path = os.path.join(self.path, f"part-{self.parts:05d}.parquet")
+        self.parquet.write_table(table, part_path + ".tmp")
+        os.replace(part_path + ".tmp", part_path)
+        self.parts += 1
+        self.buffer = []
+
+    def close(self):
+        with self.lock:
+            self._flush()
+
+
+class XlsxExporter(ResultExporter):
+    """XLSX written with openpyxl's write-only mode, so rows are not kept as cell objects.
+
+    Unlike CSV and Parquet, the workbook is only assembled when it is closed;
+    use CSV or Parquet when a crash mid-run must leave a partial export.
+    """
+
+    def __init__(self, path: str, columns: List[str]):
+        from openpyxl import Workbook
+
+        super().__init__(path, columns)
+        self.workbook = Workbook(write_only=True)
+        self.sheet = self.workbook.create_sheet("Results")
+        self.sheet.append(columns)
+        self.closed = False
+
+    def _write(self, row: list):
+        self.sheet.append(row)
+
+    def close(self):
+        with self.lock:
+            if not self.closed:
+                self.workbook.save(self.path)
+                self.closed = True
+
+
+EXPORTERS = {'.csv': CsvExporter, '.parquet': ParquetExporter, '.xlsx': XlsxExporter}
+
+
+def open_exporter(path: str, columns: List[str]) -> ResultExporter:
+    """Open the exporter matching the file extension (.csv, .parquet or .xlsx)."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in EXPORTERS:
+        raise ValueError(f"unsupported export format {extension or path!r} (use .csv, .parquet or .xlsx)")
+    return EXPORTERS[extension](path, columns)
+
+
+def convert_export(csv_path: str, path: str) -> int:
+    """Copy a CSV export to ``path`` in the format of its extension, row by row; returns the rows copied."""
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        columns = next(reader)
+        with open_exporter(path, columns) as exporter:
+            return exporter.write_rows(reader)
@@ -0,0 +1,77 @@
+import http.client
+import threading
+from typing import Dict, List, Tuple
+from urllib.parse import quote, urlsplit
+
+# Sent with every request; nothing else is needed to tell a 404 from a 200
+_HEADERS = {"User-Agent": "RSNChecker", "Accept-Encoding": "identity", "Connection": "keep-alive"}
+
+# Errors that mean a kept-alive connection was closed by the server
+_STALE_CONNECTION = (http.client.RemoteDisconnected, http.client.CannotSendRequest, BrokenPipeError, ConnectionResetError)
+
+
+class HiscoresClient:
+    """Minimal client for the index_lite endpoints.
+
+    Each thread keeps one persistent connection per host, so a worker pays the
+    TCP and TLS handshake once instead of once per name. Only the status code
+    is used: the body is drained so the connection can be reused, but never
+    parsed.
+    """
+
+    def __init__(self, base_urls: Dict[str, str], timeout: float = 10.0):
+        self.base_urls = base_urls
+        self.timeout = timeout
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.connections: List[http.client.HTTPConnection] = []  # Every open connection, for close()
+
+    def _connection(self, scheme: str, netloc: str) -> Tuple[http.client.HTTPConnection, bool]:
+        """Return this thread's connection to a host and whether it was reused."""
+        pool = getattr(self.local, "pool", None)
+        if pool is None:
+            pool = self.local.pool = {}
+        conn = pool.get((scheme, netloc))
+        if conn is not None:
+            return conn, True
+        connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        conn = pool[(scheme, netloc)] = connection_class(netloc, timeout=self.timeout)
+        with self.lock:
+            self.connections.append(conn)
+        return conn, False
+
+    def _drop(self, scheme: str, netloc: str, conn: http.client.HTTPConnection):
+        conn.close()
+        self.local.pool.pop((scheme, netloc), None)
+        with self.lock:
+            if conn in self.connections:
+                self.connections.remove(conn)
+
+    def status(self, name: str, source: str) -> int:
+        """Return the HTTP status of the index_lite lookup of a name."""
+        url = urlsplit(self.base_urls[source])
+        path = f"{url.path}?player={quote(name)}"
+        while True:
+            conn, reused = self._connection(url.scheme, url.netloc)
+            try:
+                conn.request("GET", path, headers=_HEADERS)
+                response = conn.getresponse()
+                response.read()  # Drain so the connection can carry the next request
+                if response.will_close:
+                    self._drop(url.scheme, url.netloc, conn)
+                return response.status
+            except _STALE_CONNECTION:
+                self._drop(url.scheme, url.netloc, conn)
+                if not reused:
+                    raise
+                # The server closed an idle connection: retry once on a new one
+            except Exception:
+                self._drop(url.scheme, url.netloc, conn)
+                raise
+
+    def close(self):
+        """Close every connection opened by any thread."""
+        with self.lock:
+            connections, self.connections = self.connections, []
+        for conn in connections:
+            conn.close()
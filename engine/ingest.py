@@ -0,0 +1,41 @@
+from typing import Iterator
+
+# Read files in 1 MiB pieces so huge name lists never sit in memory at once
+CHUNK_SIZE = 1 << 20
+
+
+def iter_file_names(file_path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """Lazily yield names from a text file, one per line (commas are also accepted)."""
+    remainder = ""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            lines = (remainder + chunk).split("\n")
+            # The last piece may be a partial line; keep it for the next chunk
+            remainder = lines.pop()
+            for line in lines:
+                for name in line.split(","):
+                    if name.strip():
+                        yield name
+    for name in remainder.split(","):
+        if name.strip():
+            yield name
+
+
+def count_lines(file_path: str, chunk_size: int = CHUNK_SIZE) -> int:
+    """Count the lines of a file without decoding or keeping it in memory."""
+    count = 0
+    last = b"\n"
+    with open(file_path, 'rb') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            count += chunk.count(b"\n")
+            last = chunk[-1:]
+    # A final line without a trailing newline still counts
+    if last != b"\n":
+        count += 1
+    return count
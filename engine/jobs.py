@@ -0,0 +1,336 @@
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# A running job that has not saved for this long is taken to be dead
+HEARTBEAT_TIMEOUT = 30.0
+
+# Input kinds: a names file read from a byte offset, a pattern read from an
+# index, or a fixed list of names stored with the job
+JOB_KINDS = ("file", "pattern", "list")
+
+
+def iter_file_from(path: str, cursor: str) -> Iterator[Tuple[str, str]]:
+    """Yield ``(name, cursor after it)`` from a names file, starting at ``cursor``.
+
+    A cursor is "offset:skip": the byte offset of a line and how many of its
+    comma-separated names were already read, so resuming never re-reads the
+    part of the file before it.
+    """
+    offset, _, skip = cursor.partition(":")
+    offset, skip = int(offset or 0), int(skip or 0)
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        for line in f:
+            names = [name.strip() for name in line.decode('utf-8').split(",") if name.strip()]
+            end = offset + len(line)
+            for index, name in enumerate(names[skip:], start=skip):
+                yield name, f"{end}:0" if index == len(names) - 1 else f"{offset}:{index + 1}"
+            offset, skip = end, 0
+
+
+def iter_pattern_from(spec: dict, cursor: str) -> Iterator[Tuple[str, str]]:
+    """Yield ``(name, cursor after it)`` from a pattern, starting at expansion ``cursor``.
+
+    ``spec`` holds the pattern and the files of its word lists ({NAME: path}).
+    The pattern is unranked at the cursor, so the names before it are not
+    generated and validated again.
+    """
+    from generate.pattern import Pattern, read_list
+
+    lists = {name: read_list(path) for name, path in spec.get('lists', {}).items()}
+    pattern = Pattern(spec['pattern'], lists)
+    for name, position in pattern.iter_from(int(cursor or 0)):
+        yield name, str(position)
+
+
+def owner_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class JobStore:
+    """Named, resumable checking jobs in a SQLite file.
+
+    A job keeps its input (a file, a pattern or a list of names), a cursor
+    into it, and every name read from it that has no result yet, marked
+    ``pending`` (read, waiting for a worker) or ``in_flight`` (handed to the
+    workers). A run that is killed leaves exactly these behind, so resuming
+    checks them first and then carries on reading from the cursor.
+    """
+
+    def __init__(self, path: str = "jobs.db"):
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " job TEXT PRIMARY KEY,"
+            " kind TEXT NOT NULL,"
+            " spec TEXT NOT NULL,"
+            " source TEXT NOT NULL,"
+            " cursor TEXT NOT NULL DEFAULT '',"
+            " exhausted INTEGER NOT NULL DEFAULT 0,"
+            " total INTEGER,"
+            " done INTEGER NOT NULL DEFAULT 0,"
+            " state TEXT NOT NULL,"  # paused, running or done
+            " owner TEXT,"
+            " heartbeat REAL,"
+            " created TEXT NOT NULL)"
+        )
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS job_names ("
+            " job TEXT NOT NULL,"
+            " seq INTEGER NOT NULL,"
+            " name TEXT NOT NULL,"
+            " state TEXT NOT NULL,"  # pending or in_flight
+            " PRIMARY KEY (job, seq))"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS job_names_by_name ON job_names (job, name)")
+        self.conn.commit()
+
+    def create(self, job: str, kind: str, spec: dict, source: str, total: Optional[int] = None, names: Iterable[str] = ()):
+        """Create a paused job; a ``list`` job stores its ``names`` right away."""
+        if kind not in JOB_KINDS:
+            raise ValueError(f"unknown job kind {kind!r}")
+        with self.lock:
+            try:
+                self.conn.execute(
+                    "INSERT INTO jobs (job, kind, spec, source, exhausted, total, state, created) VALUES (?, ?, ?, ?, ?, ?, 'paused', ?)",
+                    (job, kind, json.dumps(spec), source, int(kind == "list"), total, datetime.now().isoformat(timespec='seconds')),
+                )
+            except sqlite3.IntegrityError:
+                raise ValueError(f"job {job!r} already exists")
+            self.conn.executemany(
+                "INSERT INTO job_names (job, seq, name, state) VALUES (?, ?, ?, 'pending')",
+                ((job, seq, name.strip()) for seq, name in enumerate(names) if name.strip()),
+            )
+            self.conn.commit()
+
+    def get(self, job: str) -> Optional[dict]:
+        with self.lock:
+            self.conn.row_factory = sqlite3.Row
+            try:
+                row = self.conn.execute("SELECT * FROM jobs WHERE job = ?", (job,)).fetchone()
+            finally:
+                self.conn.row_factory = None
+        if row is None:
+            return None
+        info = dict(row)
+        info['spec'] = json.loads(info['spec'])
+        return info
+
+    def list(self) -> List[dict]:
+        """Every job with its number of pending and in-flight names."""
+        with self.lock:
+            jobs = self.conn.execute(
+                "SELECT job, kind, source, state, owner, heartbeat, total, done, exhausted, created FROM jobs ORDER BY created, job"
+            ).fetchall()
+            counts = self.conn.execute("SELECT job, state, COUNT(*) FROM job_names GROUP BY job, state").fetchall()
+        left: Dict[str, Dict[str, int]] = {}
+        for job, state, count in counts:
+            left.setdefault(job, {})[state] = count
+        result = []
+        for job, kind, source, state, owner, heartbeat, total, done, exhausted, created in jobs:
+            if state == "running" and not self.alive(owner, heartbeat):
+                state = "interrupted"
+            result.append({
+                'job': job, 'kind': kind, 'source': source, 'state': state, 'owner': owner,
+                'total': total, 'done': done, 'input_read': bool(exhausted), 'created': created,
+                'pending': left.get(job, {}).get('pending', 0),
+                'in_flight': left.get(job, {}).get('in_flight', 0),
+            })
+        return result
+
+    @staticmethod
+    def alive(owner: Optional[str], heartbeat: Optional[float]) -> bool:
+        """Whether the process running a job is still there."""
+        if not owner or heartbeat is None:
+            return False
+        host, _, pid = owner.rpartition(":")
+        if host == socket.gethostname():
+            try:
+                os.kill(int(pid), 0)
+            except (OSError, ValueError):
+                return False
+        return time.time() - heartbeat < HEARTBEAT_TIMEOUT
+
+    def claim(self, job: str, owner: str) -> dict:
+        """Mark a job as running by ``owner``; refused while another live process runs it."""
+        with self.lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self.conn.execute("SELECT state, owner, heartbeat FROM jobs WHERE job = ?", (job,)).fetchone()
+                if row is None:
+                    raise ValueError(f"no job named {job!r}")
+                state, current, heartbeat = row
+                if state == "done":
+                    raise ValueError(f"job {job!r} is already done")
+                if current and current != owner and self.alive(current, heartbeat):
+                    raise ValueError(f"job {job!r} is being run by {current}")
+                self.conn.execute(
+                    "UPDATE jobs SET state = 'running', owner = ?, heartbeat = ? WHERE job = ?", (owner, time.time(), job)
+                )
+                # Names handed out by a run that died never got a result
+                self.conn.execute("UPDATE job_names SET state = 'pending' WHERE job = ?", (job,))
+                self.conn.commit()
+            except BaseException:
+                self.conn.rollback()
+                raise
+        return self.get(job)
+
+    def pause(self, job: str) -> bool:
+        """Ask a job to stop; a running process notices on its next save."""
+        with self.lock:
+            cursor = self.conn.execute("UPDATE jobs SET state = 'paused' WHERE job = ? AND state != 'done'", (job,))
+            self.conn.commit()
+        return cursor.rowcount == 1
+
+    def remove(self, job: str) -> bool:
+        with self.lock:
+            self.conn.execute("DELETE FROM job_names WHERE job = ?", (job,))
+            cursor = self.conn.execute("DELETE FROM jobs WHERE job = ?", (job,))
+            self.conn.commit()
+        return cursor.rowcount == 1
+
+    def leftover(self, job: str) -> List[Tuple[int, str]]:
+        """Names read by earlier runs that have no result yet, in input order."""
+        with self.lock:
+            return self.conn.execute("SELECT seq, name FROM job_names WHERE job = ? ORDER BY seq", (job,)).fetchall()
+
+    def close(self):
+        with self.lock:
+            self.conn.commit()
+            self.conn.close()
+
+
+class JobRun:
+    """Feeds a job's names to a checker and records their progress in the job store.
+
+    Every change (a name read together with the advanced cursor, a name
+    handed to the workers, a name finished) is queued in memory and written
+    by a background thread in one short transaction per ``commit_interval``,
+    so after a crash every name is either behind the cursor and stored, or
+    still ahead of it. The same thread notices a pause requested from
+    another process.
+    """
+
+    def __init__(self, store: JobStore, job: str, on_pause: Callable[[], None], commit_interval: float = 1.0):
+        self.store = store
+        self.job = job
+        self.on_pause = on_pause
+        self.commit_interval = commit_interval
+        self.owner = owner_id()
+        self.info = store.claim(job, self.owner)
+        self.next_seq = 0
+        self.input_done = bool(self.info['exhausted'])
+        self.paused = False
+        self.changes: List[tuple] = []  # Written in order by the next flush
+        self.changes_lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.keeper = threading.Thread(target=self._keep, daemon=True)
+        self.checker = None
+        self.emit = self.report_filtered = None
+
+    def attach(self, checker):
+        """Have ``checker`` report its skipped, dispatched and finished names to this run."""
+        self.checker = checker
+        self.emit, self.report_filtered = checker.on_result, checker.on_filtered
+
+        def on_result(result_dict: dict):
+            self.emit(result_dict)
+            self.finished(result_dict)
+
+        checker.on_result = on_result
+        checker.on_filtered = self.filtered
+
+    def names(self) -> Iterator[str]:
+        """Leftover names of earlier runs first, then the rest of the input."""
+        leftover = self.store.leftover(self.job)
+        self.next_seq = leftover[-1][0] + 1 if leftover else 0
+        for _, name in leftover:
+            yield name
+        if self.input_done:
+            return
+
+        kind, spec, cursor = self.info['kind'], self.info['spec'], self.info['cursor']
+        source = iter_file_from(spec['path'], cursor) if kind == "file" else iter_pattern_from(spec, cursor)
+        for name, cursor in source:
+            self._change("read", self.next_seq, name, cursor)
+            self.next_seq += 1
+            yield name
+        self._change("exhausted")
+        self.input_done = True
+
+    def filtered(self, name: str, dispatched: bool):
+        """Checker callback: a name was handed to the workers, or skipped without a lookup."""
+        self._change("dispatched" if dispatched else "settled", name)
+
+    def finished(self, result_dict: dict):
+        """Checker callback: a name has its result (cancelled lookups stay in the job)."""
+        if result_dict.get('outcome') != 'cancelled':
+            self._change("settled", result_dict['name'])
+
+    def _change(self, *change):
+        with self.changes_lock:
+            self.changes.append(change)
+
+    def flush(self):
+        """Write the queued changes in one transaction and return the job's state."""
+        with self.changes_lock:
+            changes, self.changes = self.changes, []
+        conn = self.store.conn
+        with self.store.lock:
+            for kind, *values in changes:
+                if kind == "read":
+                    seq, name, cursor = values
+                    conn.execute("INSERT INTO job_names (job, seq, name, state) VALUES (?, ?, ?, 'pending')", (self.job, seq, name))
+                    conn.execute("UPDATE jobs SET cursor = ? WHERE job = ?", (cursor, self.job))
+                elif kind == "dispatched":
+                    conn.execute("UPDATE job_names SET state = 'in_flight' WHERE job = ? AND name = ?", (self.job, values[0]))
+                elif kind == "settled":
+                    deleted = conn.execute("DELETE FROM job_names WHERE job = ? AND name = ?", (self.job, values[0])).rowcount
+                    if deleted:
+                        conn.execute("UPDATE jobs SET done = done + ? WHERE job = ?", (deleted, self.job))
+                else:
+                    conn.execute("UPDATE jobs SET exhausted = 1 WHERE job = ?", (self.job,))
+            conn.execute("UPDATE jobs SET heartbeat = ? WHERE job = ?", (time.time(), self.job))
+            conn.commit()
+            state = conn.execute("SELECT state FROM jobs WHERE job = ?", (self.job,)).fetchone()
+        return state[0] if state else None
+
+    def start(self):
+        self.keeper.start()
+
+    def _keep(self):
+        while not self.stopped.wait(self.commit_interval):
+            state = self.flush()
+            if state != "running" and not self.paused:
+                self.paused = True
+                self.on_pause()
+
+    def finish(self) -> str:
+        """Save the job: done if all input was read and checked, paused otherwise."""
+        self.stopped.set()
+        if self.keeper.is_alive():
+            self.keeper.join()
+        if self.checker is not None:
+            self.checker.on_result = self.emit
+            self.checker.on_filtered = self.report_filtered
+            self.checker = None
+        self.flush()
+        conn = self.store.conn
+        with self.store.lock:
+            left = conn.execute("SELECT COUNT(*) FROM job_names WHERE job = ?", (self.job,)).fetchone()[0]
+            state = "done" if self.input_done and not left else "paused"
+            conn.execute(
+                "UPDATE jobs SET state = ?, owner = NULL, heartbeat = NULL WHERE job = ? AND owner = ?",
+                (state, self.job, self.owner),
+            )
+            conn.commit()
+        return state
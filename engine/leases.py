@@ -0,0 +1,210 @@
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, NamedTuple, Optional
+
+
+class Lease(NamedTuple):
+    """A shard claimed by one worker until ``expires`` (``time.time()``)."""
+
+    shard: int
+    start: int
+    stop: int
+    position: int
+    expires: float
+
+
+class LeaseStore:
+    """Shared SQLite file that hands out numbered shards of a sweep to workers.
+
+    A job splits a name space into shards of ``shard_size`` indexes. Workers on
+    any number of processes or hosts claim one shard at a time; the claim is a
+    lease that the worker renews (together with its position) while it runs.
+    A worker that dies stops renewing, its lease expires and the shard is
+    claimed again from the last reported position.
+
+    The file uses SQLite's default rollback journal rather than WAL, so it also
+    works on shared network storage where WAL's shared memory is unavailable.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.Lock()
+        # Autocommit; claims open their own write transaction
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " job TEXT PRIMARY KEY,"
+            " space TEXT NOT NULL,"
+            " total INTEGER NOT NULL,"
+            " shard_size INTEGER NOT NULL,"
+            " created TEXT NOT NULL)"
+        )
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS shards ("
+            " job TEXT NOT NULL,"
+            " shard INTEGER NOT NULL,"
+            " start INTEGER NOT NULL,"
+            " stop INTEGER NOT NULL,"
+            " position INTEGER NOT NULL,"
+            " state TEXT NOT NULL,"  # pending, leased or done
+            " owner TEXT,"
+            " expires REAL,"
+            " PRIMARY KEY (job, shard))"
+        )
+
+    def create_job(self, job: str, space: dict, total: int, shard_size: int) -> int:
+        """Create a job's shards unless it exists; returns the number of shards.
+
+        Joining an existing job with a different name space is refused, so
+        workers started with mismatched options cannot corrupt each other.
+        """
+        if shard_size < 1:
+            raise ValueError("shard_size must be at least 1")
+        encoded = json.dumps(space, sort_keys=True)
+        with self.lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self.conn.execute("SELECT space, total, shard_size FROM jobs WHERE job = ?", (job,)).fetchone()
+                if row:
+                    if row[0] != encoded:
+                        raise ValueError(f"job {job!r} already exists with a different name space")
+                    total, shard_size = row[1], row[2]
+                else:
+                    self.conn.execute(
+                        "INSERT INTO jobs (job, space, total, shard_size, created) VALUES (?, ?, ?, ?, ?)",
+                        (job, encoded, total, shard_size, datetime.now().isoformat()),
+                    )
+                    self.conn.executemany(
+                        "INSERT INTO shards (job, shard, start, stop, position, state) VALUES (?, ?, ?, ?, ?, 'pending')",
+                        (
+                            (job, shard, start, min(start + shard_size, total), start)
+                            for shard, start in enumerate(range(0, total, shard_size))
+                        ),
+                    )
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+        return -(-total // shard_size)
+
+    def claim(self, job: str, owner: str, ttl: float, rewind: int = 0) -> Optional[Lease]:
+        """Lease the next pending or expired shard, or return None if there is none.
+
+        ``rewind`` steps back over names the previous owner may have handed
+        out without finishing; the progress store skips the ones that did.
+        """
+        now = time.time()
+        with self.lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self.conn.execute(
+                    "SELECT shard, start, stop, position, state FROM shards"
+                    " WHERE job = ? AND (state = 'pending' OR (state = 'leased' AND expires < ?))"
+                    " ORDER BY shard LIMIT 1",
+                    (job, now),
+                ).fetchone()
+                if row is None:
+                    self.conn.execute("COMMIT")
+                    return None
+                shard, start, stop, position, _ = row
+                if position > start:
+                    position = max(start, position - rewind)
+                expires = now + ttl
+                self.conn.execute(
+                    "UPDATE shards SET state = 'leased', owner = ?, expires = ?, position = ? WHERE job = ? AND shard = ?",
+                    (owner, expires, position, job, shard),
+                )
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+        return Lease(shard, start, stop, position, expires)
+
+    def renew(self, job: str, shard: int, owner: str, position: int, ttl: float) -> bool:
+        """Extend a lease and save its position; False means the lease was lost."""
+        with self.lock:
+            cursor = self.conn.execute(
+                "UPDATE shards SET expires = ?, position = ?"
+                " WHERE job = ? AND shard = ? AND owner = ? AND state = 'leased'",
+                (time.time() + ttl, position, job, shard, owner),
+            )
+        return cursor.rowcount == 1
+
+    def complete(self, job: str, shard: int, owner: str) -> bool:
+        """Mark a leased shard as done."""
+        with self.lock:
+            cursor = self.conn.execute(
+                "UPDATE shards SET state = 'done', position = stop, expires = NULL"
+                " WHERE job = ? AND shard = ? AND owner = ? AND state = 'leased'",
+                (job, shard, owner),
+            )
+        return cursor.rowcount == 1
+
+    def release(self, job: str, shard: int, owner: str, position: int):
+        """Give a shard back unfinished so another worker can claim it right away."""
+        with self.lock:
+            self.conn.execute(
+                "UPDATE shards SET state = 'pending', owner = NULL, expires = NULL, position = ?"
+                " WHERE job = ? AND shard = ? AND owner = ? AND state = 'leased'",
+                (position, job, shard, owner),
+            )
+
+    def status(self, job: str) -> Dict[str, int]:
+        """Return shard counts per state and the number of names left in the job."""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT state, COUNT(*), SUM(stop - position) FROM shards WHERE job = ? GROUP BY state", (job,)
+            ).fetchall()
+        status = {'pending': 0, 'leased': 0, 'done': 0, 'remaining': 0}
+        for state, count, remaining in rows:
+            status[state] = count
+            status['remaining'] += remaining or 0
+        return status
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+class LeaseKeeper(threading.Thread):
+    """Background thread that renews a lease while its shard is being checked.
+
+    Renewal is time based, so a worker whose lookups are paused (rate limit,
+    circuit breaker) keeps its shard; ``on_lost`` is called if the lease
+    expired anyway and another worker took the shard over.
+    """
+
+    def __init__(
+        self,
+        leases: LeaseStore,
+        job: str,
+        lease: Lease,
+        owner: str,
+        ttl: float,
+        position: Callable[[], int],
+        on_lost: Callable[[], None],
+    ):
+        super().__init__(daemon=True)
+        self.leases = leases
+        self.job = job
+        self.lease = lease
+        self.owner = owner
+        self.ttl = ttl
+        self.position = position
+        self.on_lost = on_lost
+        self.lost = False
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.ttl / 3):
+            if not self.leases.renew(self.job, self.lease.shard, self.owner, self.position(), self.ttl):
+                self.lost = True
+                self.on_lost()
+                return
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
@@ -0,0 +1,105 @@
+import atexit
+import gzip
+import logging
+import logging.handlers
+import os
+import queue
+import shutil
+import threading
+import time
+from collections import Counter
+from typing import List, Optional
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# Per-name log lines: every outcome, or only available names and errors plus summaries
+LOG_MODES = ("full", "sampled")
+
+
+def gzip_namer(name: str) -> str:
+    return name + ".gz"
+
+
+def gzip_rotator(source: str, dest: str):
+    """Compress a rotated log file, then remove the uncompressed one."""
+    with open(source, 'rb') as f_in, gzip.open(dest, 'wb') as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
+
+
+def rotating_file_handler(
+    path: str,
+    max_bytes: int = 0,
+    backup_count: int = 5,
+    when: Optional[str] = None,
+    compress: bool = False,
+) -> logging.Handler:
+    """File handler rotating by size (``max_bytes``) or time (``when``, e.g. "midnight").
+
+    Rotated files are gzip-compressed when ``compress`` is set; this runs on
+    the log writer thread, never on a worker.
+    """
+    if when:
+        handler = logging.handlers.TimedRotatingFileHandler(path, when=when, backupCount=backup_count, encoding='utf-8')
+    else:
+        handler = logging.handlers.RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8')
+    if compress:
+        handler.namer = gzip_namer
+        handler.rotator = gzip_rotator
+    return handler
+
+
+def start_queue_logging(handlers: List[logging.Handler], level: int = logging.INFO) -> logging.handlers.QueueListener:
+    """Route all logging through a queue drained by one background writer thread.
+
+    Worker threads only put records on the queue, so they never wait on the
+    handler locks or on disk and console writes. The listener is stopped (and
+    the queue drained) at interpreter exit.
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    formatter = logging.Formatter(LOG_FORMAT)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    # The queued record only carries the message; the writer thread adds the format
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    logging.basicConfig(level=level, handlers=[queue_handler])
+    return listener
+
+
+class OutcomeSummary:
+    """Counts per-name outcomes and hands out one aggregate line per interval.
+
+    Used by the "sampled" log mode in place of one line per taken name.
+    """
+
+    def __init__(self, interval: float = 30.0):
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.counts: Counter = Counter()
+        self.started = time.monotonic()
+
+    def add(self, outcome: str) -> Optional[str]:
+        """Count an outcome; returns a summary line when the interval has passed."""
+        with self.lock:
+            self.counts[outcome] += 1
+            if time.monotonic() - self.started < self.interval:
+                return None
+            return self._take()
+
+    def flush(self) -> Optional[str]:
+        """Return the summary of everything counted since the last one, if anything."""
+        with self.lock:
+            return self._take() if self.counts else None
+
+    def _take(self) -> str:
+        elapsed = time.monotonic() - self.started
+        total = sum(self.counts.values())
+        parts = ", ".join(f"{count} {outcome}" for outcome, count in self.counts.most_common())
+        self.counts.clear()
+        self.started = time.monotonic()
+        return f"Summary: {total} lookups in {elapsed:.0f}s ({total / elapsed if elapsed else 0:.1f}/s): {parts}"
@@ -0,0 +1,193 @@
+import bisect
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Tuple
+
+# Upper bounds (seconds) of the latency and wait histograms
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Histogram:
+    """Cumulative histogram in the Prometheus style (bucket counts, sum and count)."""
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # Last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def lines(self, name: str, labels: str) -> List[str]:
+        prefix = labels + "," if labels else ""
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            cumulative += count
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            lines.append(f'{name}_bucket{{{prefix}le="{le}"}} {cumulative}')
+        braces = f"{{{labels}}}" if labels else ""
+        lines.append(f"{name}_sum{braces} {self.sum:.6f}")
+        lines.append(f"{name}_count{braces} {self.count}")
+        return lines
+
+
+class Metrics:
+    """In-process counters, gauges and histograms of a checker.
+
+    Everything is updated from the worker threads under one lock and rendered
+    in the Prometheus text format, either served over HTTP
+    (``serve_metrics``) or written to a file during a run
+    (``MetricsFileWriter``, e.g. for node_exporter's textfile collector).
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.lock = threading.Lock()
+        self.latency: Dict[str, Histogram] = {}  # {source: request durations}
+        self.outcomes: Dict[Tuple[str, str], int] = {}  # {(source, outcome): lookups}
+        self.retries: Dict[Tuple[str, str], int] = {}  # {(source, outcome): retries scheduled}
+        self.limiter_wait = Histogram(self.buckets)
+        self.breaker_trips = 0
+        self.shared: Dict[str, int] = {}  # {source: lookups answered by another caller's request}
+        self.requests_in_flight = 0
+        self.gauges: Dict[str, Tuple[str, Callable[[], float]]] = {}  # Read when rendering
+        self.started = time.time()
+
+    def request_started(self):
+        with self.lock:
+            self.requests_in_flight += 1
+
+    def request_finished(self, source: str, outcome: str, seconds: float):
+        """Record one finished request to the hiscores."""
+        with self.lock:
+            self.requests_in_flight -= 1
+            histogram = self.latency.get(source)
+            if histogram is None:
+                histogram = self.latency[source] = Histogram(self.buckets)
+            histogram.observe(seconds)
+            self.outcomes[(source, outcome)] = self.outcomes.get((source, outcome), 0) + 1
+
+    def observe_limiter_wait(self, seconds: float):
+        with self.lock:
+            self.limiter_wait.observe(seconds)
+
+    def count_retry(self, source: str, outcome: str):
+        with self.lock:
+            self.retries[(source, outcome)] = self.retries.get((source, outcome), 0) + 1
+
+    def count_shared(self, source: str, count: int = 1):
+        with self.lock:
+            self.shared[source] = self.shared.get(source, 0) + count
+
+    def count_breaker_trip(self):
+        with self.lock:
+            self.breaker_trips += 1
+
+    def add_gauge(self, name: str, help_text: str, read: Callable[[], float]):
+        """Register a gauge whose value is read when the metrics are rendered."""
+        self.gauges[name] = (help_text, read)
+
+    def render(self) -> str:
+        """Return all metrics in the Prometheus text exposition format."""
+        lines = []
+
+        def header(name, kind, help_text):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        with self.lock:
+            header("rsn_request_duration_seconds", "histogram", "Duration of hiscores lookups per source.")
+            for source, histogram in sorted(self.latency.items()):
+                lines.extend(histogram.lines("rsn_request_duration_seconds", f'source="{source}"'))
+
+            header("rsn_lookups_total", "counter", "Finished lookups per source and outcome.")
+            for (source, outcome), count in sorted(self.outcomes.items()):
+                lines.append(f'rsn_lookups_total{{source="{source}",outcome="{outcome}"}} {count}')
+
+            header("rsn_retries_total", "counter", "In-run retries scheduled per source and failure outcome.")
+            for (source, outcome), count in sorted(self.retries.items()):
+                lines.append(f'rsn_retries_total{{source="{source}",outcome="{outcome}"}} {count}')
+
+            header("rsn_shared_lookups_total", "counter", "Lookups answered by a request already in flight for the same name, i.e. requests saved.")
+            for source, count in sorted(self.shared.items()):
+                lines.append(f'rsn_shared_lookups_total{{source="{source}"}} {count}')
+
+            header("rsn_requests_in_flight", "gauge", "Lookups currently waiting on the hiscores.")
+            lines.append(f"rsn_requests_in_flight {self.requests_in_flight}")
+
+            header("rsn_rate_limiter_wait_seconds", "histogram", "Time spent waiting for a rate limiter token.")
+            lines.extend(self.limiter_wait.lines("rsn_rate_limiter_wait_seconds", ""))
+
+            header("rsn_circuit_breaker_trips_total", "counter", "Times the run was paused by the circuit breaker.")
+            lines.append(f"rsn_circuit_breaker_trips_total {self.breaker_trips}")
+
+        for name, (help_text, read) in sorted(self.gauges.items()):
+            try:
+                value = read()
+            except Exception:
+                continue
+            header(name, "gauge", help_text)
+            lines.append(f"{name} {value}")
+
+        header("rsn_uptime_seconds", "gauge", "Seconds since the checker was created.")
+        lines.append(f"rsn_uptime_seconds {time.time() - self.started:.1f}")
+        return "\n".join(lines) + "\n"
+
+
+class MetricsFileWriter(threading.Thread):
+    """Rewrites a metrics file every ``interval`` seconds while a run is active."""
+
+    def __init__(self, metrics: Metrics, path: str, interval: float = 5.0):
+        super().__init__(daemon=True)
+        self.metrics = metrics
+        self.path = path
+        self.interval = interval
+        self.stopped = threading.Event()
+
+    def write(self):
+        """Write the file atomically so readers never see half of it."""
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(self.metrics.render())
+        os.replace(temp_path, self.path)
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.write()
+
+    def stop(self):
+        """Stop writing, leaving the final values in the file."""
+        self.stopped.set()
+        if self.is_alive():
+            self.join()
+        self.write()
+
+
+def serve_metrics(metrics: Metrics, port: int, host: str = "127.0.0.1"):
+    """Serve ``/metrics`` from a background thread and return the server."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = metrics.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
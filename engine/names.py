@@ -0,0 +1,32 @@
+import re
+from typing import Optional
+
+# RuneScape treats spaces, underscores and hyphens in display names as the same character
+_SEPARATORS = re.compile(r"[ _-]")
+
+
+def canonical_name(name: str) -> str:
+    """Return the canonical spelling shared by every equivalent display name.
+
+    Case is ignored and spaces, underscores and hyphens are folded into ``_``,
+    so "Zez ima", "zez_ima" and "ZEZ-IMA" map to one key (as do "Zezima" and
+    "zezima", which is a different name).
+    """
+    return _SEPARATORS.sub("_", name.strip().lower())
+
+
+def validate_name(name: str) -> Optional[str]:
+    """Return a validation message for an invalid name, or None if it is valid."""
+    # Validate name length (RuneScape names: 1-12 characters)
+    if len(name) < 1 or len(name) > 12:
+        return "invalid length (must be 1-12 chars)"
+
+    # Validate characters
+    if not all(char.isalnum() or char.isspace() or char == "_" or char == "-" for char in name):
+        return "has invalid characters"
+
+    # Check if name is only special characters or spaces
+    if all(char in "_- " for char in name):
+        return "is only special characters or spaces"
+
+    return None
@@ -0,0 +1,63 @@
+import http.client
+import socket
+from enum import Enum
+from typing import Optional
+
+
+class Outcome(str, Enum):
+    """What a single lookup found out about a name."""
+
+    NOT_FOUND = "not_found"  # No player has the name: potentially available
+    FOUND = "found"  # The name is taken
+    RATE_LIMITED = "rate_limited"  # HTTP 429
+    TIMEOUT = "timeout"
+    SERVER_ERROR = "server_error"  # HTTP 5xx
+    NETWORK_ERROR = "network_error"  # Connection refused, reset or closed
+    PARSE_ERROR = "parse_error"  # Unexpected status code or response
+    CANCELLED = "cancelled"  # Stopped by the user before the lookup ran
+
+
+# Outcomes that answer the question; everything else is recorded as an error
+DEFINITIVE = {Outcome.NOT_FOUND, Outcome.FOUND}
+
+# Failures that usually go away on their own and are retried within the run
+TRANSIENT = {Outcome.RATE_LIMITED, Outcome.TIMEOUT, Outcome.SERVER_ERROR, Outcome.NETWORK_ERROR}
+
+# Failures that mean the hiscores want fewer requests
+THROTTLING = {Outcome.RATE_LIMITED, Outcome.SERVER_ERROR}
+
+
+def classify_status(status: int) -> Outcome:
+    """Map an index_lite HTTP status code to an outcome."""
+    if status == 404:
+        return Outcome.NOT_FOUND
+    if status == 200:
+        return Outcome.FOUND
+    if status == 429:
+        return Outcome.RATE_LIMITED
+    if status >= 500:
+        return Outcome.SERVER_ERROR
+    return Outcome.PARSE_ERROR
+
+
+def classify_exception(error: BaseException) -> Outcome:
+    """Map an exception raised during a lookup to an outcome."""
+    if isinstance(error, (socket.timeout, TimeoutError)):
+        return Outcome.TIMEOUT
+    if isinstance(error, (ConnectionError, http.client.HTTPException, OSError)):
+        return Outcome.NETWORK_ERROR
+    return Outcome.PARSE_ERROR
+
+
+def classify_message(message: str) -> Optional[Outcome]:
+    """Classify the text of an API wrapper error, or None if it says nothing useful."""
+    message = message.lower()
+    if "not found" in message or "404" in message or "unable to find" in message:
+        return Outcome.NOT_FOUND
+    if "429" in message or "too many requests" in message:
+        return Outcome.RATE_LIMITED
+    if any(code in message for code in ("500", "502", "503", "504")):
+        return Outcome.SERVER_ERROR
+    if "timed out" in message or "timeout" in message:
+        return Outcome.TIMEOUT
+    return None
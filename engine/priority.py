@@ -0,0 +1,91 @@
+import heapq
+import itertools
+from typing import Callable, Dict, Iterable, Iterator, List, Set, Tuple
+from engine.names import canonical_name
+
+# A scorer maps a name to a sort key; lower keys are checked first
+Scorer = Callable[[str], float]
+
+
+def score_length(name: str) -> float:
+    """Shorter names first."""
+    return len(name.strip())
+
+
+class WordScorer:
+    """Dictionary words (one per line in a word list) before everything else."""
+
+    def __init__(self, words: Iterable[str]):
+        self.words: Set[str] = {canonical_name(word) for word in words if word.strip()}
+
+    def __call__(self, name: str) -> float:
+        return 0 if canonical_name(name) in self.words else 1
+
+
+class WeightScorer:
+    """User-weighted names ("name,weight" per line); higher weights first, unlisted names last."""
+
+    def __init__(self, weights: Dict[str, float]):
+        self.weights = {canonical_name(name): weight for name, weight in weights.items()}
+
+    def __call__(self, name: str) -> float:
+        return -self.weights.get(canonical_name(name), float("-inf"))
+
+
+def read_lines(path: str) -> Iterator[str]:
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                yield line
+
+
+def read_weights(path: str) -> Dict[str, float]:
+    """Read "name,weight" lines; a name without a weight counts as 1."""
+    weights = {}
+    for line in read_lines(path):
+        name, _, weight = line.rpartition(",") if "," in line else (line, "", "1")
+        weights[name] = float(weight)
+    return weights
+
+
+def build_scorer(spec: str) -> Callable[[str], Tuple]:
+    """Build a scorer from a comma-separated list such as "words:common.txt,length".
+
+    Scorers are applied in order, later ones breaking ties of earlier ones:
+    ``length`` (shorter first), ``words:FILE`` (names in the word list first)
+    and ``weights:FILE`` ("name,weight" lines, higher weights first).
+    """
+    scorers: List[Scorer] = []
+    for part in filter(None, (part.strip() for part in spec.split(","))):
+        kind, _, path = part.partition(":")
+        if kind == "length" and not path:
+            scorers.append(score_length)
+        elif kind == "words" and path:
+            scorers.append(WordScorer(read_lines(path)))
+        elif kind == "weights" and path:
+            scorers.append(WeightScorer(read_weights(path)))
+        else:
+            raise ValueError(f"invalid priority {part!r} (use length, words:FILE or weights:FILE)")
+    if not scorers:
+        raise ValueError("no priority given")
+    return lambda name: tuple(scorer(name) for scorer in scorers)
+
+
+def prioritized(names: Iterable[str], score: Callable[[str], object], lookahead: int) -> Iterator[str]:
+    """Yield names best-first from a heap of the next ``lookahead`` names.
+
+    Names are still pulled lazily, so an endless or huge input keeps working;
+    the order is exact when the input fits in ``lookahead`` and a rolling
+    best-first order otherwise. Equal scores keep their input order.
+    """
+    heap: List[Tuple[object, int, str]] = []
+    counter = itertools.count()
+    for name in names:
+        entry = (score(name), next(counter), name)
+        if len(heap) < lookahead:
+            heapq.heappush(heap, entry)
+        else:
+            yield heapq.heappushpop(heap, entry)[2]
+    while heap:
+        yield heapq.heappop(heap)[2]
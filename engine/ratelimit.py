@@ -0,0 +1,87 @@
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """Shared token-bucket rate limiter with automatic backoff.
+
+    Every worker draws one token per request, so the real request rate is
+    ``rate`` per second (with bursts of up to ``burst``) no matter how many
+    workers are running. Throttling responses (429 or 5xx) halve the rate and
+    pause all workers with an exponentially growing backoff; successful
+    responses slowly restore the configured rate.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: int = 10,
+        initial_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+    ):
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+        self.max_rate = rate  # Configured requests per second
+        self.rate = rate  # Current rate, lowered while backing off
+        self.min_rate = rate / 32
+        self.burst = burst
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+
+        self.lock = threading.Lock()
+        self.tokens = float(burst)
+        self.updated = time.monotonic()  # Moves into the future while paused
+        self.backoff = 0.0
+        self.throttle_count = 0
+
+    def reserve(self) -> float:
+        """Take a token and return how many seconds to wait before using it."""
+        with self.lock:
+            now = time.monotonic()
+            if now > self.updated:
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+            self.tokens -= 1
+            # While paused, tokens only start accruing once the pause is over
+            wait = self.updated - now
+            if self.tokens < 0:
+                wait += -self.tokens / self.rate
+            return wait
+
+    def acquire(self, stop_event: Optional[threading.Event] = None) -> bool:
+        """Block until a token is available; returns False if stop was requested meanwhile."""
+        wait = self.reserve()
+        if wait <= 0:
+            return True
+        if stop_event is None:
+            time.sleep(wait)
+            return True
+        return not stop_event.wait(wait)
+
+    async def acquire_async(self):
+        """Wait on the event loop until a token is available."""
+        wait = self.reserve()
+        if wait > 0:
+            import asyncio  # Only the async engine needs the event loop
+            await asyncio.sleep(wait)
+
+    def throttled(self):
+        """Back off after a 429 or 5xx response."""
+        with self.lock:
+            now = time.monotonic()
+            # Requests already in flight report the same throttling; count it once
+            if now < self.updated:
+                return
+            self.throttle_count += 1
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.backoff = min(self.max_backoff, self.backoff * 2 if self.backoff else self.initial_backoff)
+            self.tokens = min(self.tokens, 0.0)
+            self.updated = now + self.backoff
+
+    def succeeded(self):
+        """Recover the configured rate after a successful response."""
+        with self.lock:
+            self.backoff = 0.0
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
@@ -0,0 +1,93 @@
+import random
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+
+def retry_delay(attempt: int, base: float = 1.0, cap: float = 30.0) -> float:
+    """Exponential backoff with full jitter for the given retry attempt (1, 2, ...)."""
+    # Random delays keep retries of names that failed together from arriving together
+    return random.uniform(0, min(cap, base * 2 ** (attempt - 1)))
+
+
+class CircuitBreaker:
+    """Pauses the whole run when too many recent lookups failed.
+
+    The breaker tracks the last ``window`` lookups. When at least ``threshold``
+    of them failed it opens and every worker waits ``cooldown`` seconds. Then
+    a single probe lookup is let through: if it succeeds the run continues,
+    otherwise the breaker opens again with a doubled cooldown.
+    """
+
+    def __init__(self, window: int = 50, threshold: float = 0.5, cooldown: float = 30.0, max_cooldown: float = 600.0):
+        if window < 1 or not 0 < threshold <= 1:
+            raise ValueError("window must be at least 1 and threshold between 0 and 1")
+        self.window = window
+        self.threshold = threshold
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+
+        self.lock = threading.Lock()
+        self.recent = deque(maxlen=window)  # True for every failed lookup
+        self.cooldown = cooldown
+        self.opened_until: Optional[float] = None  # Set while open
+        self.probing = False  # A probe lookup is in flight
+
+    def reserve(self) -> float:
+        """Return 0 if a lookup may start now, otherwise how long to wait before asking again."""
+        with self.lock:
+            if self.opened_until is None:
+                return 0.0
+            now = time.monotonic()
+            if now < self.opened_until:
+                return self.opened_until - now
+            if self.probing:
+                return min(1.0, self.cooldown)
+            self.probing = True
+            return 0.0
+
+    def acquire(self, stop_event: Optional[threading.Event] = None) -> bool:
+        """Block while the breaker is open; returns False if stop was requested meanwhile."""
+        while True:
+            wait = self.reserve()
+            if wait <= 0:
+                return True
+            if stop_event is None:
+                time.sleep(wait)
+            elif stop_event.wait(wait):
+                return False
+
+    async def acquire_async(self, stop_event: Optional[threading.Event] = None) -> bool:
+        """Wait on the event loop while the breaker is open."""
+        while True:
+            wait = self.reserve()
+            if wait <= 0:
+                return True
+            if stop_event is not None and stop_event.is_set():
+                return False
+            import asyncio  # Only the async engine needs the event loop
+            await asyncio.sleep(min(wait, 1.0))
+
+    def record(self, failed: bool) -> bool:
+        """Record the result of a lookup; returns True if it opened the breaker."""
+        with self.lock:
+            if self.probing:
+                self.probing = False
+                if failed:
+                    self.cooldown = min(self.max_cooldown, self.cooldown * 2)
+                    self.opened_until = time.monotonic() + self.cooldown
+                    return True
+                self.opened_until = None
+                self.cooldown = self.base_cooldown
+                self.recent.clear()
+                return False
+
+            self.recent.append(failed)
+            if self.opened_until is not None or len(self.recent) < self.window:
+                return False
+            if sum(self.recent) / len(self.recent) >= self.threshold:
+                self.opened_until = time.monotonic() + self.cooldown
+                self.recent.clear()
+                return True
+            return False
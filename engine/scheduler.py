@@ -0,0 +1,128 @@
+from concurrent.futures import Executor, Future, FIRST_COMPLETED, InvalidStateError, wait
+from typing import Callable, Dict, Iterable, Iterator, Tuple
+import threading
+
+
+def run_windowed(
+    executor: Executor,
+    fn: Callable,
+    items: Iterable,
+    window: int,
+    stop_event: threading.Event,
+    *args,
+) -> Iterator[Tuple[object, Future]]:
+    """Yield ``(item, future)`` pairs as they complete, with at most ``window`` in flight.
+
+    Items are pulled lazily from ``items`` only when a slot frees up, so memory
+    stays flat no matter how long the input is, and stopping only has to
+    cancel the futures inside the window. Lookups already running when
+    ``stop_event`` is set still finish and are yielded, so no result that
+    was obtained goes unreported. Ctrl+C while waiting sets ``stop_event``
+    and is handled the same way.
+    """
+    pending = iter(items)
+    in_flight: Dict[Future, object] = {}
+    exhausted = False
+
+    def fill():
+        nonlocal exhausted
+        while not exhausted and len(in_flight) < window and not stop_event.is_set():
+            try:
+                item = next(pending)
+            except StopIteration:
+                exhausted = True
+                return
+            in_flight[executor.submit(fn, item, *args)] = item
+
+    fill()
+    while in_flight:
+        try:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+        except KeyboardInterrupt:
+            stop_event.set()
+            done = set()
+        for future in done:
+            yield in_flight.pop(future), future
+        if stop_event.is_set():
+            # Cancel whatever is still queued inside the window, then drain the running ones
+            for future in [future for future in in_flight if future.cancel()]:
+                del in_flight[future]
+            continue
+        fill()
+
+
+class FanOutFuture(Future):
+    """Merged future of a call fanned out by ``FanOutExecutor``.
+
+    Cancelling it cancels the parts that have not started. Because the merge
+    needs every part, it is also cancelled as soon as any part is (e.g. by
+    ``shutdown(cancel_futures=True)``).
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.parts: Dict[str, Future] = {}
+        self.cancel_lock = threading.Lock()
+        self.notified = False
+
+    def cancel(self) -> bool:
+        for part in self.parts.values():
+            part.cancel()
+        if not any(part.cancelled() for part in self.parts.values()):
+            return False  # Every part is already running or done
+        with self.cancel_lock:
+            if not super().cancel():
+                return False
+            # Wake up wait() callers, as an executor does for the futures it cancels
+            if not self.notified:
+                self.notified = True
+                self.set_running_or_notify_cancel()
+        return True
+
+
+class FanOutExecutor(Executor):
+    """Runs every submitted call once per keyed executor and merges the results.
+
+    ``submit(fn, item)`` calls ``fn(item, key)`` on each executor at the same
+    time and returns one future that resolves to ``merge(item, {key: result})``
+    once all of them are done, so ``run_windowed`` can treat a multi-source
+    check like a single task while each source keeps its own pool size.
+    """
+
+    def __init__(self, executors: Dict[str, Executor], merge: Callable):
+        self.executors = executors
+        self.merge = merge
+
+    def submit(self, fn, item, *args, **kwargs) -> Future:
+        combined = FanOutFuture()
+        parts = combined.parts
+        lock = threading.Lock()
+
+        def part_done(part: Future):
+            if part.cancelled():
+                combined.cancel()
+                return
+            with lock:
+                if combined.done() or not all(part.done() for part in parts.values()):
+                    return
+                try:
+                    try:
+                        result = self.merge(item, {key: part.result() for key, part in parts.items()})
+                    except Exception as e:
+                        combined.set_exception(e)
+                    else:
+                        combined.set_result(result)
+                except InvalidStateError:
+                    pass  # Cancelled meanwhile
+
+        # Submit every part before any callback can see an incomplete dict
+        with lock:
+            for key, executor in self.executors.items():
+                parts[key] = executor.submit(fn, item, key, *args, **kwargs)
+        for part in parts.values():
+            part.add_done_callback(part_done)
+        return combined
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        for executor in self.executors.values():
+            executor.shutdown(wait=wait, cancel_futures=cancel_futures)
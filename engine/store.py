@@ -0,0 +1,161 @@
+import json
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterator, Optional, Tuple
+from engine.names import canonical_name
+
+# Seconds a write waits for another process holding the database (workers sharing one file)
+BUSY_TIMEOUT = 60.0
+
+_UPSERT = (
+    "INSERT OR REPLACE INTO name_status (name, source, status, available, timestamp, error)"
+    " VALUES (?, ?, ?, ?, ?, ?)"
+)
+
+
+class ProgressStore:
+    """SQLite-backed name status store, written one result at a time.
+
+    Rows are keyed by canonical name (see ``engine.names.canonical_name``) and
+    source, so a name can be tracked separately on OSRS and RS3.
+
+    Replaces rewriting the whole ``progress.json`` on every save: results are
+    kept in memory until ``flush()`` writes them as ``INSERT OR REPLACE`` rows
+    on an indexed table in WAL mode, in one short transaction. No write
+    transaction stays open between flushes, so several processes (e.g. sweep
+    workers) can share one file. Opening the store does not read the history,
+    lookups go straight to the primary key.
+    """
+
+    def __init__(self, path: str = "progress.db"):
+        self.path = path
+        self.lock = threading.Lock()
+        self.pending: Dict[Tuple[str, str], Tuple] = {}  # {(name, source): row} written on the next flush
+        self.conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT, check_same_thread=False)
+        self.conn.execute(f"PRAGMA busy_timeout={int(BUSY_TIMEOUT * 1000)}")
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS name_status ("
+            " name TEXT NOT NULL,"
+            " source TEXT NOT NULL,"
+            " status TEXT NOT NULL,"
+            " available INTEGER,"
+            " timestamp TEXT,"
+            " error TEXT,"
+            " PRIMARY KEY (name, source))"
+        )
+        self.conn.commit()
+
+    @staticmethod
+    def _to_info(row: Tuple) -> dict:
+        status, available, source, timestamp, error = row
+        return {
+            'status': status,
+            'available': None if available is None else bool(available),
+            'source': source,
+            'timestamp': timestamp,
+            'error': error,
+        }
+
+    def get(self, name: str, source: str) -> Optional[dict]:
+        """Return the stored status of a name on a source, or None if it was never checked."""
+        with self.lock:
+            pending = self.pending.get((name, source))
+            if pending is not None:
+                _, source, status, available, timestamp, error = pending
+                return self._to_info((status, available, source, timestamp, error))
+            row = self.conn.execute(
+                "SELECT status, available, source, timestamp, error FROM name_status WHERE name = ? AND source = ?",
+                (name, source),
+            ).fetchone()
+        return self._to_info(row) if row else None
+
+    def put(self, name: str, info: dict):
+        """Record the status of a name on ``info['source']``; it is written on the next flush()."""
+        available = info.get('available')
+        source = info.get('source') or ''
+        with self.lock:
+            self.pending[(name, source)] = (
+                name,
+                source,
+                info.get('status', 'pending'),
+                None if available is None else int(available),
+                info.get('timestamp'),
+                info.get('error'),
+            )
+
+    def flush(self):
+        """Write everything recorded since the last flush in one transaction.
+
+        If the database stays locked by another process longer than
+        ``BUSY_TIMEOUT``, the rows are kept for the next flush and the error
+        is raised.
+        """
+        with self.lock:
+            if not self.pending:
+                return
+            rows, self.pending = self.pending, {}
+            try:
+                with self.conn:
+                    self.conn.executemany(_UPSERT, rows.values())
+            except sqlite3.Error:
+                # Results recorded while this flush failed are newer
+                rows.update(self.pending)
+                self.pending = rows
+                raise
+
+    def items(self) -> Iterator[Tuple[str, dict]]:
+        """Iterate over all stored ``(name, info)`` pairs without loading them at once."""
+        self.flush()
+        # A separate connection reads a consistent snapshot while workers keep writing
+        conn = sqlite3.connect(self.path)
+        try:
+            for row in conn.execute("SELECT name, status, available, source, timestamp, error FROM name_status"):
+                yield row[0], self._to_info(row[1:])
+        finally:
+            conn.close()
+
+    def counts(self) -> Dict[str, int]:
+        """Return the number of stored names per status."""
+        self.flush()
+        with self.lock:
+            rows = self.conn.execute("SELECT status, COUNT(*) FROM name_status GROUP BY status").fetchall()
+        return dict(rows)
+
+    def __len__(self) -> int:
+        self.flush()
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM name_status").fetchone()[0]
+
+    def clear(self):
+        """Remove every stored name."""
+        with self.lock:
+            self.pending.clear()
+            self.conn.execute("DELETE FROM name_status")
+            self.conn.commit()
+
+    def import_json(self, json_path: str) -> int:
+        """Import a legacy ``progress.json`` file and return the number of names imported."""
+        with open(json_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        name_status = data.get('name_status', {})
+        for name, info in name_status.items():
+            self.put(canonical_name(name), info)
+        self.flush()
+        return len(name_status)
+
+    def close(self):
+        self.flush()
+        with self.lock:
+            self.conn.close()
+
+
+def migrate_legacy_progress(store: ProgressStore, json_path: str) -> int:
+    """One-time import of ``progress.json``; the file is renamed so it is not imported again."""
+    if not os.path.exists(json_path):
+        return 0
+    imported = store.import_json(json_path)
+    os.replace(json_path, json_path + ".imported")
+    return imported
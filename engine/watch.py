@@ -0,0 +1,293 @@
+import hashlib
+import heapq
+import json
+import math
+import os
+import threading
+import time
+import urllib.request
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from engine.cache import parse_duration
+from engine.checker import NameChecker, merge_source_results, source_list
+from engine.names import canonical_name, validate_name
+
+# Names whose check failed are tried again after this long (or their interval, if shorter)
+ERROR_RECHECK = 5 * 60
+
+
+class WatchEntry(NamedTuple):
+    """A watched name, how often to check it and when it is next due (``time.time()``)."""
+
+    name: str
+    interval: float
+    due: float
+
+
+def read_watchlist(path: str, default_interval: float) -> Dict[str, Tuple[str, float]]:
+    """Read a watchlist into {canonical name: (name, interval)}.
+
+    One name per line, optionally followed by its own interval after a comma
+    ("zezima,1h"); other names use ``default_interval``. Blank lines and lines
+    starting with "#" are ignored, as are invalid names.
+    """
+    watchlist = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            name, interval = line, default_interval
+            if "," in line:
+                name, _, spec = line.rpartition(",")
+                interval = parse_duration(spec)
+            if interval <= 0:
+                raise ValueError(f"interval must be positive: {line!r}")
+            name = name.strip()
+            if validate_name(name) is None:
+                watchlist[canonical_name(name)] = (name, interval)
+    return watchlist
+
+
+def phase(name: str) -> float:
+    """Fixed position of a name within its interval, in [0, 1)."""
+    digest = hashlib.blake2b(canonical_name(name).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little") / 2 ** 64
+
+
+def next_due(name: str, interval: float, last_checked: Optional[float], now: float) -> float:
+    """When a name should be checked next.
+
+    Every name gets a fixed slot in each interval (``phase``), so names with
+    the same interval are spread evenly over it instead of all coming due
+    together. The next slot is at least half an interval after the last
+    check. Names never checked are due right away.
+    """
+    if last_checked is None:
+        return now
+    offset = phase(name) * interval
+    slot = math.ceil((last_checked + interval / 2 - offset) / interval)
+    return slot * interval + offset
+
+
+class EventSink:
+    """Delivers watch events as JSON lines to a file and/or as POSTs to a webhook."""
+
+    def __init__(self, path: Optional[str] = None, webhook: Optional[str] = None, timeout: float = 5.0):
+        self.webhook = webhook
+        self.timeout = timeout
+        self.lock = threading.Lock()
+        self.file = open(path, 'a', encoding='utf-8', buffering=1) if path else None
+
+    def emit(self, event: dict):
+        line = json.dumps(event, ensure_ascii=False)
+        with self.lock:
+            if self.file:
+                self.file.write(line + "\n")
+        if self.webhook:
+            request = urllib.request.Request(
+                self.webhook, data=line.encode("utf-8"), headers={"Content-Type": "application/json"}, method="POST",
+            )
+            with urllib.request.urlopen(request, timeout=self.timeout):
+                pass
+
+    def close(self):
+        with self.lock:
+            if self.file:
+                self.file.close()
+                self.file = None
+
+
+class WatchMonitor:
+    """Re-checks a watchlist on a schedule and reports names that become available.
+
+    Each name is checked once per its interval through the checker's
+    ``check_single_name`` (sharing its rate limiter, retries and circuit
+    breaker), results go to the progress store like any other run, and an
+    event is emitted when a name that was not available before is now. The
+    last check time comes from the progress store, so a restarted monitor
+    carries on where it stopped. The watchlist file is re-read when it changes.
+    """
+
+    def __init__(
+        self,
+        checker: NameChecker,
+        watchlist_file: str,
+        source: str,
+        default_interval: float,
+        events: EventSink,
+        reload_interval: float = 30.0,
+    ):
+        self.checker = checker
+        self.watchlist_file = watchlist_file
+        self.source = source
+        self.sources = source_list(source)
+        self.default_interval = default_interval
+        self.events = events
+        self.reload_interval = reload_interval
+        self.entries: Dict[str, WatchEntry] = {}
+        self.available: Dict[str, Optional[bool]] = {}  # Last known availability per canonical name
+        self.queue: List[Tuple[float, str]] = []  # (due, canonical); stale entries are skipped
+        self.loaded_mtime: Optional[float] = None
+        self.next_reload = 0.0
+
+    def last_state(self, canonical: str) -> Tuple[Optional[float], Optional[bool]]:
+        """Time of the last complete check of a name and its availability, from the store."""
+        infos = [self.checker.cache.get(canonical, source) for source in self.sources]
+        if any(info is None or info['status'] != 'checked' or not info.get('timestamp') for info in infos):
+            return None, None
+        checked = min(datetime.fromisoformat(info['timestamp']).timestamp() for info in infos)
+        if any(info['available'] is False for info in infos):
+            return checked, False
+        return checked, True
+
+    def schedule(self, canonical: str, name: str, interval: float, due: float):
+        self.entries[canonical] = WatchEntry(name, interval, due)
+        heapq.heappush(self.queue, (due, canonical))
+
+    def reload(self, now: float):
+        """Re-read the watchlist if the file changed: add new names, drop removed ones.
+
+        Raises ``OSError`` or ``ValueError`` for a missing or invalid file,
+        leaving the loaded names as they were.
+        """
+        self.next_reload = now + self.reload_interval
+        mtime = os.path.getmtime(self.watchlist_file)
+        if mtime == self.loaded_mtime:
+            return
+        watchlist = read_watchlist(self.watchlist_file, self.default_interval)
+        self.loaded_mtime = mtime
+
+        for canonical in set(self.entries) - set(watchlist):
+            del self.entries[canonical]
+            self.available.pop(canonical, None)
+        for canonical, (name, interval) in watchlist.items():
+            entry = self.entries.get(canonical)
+            if entry is not None and entry.interval == interval:
+                continue
+            last_checked, available = self.last_state(canonical)
+            self.available.setdefault(canonical, available)
+            self.schedule(canonical, name, interval, next_due(name, interval, last_checked, now))
+
+        # Each name costs one request per source per interval
+        needed = sum(len(self.sources) / entry.interval for entry in self.entries.values())
+        rate = self.checker.rate_limiter.rate
+        self.checker.on_log(f"[info] Watching {len(self.entries)} names ({needed:.3g} requests/s of {rate:g} allowed)")
+        if needed > rate:
+            self.checker.on_log("[warning] The watchlist needs more requests than the rate limit allows; checks will run late")
+
+    def check(self, name: str) -> dict:
+        """Check a name on every watched source, merging the results if there are several."""
+        parts = {source: self.checker.check_single_name(name, source) for source in self.sources}
+        if len(parts) == 1:
+            return parts[self.sources[0]]
+        return merge_source_results(name, self.source, parts)
+
+    def finished(self, canonical: str, result_dict: dict, now: float):
+        """Record a result, emit an event on a flip to available and schedule the next check."""
+        entry = self.entries.get(canonical)
+        if result_dict.get('outcome') == 'cancelled':
+            return
+        self.checker.record_result(result_dict)
+
+        if result_dict['status'] == 'checked':
+            previous = self.available.get(canonical)
+            self.available[canonical] = result_dict['available']
+            if result_dict['available'] is True and previous is not True:
+                self.emit(result_dict, previous)
+        if entry is None:
+            return  # Removed from the watchlist while it was being checked
+
+        if result_dict['status'] == 'checked':
+            self.schedule(canonical, entry.name, entry.interval, next_due(entry.name, entry.interval, now, now))
+        else:
+            self.retry_later(canonical, now)
+
+    def retry_later(self, canonical: str, now: float):
+        """Schedule a name whose check failed to be tried again after ``ERROR_RECHECK``."""
+        entry = self.entries.get(canonical)
+        if entry is not None:
+            self.schedule(canonical, entry.name, entry.interval, now + min(entry.interval, ERROR_RECHECK))
+
+    def emit(self, result_dict: dict, previous: Optional[bool]):
+        event = {
+            'event': 'available',
+            'name': result_dict['name'],
+            'source': result_dict['source'],
+            'previous': {True: 'available', False: 'taken'}.get(previous, 'unknown'),
+            'checked_at': datetime.now().isoformat(timespec='seconds'),
+        }
+        self.checker.on_log(f"[watch] {result_dict['name']} is now available on {result_dict['source']} (was {event['previous']})")
+        self.checker.logger.info(f"Watched name became available: {result_dict['name']} ({result_dict['source']})")
+        try:
+            self.events.emit(event)
+        except Exception as e:
+            self.checker.on_log(f"[error] Could not deliver event for {result_dict['name']}: {e}")
+            self.checker.logger.error(f"Event delivery failed for {result_dict['name']}: {e}")
+
+    def run(self):
+        """Check due names until the checker is stopped.
+
+        A watchlist that cannot be read at start raises; later, a broken or
+        missing file is logged and the names already loaded keep being watched.
+        """
+        checker = self.checker
+        stop_event = checker.stop_event
+        window = checker.max_workers * 2
+        checker.start_search()
+        try:
+            self.reload(time.time())
+            with ThreadPoolExecutor(max_workers=checker.max_workers) as executor:
+                # Registered so checker.stop() cancels queued checks
+                with checker.executor_lock:
+                    checker.active_executor = executor
+                pending: Dict[Future, str] = {}
+                try:
+                    while not stop_event.is_set():
+                        now = time.time()
+                        if now >= self.next_reload:
+                            try:
+                                self.reload(now)
+                            except (OSError, ValueError) as e:
+                                # Keep watching the names already loaded; the file is read again next time
+                                checker.on_log(f"[error] Could not reload {self.watchlist_file}: {e}")
+                                checker.logger.error(f"Watchlist reload failed: {e}")
+
+                        # Hand out due names, skipping queue entries replaced by a later schedule
+                        while self.queue and self.queue[0][0] <= now and len(pending) < window:
+                            due, canonical = heapq.heappop(self.queue)
+                            entry = self.entries.get(canonical)
+                            if entry is None or entry.due != due:
+                                continue
+                            pending[executor.submit(self.check, entry.name)] = canonical
+
+                        # Sleep until the next name is due, a check finishes or the file is re-read
+                        timeout = self.next_reload - now
+                        if self.queue:
+                            timeout = min(timeout, self.queue[0][0] - now)
+                        timeout = max(0.0, min(timeout, 1.0))
+                        if not pending:
+                            stop_event.wait(timeout)
+                            continue
+                        done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            canonical = pending.pop(future)
+                            if future.cancelled():
+                                continue
+                            try:
+                                self.finished(canonical, future.result(), time.time())
+                            except Exception as e:
+                                checker.on_log(f"[error] {canonical}: {e}")
+                                checker.logger.error(f"Exception processing watch result for {canonical}: {e}")
+                                # Still watched: try it again later instead of dropping it
+                                self.retry_later(canonical, time.time())
+                except KeyboardInterrupt:
+                    # Cancel the queued checks before leaving the executor waits for the running ones
+                    checker.stop()
+        finally:
+            with checker.executor_lock:
+                checker.active_executor = None
+            checker.save_progress()
+            checker.hiscores.close()
+            checker.end_search()
@@ -0,0 +1,69 @@
+import queue
+
+# Flush 15 times per second: smooth enough to read, cheap for the Tk event loop
+FLUSH_INTERVAL_MS = 66
+
+
+class UISink:
+    """Thread-safe buffer between the checker and the GUI widgets.
+
+    Worker threads only put items on a queue; the Tk thread drains it at a
+    fixed rate and applies one insert per widget per flush, instead of one
+    ``root.after`` callback per log line, result and progress update.
+    """
+
+    def __init__(self, root, logs_text, results_text, progress_label, max_log_lines=1000, interval_ms=FLUSH_INTERVAL_MS):
+        self.root = root
+        self.logs_text = logs_text
+        self.results_text = results_text
+        self.progress_label = progress_label
+        self.max_log_lines = max_log_lines
+        self.interval_ms = interval_ms
+        self.queue = queue.SimpleQueue()
+        # Lines currently in logs_text, tracked so trimming never has to count them
+        self.log_lines = int(logs_text.index('end-1c').split('.')[0])
+
+    def log(self, message):
+        self.queue.put(('log', message))
+
+    def result(self, name):
+        self.queue.put(('result', name))
+
+    def progress(self, text):
+        self.queue.put(('progress', text))
+
+    def start(self):
+        """Start the periodic flush on the Tk event loop."""
+        self.root.after(self.interval_ms, self._flush)
+
+    def _flush(self):
+        logs, results, progress = [], [], None
+        try:
+            while True:
+                kind, value = self.queue.get_nowait()
+                if kind == 'log':
+                    logs.append(value)
+                elif kind == 'result':
+                    results.append(value)
+                else:
+                    progress = value  # Only the latest progress text matters
+        except queue.Empty:
+            pass
+
+        try:
+            if logs:
+                # Lines that would be trimmed right away are never inserted
+                logs = logs[-self.max_log_lines:]
+                self.logs_text.insert("end", "\n".join(logs) + "\n")
+                self.log_lines += len(logs)
+                excess = self.log_lines - self.max_log_lines
+                if excess > 0:
+                    self.logs_text.delete('1.0', f'{excess + 1}.0')
+                    self.log_lines -= excess
+            if results:
+                self.results_text.insert("end", "\n".join(results) + "\n")
+            if progress is not None:
+                self.progress_label.configure(text=progress)
+        finally:
+            # One failed update must not stop every later one
+            self.root.after(self.interval_ms, self._flush)
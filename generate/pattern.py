@@ -0,0 +1,391 @@
+import string
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from engine.names import canonical_name, validate_name
+
+# Placeholders that need no list file
+BUILTIN_LISTS = {
+    'letter': string.ascii_lowercase,
+    'digit': string.digits,
+    'alnum': string.ascii_lowercase + string.digits,
+    'vowel': "aeiou",
+    'consonant': "bcdfghjklmnpqrstvwxyz",
+    'sep': "_",
+}
+
+# Space, "_" and "-" are one character to RuneScape (see engine.names)
+_FOLD = str.maketrans(" -", "__")
+
+# Longest legal RuneScape name
+MAX_NAME_LENGTH = 12
+
+
+class PatternError(ValueError):
+    pass
+
+
+# {(length, made of separators only): strings of that shape}
+Shapes = Dict[Tuple[int, bool], int]
+
+
+def _shape_of(text: str) -> Optional[Tuple[int, bool]]:
+    """Shape of a string for ``Node.shapes``, or None if no name can contain it."""
+    if not all(char.isalnum() or char.isspace() or char in "_-" for char in text):
+        return None
+    return len(text), all(char in "_- " for char in text)
+
+
+class Node(ABC):
+    """Part of a parsed pattern that can count and lazily spell out its strings."""
+
+    def expand(self) -> Iterator[str]:
+        """Every string of this node, in order."""
+        return self.expand_from(0)
+
+    @abstractmethod
+    def size(self) -> int:
+        """Number of strings ``expand`` yields, invalid and repeated ones included."""
+
+    @abstractmethod
+    def expand_from(self, index: int) -> Iterator[str]:
+        """The strings of this node from the one at ``index`` on, without spelling the earlier ones."""
+
+    @abstractmethod
+    def lengths(self) -> Set[int]:
+        """Every length the strings of this node can have."""
+
+    @abstractmethod
+    def shapes(self) -> Shapes:
+        """How many strings of each length and separators-only flag this node spells.
+
+        Strings with a character no name may contain are left out, so the
+        names ``validate_name`` accepts can be counted without expanding.
+        """
+
+    @abstractmethod
+    def unique(self) -> bool:
+        """Whether no two of the strings are the same name."""
+
+
+class Choice(Node):
+    """One of a list of strings: a literal, a character class or a word list.
+
+    Options are deduplicated canonically, so ``[ _-]`` or ``[aA]`` spell a
+    single name each.
+    """
+
+    def __init__(self, options: Iterable[str]):
+        seen = {}
+        for option in options:
+            seen.setdefault(option.lower().translate(_FOLD), option)
+        self.options = list(seen.values())
+
+    def __len__(self) -> int:
+        return len(self.options)
+
+    def size(self) -> int:
+        return len(self.options)
+
+    def expand_from(self, index: int) -> Iterator[str]:
+        return iter(self.options[index:])
+
+    def lengths(self) -> Set[int]:
+        return {len(option) for option in self.options}
+
+    def shapes(self) -> Shapes:
+        shapes: Shapes = {}
+        for option in self.options:
+            shape = _shape_of(option)
+            if shape is not None:
+                shapes[shape] = shapes.get(shape, 0) + 1
+        return shapes
+
+    def unique(self) -> bool:
+        return True
+
+
+class Sequence(Node):
+    """Every concatenation of one string from each part, in order."""
+
+    def __init__(self, parts: List[Node]):
+        self.parts = parts
+
+    def size(self) -> int:
+        count = 1
+        for part in self.parts:
+            count *= part.size()
+        return count
+
+    def expand_from(self, index: int) -> Iterator[str]:
+        if index >= self.size():
+            return iter(())
+        # Mixed-radix digits of the index, the last part varying fastest
+        starts = []
+        for part in reversed(self.parts):
+            index, digit = divmod(index, part.size())
+            starts.append(digit)
+        return self._expand(0, starts[::-1])
+
+    def _expand(self, position: int, starts: Optional[List[int]]) -> Iterator[str]:
+        if position == len(self.parts):
+            yield ""
+            return
+        # Re-expanding the tail for every head keeps memory flat for any size;
+        # only the first head resumes its tail mid-way
+        first = starts[position] if starts else 0
+        for head in self.parts[position].expand_from(first):
+            for tail in self._expand(position + 1, starts):
+                yield head + tail
+            starts = None
+
+    def lengths(self) -> Set[int]:
+        totals = {0}
+        for part in self.parts:
+            totals = {total + length for total in totals for length in part.lengths()}
+        return totals
+
+    def shapes(self) -> Shapes:
+        totals: Shapes = {(0, True): 1}
+        for part in self.parts:
+            combined: Shapes = {}
+            for (length, only_separators), count in totals.items():
+                for (part_length, part_only_separators), part_count in part.shapes().items():
+                    shape = (length + part_length, only_separators and part_only_separators)
+                    combined[shape] = combined.get(shape, 0) + count * part_count
+            totals = combined
+        return totals
+
+    def unique(self) -> bool:
+        # Two parts of varying length can split one name two ways ("ab"+"c", "a"+"bc")
+        varying = sum(1 for part in self.parts if len(part.lengths()) > 1)
+        return varying <= 1 and all(part.unique() for part in self.parts)
+
+
+class Alternation(Node):
+    """The strings of every branch, one branch after another."""
+
+    def __init__(self, branches: List[Node]):
+        self.branches = branches
+
+    def size(self) -> int:
+        return sum(branch.size() for branch in self.branches)
+
+    def expand_from(self, index: int) -> Iterator[str]:
+        for branch in self.branches:
+            size = branch.size()
+            if index < size:
+                yield from branch.expand_from(index)
+                index = 0
+            else:
+                index -= size
+
+    def lengths(self) -> Set[int]:
+        return set().union(*(branch.lengths() for branch in self.branches))
+
+    def shapes(self) -> Shapes:
+        shapes: Shapes = {}
+        for branch in self.branches:
+            for shape, count in branch.shapes().items():
+                shapes[shape] = shapes.get(shape, 0) + count
+        return shapes
+
+    def unique(self) -> bool:
+        # Branches may overlap unless they never have a length in common
+        lengths: Set[int] = set()
+        for branch in self.branches:
+            if not branch.unique() or lengths & branch.lengths():
+                return False
+            lengths |= branch.lengths()
+        return True
+
+
+def repeat(node: Node, low: int, high: int) -> Node:
+    """``node`` repeated ``low`` to ``high`` times (shortest first)."""
+    branches = [Sequence([node] * times) for times in range(low, high + 1)]
+    return branches[0] if len(branches) == 1 else Alternation(branches)
+
+
+class Parser:
+    """Recursive descent parser of the pattern language (see ``Pattern``)."""
+
+    def __init__(self, text: str, lists: Dict[str, List[str]]):
+        self.text = text
+        self.lists = lists
+        self.pos = 0
+
+    def error(self, message: str) -> PatternError:
+        return PatternError(f"{message} at position {self.pos + 1} of {self.text!r}")
+
+    def peek(self) -> Optional[str]:
+        return self.text[self.pos] if self.pos < len(self.text) else None
+
+    def take(self) -> str:
+        char = self.text[self.pos]
+        self.pos += 1
+        return char
+
+    def parse(self) -> Node:
+        node = self.alternation()
+        if self.peek() is not None:
+            raise self.error(f"unexpected {self.peek()!r}")
+        return node
+
+    def alternation(self) -> Node:
+        branches = [self.sequence()]
+        while self.peek() == "|":
+            self.take()
+            branches.append(self.sequence())
+        if len(branches) == 1:
+            return branches[0]
+        # Plain words ("(x|xx|xxx)") are folded into one deduplicated choice
+        if all(isinstance(branch, Choice) and len(branch) == 1 for branch in branches):
+            return Choice(branch.options[0] for branch in branches)
+        return Alternation(branches)
+
+    def sequence(self) -> Node:
+        parts: List[Node] = []
+        while self.peek() not in (None, "|", ")"):
+            atom = self.quantified(self.atom())
+            # Adjacent literals merge, so "zezima" is one choice instead of six
+            if (
+                parts and isinstance(atom, Choice) and len(atom) == 1
+                and isinstance(parts[-1], Choice) and len(parts[-1]) == 1
+            ):
+                parts[-1] = Choice([parts[-1].options[0] + atom.options[0]])
+            else:
+                parts.append(atom)
+        if len(parts) == 1:
+            return parts[0]
+        return Sequence(parts) if parts else Choice([""])
+
+    def atom(self) -> Node:
+        char = self.take()
+        if char == "(":
+            node = self.alternation()
+            if self.peek() != ")":
+                raise self.error("missing )")
+            self.take()
+            return node
+        if char == "[":
+            return Choice(self.char_class())
+        if char == "{":
+            name = self.until("}")
+            if name not in self.lists and name not in BUILTIN_LISTS:
+                known = ", ".join(sorted(set(BUILTIN_LISTS) | set(self.lists)))
+                raise self.error(f"unknown list {{{name}}} (known: {known})")
+            return Choice(self.lists[name] if name in self.lists else BUILTIN_LISTS[name])
+        if char == "\\":
+            if self.peek() is None:
+                raise self.error("nothing to escape")
+            return Choice([self.take()])
+        if char in "?*+]}":
+            raise self.error(f"unexpected {char!r}")
+        return Choice([char])
+
+    def quantified(self, node: Node) -> Node:
+        """Apply a following "?" or "{m}" / "{m,n}" to an atom."""
+        if self.peek() == "?":
+            self.take()
+            return repeat(node, 0, 1)
+        if self.peek() == "{" and self.text[self.pos + 1:self.pos + 2].isdigit():
+            self.take()
+            low, _, high = self.until("}").partition(",")
+            try:
+                low, high = int(low), int(high) if high else int(low)
+            except ValueError:
+                raise self.error("invalid repeat count")
+            if not 0 <= low <= high <= MAX_NAME_LENGTH:
+                raise self.error(f"repeat counts must be between 0 and {MAX_NAME_LENGTH}")
+            return repeat(node, low, high)
+        return node
+
+    def until(self, end: str) -> str:
+        start = self.pos
+        while self.peek() not in (None, end):
+            self.take()
+        if self.peek() is None:
+            raise self.error(f"missing {end}")
+        self.take()
+        return self.text[start:self.pos - 1]
+
+    def char_class(self) -> List[str]:
+        start = self.pos
+        while self.peek() not in (None, "]"):
+            self.take()
+        if self.peek() is None:
+            raise self.error("missing ]")
+        spec = self.text[start:self.pos]
+        self.take()
+        if not spec:
+            raise self.error("empty character class")
+        # Same syntax as the sweep character sets
+        from generate.sweep import parse_charset
+
+        return list(parse_charset(spec))
+
+
+class Pattern:
+    """A compact pattern describing a set of names, expanded lazily.
+
+    Syntax (case-insensitive, like names):
+
+    - ``abc``: literal characters; ``\\`` escapes a special character
+    - ``[a-z0-9]``: one character of a class, with ranges
+    - ``{letter}``, ``{digit}``, ``{alnum}``, ``{vowel}``, ``{consonant}``,
+      ``{sep}``: built-in classes; ``{word}`` or any other name: one entry of
+      a list passed in ``lists`` (e.g. a dictionary file)
+    - ``x?``: optional; ``x{3}`` / ``x{1,3}``: repeated
+    - ``(a|b)``: either branch
+
+    ``len(pattern)`` is known before anything is generated and leaves out
+    strings ``validate_name`` rejects, such as an empty ``x?`` or a name of
+    separators only. Names that are spelled more than once (see ``unique``)
+    are only yielded once.
+    """
+
+    def __init__(self, text: str, lists: Optional[Dict[str, List[str]]] = None):
+        self.text = text
+        self.root = Parser(text.lower(), {name: list(words) for name, words in (lists or {}).items()}).parse()
+        lengths = self.root.lengths()
+        if max(lengths) > MAX_NAME_LENGTH:
+            raise PatternError(f"{text!r} spells names longer than {MAX_NAME_LENGTH} characters")
+        self.unique = self.root.unique()
+        self.total = sum(
+            count for (length, only_separators), count in self.root.shapes().items()
+            if 1 <= length <= MAX_NAME_LENGTH and not only_separators
+        )
+
+    def __len__(self) -> int:
+        """Number of valid names the pattern spells (an upper bound when it is not ``unique``)."""
+        return self.total
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield every valid name once, without building the list."""
+        for name, _ in self.iter_from(0):
+            yield name
+
+    def iter_from(self, position: int) -> Iterator[Tuple[str, int]]:
+        """Yield ``(name, position after it)`` for the valid names from expansion ``position`` on.
+
+        Positions count every expansion, invalid and repeated ones included,
+        so resuming at one skips straight to it instead of spelling and
+        validating everything before. A name spelled more than once can come
+        up again after a resume, since only one pass remembers what it yielded.
+        """
+        # Only ambiguous patterns need to remember what was already yielded
+        seen: Optional[Set[str]] = None if self.unique else set()
+        for position, name in enumerate(self.root.expand_from(position), start=position + 1):
+            if validate_name(name) is not None:
+                continue
+            if seen is not None:
+                canonical = canonical_name(name)
+                if canonical in seen:
+                    continue
+                seen.add(canonical)
+            yield name, position
+
+
+def read_list(path: str) -> List[str]:
+    """Read a word list for a pattern placeholder, one entry per line."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
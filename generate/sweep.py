@@ -0,0 +1,189 @@
+import json
+import os
+import string
+from functools import lru_cache
+from typing import Iterator, Optional, Tuple
+
+DEFAULT_CHARSET = string.ascii_lowercase + string.digits
+
+# Space, "_" and "-" are the same character to RuneScape (see engine.names),
+# so sweeping more than one of them would check every name several times
+DEFAULT_SEPARATORS = "_"
+
+
+def parse_charset(spec: str) -> str:
+    """Expand a character set such as "a-z0-9" into its characters (duplicates removed)."""
+    chars = []
+    i = 0
+    while i < len(spec):
+        if i + 2 < len(spec) and spec[i + 1] == "-":
+            chars.extend(chr(c) for c in range(ord(spec[i]), ord(spec[i + 2]) + 1))
+            i += 3
+        else:
+            chars.append(spec[i])
+            i += 1
+    return "".join(dict.fromkeys(chars))
+
+
+class NameSpace:
+    """Every legal name over a character set and length range, in a fixed order.
+
+    Separators may not start or end a name and may not follow each other.
+    Names are numbered from 0 to ``len(space) - 1`` (shorter names first), so a
+    sweep can be resumed from a saved index and split into index ranges.
+    """
+
+    def __init__(
+        self,
+        charset: str = DEFAULT_CHARSET,
+        min_length: int = 1,
+        max_length: int = 3,
+        separators: str = DEFAULT_SEPARATORS,
+    ):
+        if not 1 <= min_length <= max_length <= 12:
+            raise ValueError("lengths must satisfy 1 <= min_length <= max_length <= 12")
+        if not charset:
+            raise ValueError("charset must not be empty")
+        self.charset = charset
+        self.min_length = min_length
+        self.max_length = max_length
+        self.separators = separators
+        self._completions = lru_cache(maxsize=None)(self._count_completions)
+
+    def _count_completions(self, remaining: int, after_separator: bool) -> int:
+        """Number of ways to fill ``remaining`` positions legally."""
+        if remaining == 0:
+            # A name may not end with a separator
+            return 0 if after_separator else 1
+        count = len(self.charset) * self._completions(remaining - 1, False)
+        if not after_separator:
+            count += len(self.separators) * self._completions(remaining - 1, True)
+        return count
+
+    def count_length(self, length: int) -> int:
+        """Number of legal names of exactly ``length`` characters."""
+        # Starting "after a separator" forbids a separator in the first position
+        return self._completions(length, True)
+
+    def __len__(self) -> int:
+        return sum(self.count_length(length) for length in range(self.min_length, self.max_length + 1))
+
+    def name_at(self, index: int) -> str:
+        """Return the name with the given index."""
+        if index < 0:
+            raise IndexError("name index out of range")
+        for length in range(self.min_length, self.max_length + 1):
+            count = self.count_length(length)
+            if index < count:
+                return self._unrank(length, index)
+            index -= count
+        raise IndexError("name index out of range")
+
+    def _unrank(self, length: int, index: int) -> str:
+        chars = []
+        for remaining in range(length, 0, -1):
+            # An index past the characters' block only occurs where a separator is allowed
+            block = self._completions(remaining - 1, False)
+            if index < len(self.charset) * block:
+                chars.append(self.charset[index // block])
+                index %= block
+                continue
+            index -= len(self.charset) * block
+            block = self._completions(remaining - 1, True)
+            chars.append(self.separators[index // block])
+            index %= block
+        return "".join(chars)
+
+    def iter_names(self, start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+        """Lazily yield the names with indexes ``start`` to ``stop - 1``."""
+        stop = len(self) if stop is None else min(stop, len(self))
+        for index in range(start, stop):
+            yield self.name_at(index)
+
+    def shard_range(self, shard: int, shards: int) -> Tuple[int, int]:
+        """Return the ``(start, stop)`` index range of one of ``shards`` equal slices."""
+        if not 0 <= shard < shards:
+            raise ValueError("shard must be between 0 and shards - 1")
+        total = len(self)
+        return total * shard // shards, total * (shard + 1) // shards
+
+    def to_dict(self) -> dict:
+        return {
+            'charset': self.charset,
+            'min_length': self.min_length,
+            'max_length': self.max_length,
+            'separators': self.separators,
+        }
+
+
+class Sweep:
+    """Resumable iteration over an index range of a ``NameSpace``.
+
+    ``position`` is the index of the next name to hand out. With a
+    ``cursor_file`` the position is saved every ``checkpoint_every`` names and
+    when the sweep ends, so a restarted sweep continues where it stopped.
+    """
+
+    def __init__(
+        self,
+        space: NameSpace,
+        start: int = 0,
+        stop: Optional[int] = None,
+        cursor_file: Optional[str] = None,
+        checkpoint_every: int = 100,
+    ):
+        self.space = space
+        self.start = start
+        self.stop = len(space) if stop is None else min(stop, len(space))
+        self.position = start
+        self.cursor_file = cursor_file
+        self.checkpoint_every = checkpoint_every
+
+    @classmethod
+    def resume(cls, cursor_file: str, rewind: int = 0, checkpoint_every: int = 100) -> "Sweep":
+        """Load a sweep from its cursor file.
+
+        ``rewind`` steps back over names that were handed out but may not have
+        finished before the restart; already-checked names are skipped by the
+        progress store, so rewinding only costs lookups in the store.
+        """
+        with open(cursor_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        sweep = cls(
+            NameSpace(**data['space']),
+            start=data['start'],
+            stop=data['stop'],
+            cursor_file=cursor_file,
+            checkpoint_every=checkpoint_every,
+        )
+        sweep.position = max(data['start'], data['position'] - rewind)
+        return sweep
+
+    def save(self):
+        """Write the cursor atomically so a crash never leaves a broken file."""
+        if not self.cursor_file:
+            return
+        temp_file = self.cursor_file + ".tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                'space': self.space.to_dict(),
+                'start': self.start,
+                'stop': self.stop,
+                'position': self.position,
+            }, f, indent=2)
+        os.replace(temp_file, self.cursor_file)
+
+    def __len__(self) -> int:
+        """Names left in the sweep."""
+        return self.stop - self.position
+
+    def __iter__(self) -> Iterator[str]:
+        try:
+            while self.position < self.stop:
+                name = self.space.name_at(self.position)
+                self.position += 1
+                if self.position % self.checkpoint_every == 0:
+                    self.save()
+                yield name
+        finally:
+            self.save()
@@ -1,21 +1,27 @@
-from rs3_api.hiscores import Hiscore
-from osrs_api import Hiscores
-from typing import List, Set
 import customtkinter as ctk
 import threading
 import functions.clear
 import functions.copy
 import functions.time
+from functions.ui_sink import UISink
 import generate.random
-import json
 import os
 from tkinter import filedialog
 from tkinterdnd2 import DND_FILES, TkinterDnD
-import pandas as pd
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import time
-import logging
+from engine.checker import BOTH_SOURCES, SOURCES, NameChecker, setup_logging, source_list
+from engine.export import CsvExporter, convert_export, export_columns
+from engine.ingest import count_lines
+from engine.jobs import JobRun, JobStore
+from generate.pattern import Pattern, PatternError
+
+# Entry text starting with this is a name pattern (see generate/pattern.py)
+PATTERN_PREFIX = "pattern:"
+
+# Searches run as this job (see engine/jobs.py), so an interrupted one can be resumed
+JOBS_FILE = "jobs.db"
+GUI_JOB = "gui"
+SOURCE_KEYS = {label: key for key, label in SOURCES.items()}
 
 class RunescapeNameChecker:
     def __init__(self):
@@ -36,29 +42,30 @@ class RunescapeNameChecker:
         # Ensure proper cleanup on window close
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         
-        # Initialize stop flag for thread control
-        self.stop_event = threading.Event()
-        
-        # Thread lock for shared data structures
-        self.data_lock = threading.Lock()
-        
-        # Thread lock for executor access
-        self.executor_lock = threading.Lock()
-        
-        # Track active executor for proper shutdown
-        self.active_executor = None
-        
-        # Initialize progress tracking
-        self.progress_file = "progress.json"
-        self.checked_names: Set[str] = set()
-        self.results_data = []  # Store results for export
-        self.max_workers = 5  # Number of concurrent threads
-        
-        # New: Detailed name status tracking
-        self.name_status = {}  # {name: {"status": "pending/checked/error", "available": True/False/None, "error": str, "timestamp": str}}
-        
         # Setup logging
-        self.setup_logging()
+        self.logger = setup_logging()
+        
+        # Headless checking engine; results come back through the callbacks
+        self.engine = NameChecker(
+            on_log=self.log_message,
+            on_result=self.add_result,
+            on_progress=self.update_progress,
+            keep_results=False,  # Results are streamed to the run's CSV instead
+        )
+        
+        # File loaded via button or drag & drop, streamed straight to the engine
+        self.loaded_file = None
+        self.loaded_summary = None
+
+        # CSV the running search appends every result to, so a crash keeps them;
+        # the last one is what Export Results converts
+        self.run_exporter = None
+        self.last_run_export = None
+
+        # Job of the running search, and the entry text that resumes an unfinished one
+        self.jobs = JobStore(JOBS_FILE)
+        self.job_run = None
+        self.resume_summary = None
         
         # Load progress after GUI is created (moved to end of __init__)
         
@@ -183,7 +190,7 @@ class RunescapeNameChecker:
         
         # Source Selection
         self.selection_var = ctk.StringVar(value="OSRS Hiscores")
-        self.selection_options = ["OSRS Hiscores", "RS3 Hiscores"]
+        self.selection_options = ["OSRS Hiscores", "RS3 Hiscores", BOTH_SOURCES]
         self.source_selection = ctk.CTkOptionMenu(
             self.source_frame,
             values = self.selection_options,
@@ -328,133 +335,88 @@ class RunescapeNameChecker:
 
         self.logs_text.place(x=10, y=270)
         
-        # Load progress after all widgets are created
+        # Batch log lines, results and progress into periodic UI updates
+        self.ui_sink = UISink(self.root, self.logs_text, self.guide_textbox, self.progress_label)
+        self.ui_sink.start()
+        
+        # Load progress in the background so the window shows right away
         self.load_progress()
     
-    def setup_logging(self):
-        """Setup file logging for each run."""
-        # Create logs directory if it doesn't exist
-        if not os.path.exists('logs'):
-            os.makedirs('logs')
-        
-        # Create log file with timestamp
-        log_filename = f"logs/rsn_checker_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-        
-        # Configure logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_filename, encoding='utf-8'),
-                logging.StreamHandler()  # Also print to console
-            ]
-        )
-        
-        self.logger = logging.getLogger(__name__)
-        self.logger.info("RSNChecker v1.8 started")
-        self.logger.info(f"Log file: {log_filename}")
-        
-    def check_name_availability(self, name: str, source: str):
-        """Check if a name is available on the specified platform."""
-        if source == "RS3 Hiscores":
-            try:
-                Hiscore().user(name)
-                return False
-            except Exception as e:
-                # Name not found means it's potentially available
-                error_str = str(e).lower()
-                if "not found" in error_str or "404" in error_str or "unable to find" in error_str:
-                    return True
-                else:
-                    # Network or API error - return error message
-                    return ("error", str(e)[:50])
-        elif source == "OSRS Hiscores":
-            try:
-                Hiscores(username=name)
-                return False
-            except Exception as e:
-                error_str = str(e).lower()
-                if "not found" in error_str or "404" in error_str or "unable to find" in error_str:
-                    return True
-                else:
-                    return ("error", str(e)[:50])
-
     def update_progress(self, text):
-        """Thread-safe progress label update."""
-        self.root.after(0, lambda: self.progress_label.configure(text=text))
+        """Thread-safe progress label update (applied on the next UI flush)."""
+        self.ui_sink.progress(text)
     
     def log_message(self, message):
-        """Thread-safe log insertion with line limit."""
-        def _insert():
-            self.logs_text.insert("end", message + "\n")
-            # Keep only last 1000 lines to prevent memory growth
-            lines = int(self.logs_text.index('end-1c').split('.')[0])
-            if lines > 1000:
-                self.logs_text.delete('1.0', f'{lines-1000}.0')
-        self.root.after(0, _insert)
+        """Thread-safe log insertion; the sink keeps only the last 1000 lines."""
+        self.ui_sink.log(message)
     
-    def add_result(self, name):
-        """Thread-safe result addition."""
-        self.root.after(0, lambda: self.guide_textbox.insert("end", name + "\n"))
+    def add_result(self, result_dict):
+        """Thread-safe result addition for potentially available names."""
+        exporter = self.run_exporter
+        if exporter:
+            exporter.write(result_dict)
+        if result_dict['status'] == 'checked' and result_dict['available'] is True:
+            self.ui_sink.result(result_dict['name'])
     
     def load_progress(self):
-        """Load previously checked names with detailed status."""
-        try:
-            if os.path.exists(self.progress_file):
-                with open(self.progress_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    with self.data_lock:
-                        # Load detailed name status
-                        self.name_status = data.get('name_status', {})
-                        # For backward compatibility, build checked_names set
-                        self.checked_names = {name for name, info in self.name_status.items() 
-                                             if info.get('status') == 'checked'}
-                    
-                    if self.name_status:
-                        checked_count = len(self.checked_names)
-                        error_count = sum(1 for info in self.name_status.values() if info.get('status') == 'error')
-                        self.log_message(f"{functions.time.get_time()}: Loaded progress - {checked_count} checked, {error_count} errors")
-                        self.logger.info(f"Loaded progress: {checked_count} checked, {error_count} errors")
-        except Exception as e:
-            with self.data_lock:
-                self.checked_names = set()
-                self.name_status = {}
-            self.logger.error(f"Error loading progress: {e}")
-            print(f"Error loading progress: {e}")
-    
-    def save_progress(self):
-        """Save detailed progress with name status (thread-safe)."""
+        """Load previously checked names in a background thread.
+
+        Checking is disabled until the history is loaded, so no name is
+        checked again before its earlier result is known.
+        """
+        self.search_button.configure(state="disabled")
+        self.clear_progress_button.configure(state="disabled")
+        self.update_progress("Loading history...")
+
+        def load():
+            try:
+                self.engine.load_progress()
+            finally:
+                self.root.after(0, self.progress_loaded)
+
+        threading.Thread(target=load, daemon=True).start()
+
+    def progress_loaded(self):
+        """Re-enable checking once the history is loaded (runs on the Tk thread)."""
+        self.search_button.configure(state="normal")
+        self.clear_progress_button.configure(state="normal")
+        self.update_progress("")
+        self.offer_resume()
+
+    def offer_resume(self):
+        """Put a search that did not finish in an earlier session in the entry, ready to resume."""
         try:
-            with self.data_lock:
-                name_status_copy = self.name_status.copy()
-            
-            with open(self.progress_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'name_status': name_status_copy,
-                    'last_updated': datetime.now().isoformat(),
-                    'version': '1.8'
-                }, f, indent=2, ensure_ascii=False)
-            
-            self.logger.info(f"Progress saved: {len(name_status_copy)} names tracked")
+            info = next((info for info in self.jobs.list() if info['job'] == GUI_JOB), None)
         except Exception as e:
-            self.logger.error(f"Error saving progress: {e}")
-            print(f"Error saving progress: {e}")
+            self.logger.error(f"Could not read jobs: {e}")
+            return
+        if info is None or info['state'] == "done":
+            return
+        self.selection_var.set(SOURCES[info['source']])
+        self.resume_summary = f"⏯ Unfinished search ({info['done']:,} names checked)"
+        self.name_entry.delete(0, "end")
+        self.name_entry.insert(0, self.resume_summary)
+        self.log_message("[info] The last search did not finish; press Check to resume it")
     
     def clear_progress(self):
         """Clear progress file and checked names."""
         try:
-            with self.data_lock:
-                self.checked_names = set()
-                self.name_status = {}
-            if os.path.exists(self.progress_file):
-                os.remove(self.progress_file)
+            self.engine.clear_progress()
             self.log_message(f"{functions.time.get_time()}: Progress cleared")
-            self.logger.info("Progress cleared by user")
         except Exception as e:
             error_msg = f"[error] Failed to clear progress: {str(e)}"
             self.log_message(error_msg)
             self.logger.error(error_msg)
     
+    def attach_file(self, file_path: str) -> int:
+        """Feed a names file to the checker directly and show only a summary in the entry."""
+        line_count = count_lines(file_path)
+        self.loaded_file = file_path
+        self.loaded_summary = f"📄 {os.path.basename(file_path)} ({line_count:,} lines)"
+        self.name_entry.delete(0, "end")
+        self.name_entry.insert(0, self.loaded_summary)
+        return line_count
+    
     def load_file(self):
         """Load usernames from a text file."""
         try:
@@ -474,17 +436,9 @@ class RunescapeNameChecker:
                 self.logger.error(error_msg)
                 return
                 
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                # Replace newlines with commas
-                names = content.replace('\n', ',').replace('\r', '')
-                self.name_entry.delete(0, "end")
-                self.name_entry.insert(0, names)
-                
-                # Count names
-                name_count = len([n.strip() for n in names.split(',') if n.strip()])
-                self.log_message(f"Loaded {name_count} names from file: {os.path.basename(file_path)}")
-                self.logger.info(f"Loaded {name_count} names from file: {file_path}")
+            line_count = self.attach_file(file_path)
+            self.log_message(f"Loaded {line_count} lines from file: {os.path.basename(file_path)}")
+            self.logger.info(f"Loaded {line_count} lines from file: {file_path}")
         except Exception as e:
             error_msg = f"[error] Failed to load file: {str(e)}"
             self.log_message(error_msg)
@@ -510,17 +464,9 @@ class RunescapeNameChecker:
             return
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                # Replace newlines with commas
-                names = content.replace('\n', ',').replace('\r', '')
-                self.name_entry.delete(0, "end")
-                self.name_entry.insert(0, names)
-                
-                # Count names
-                name_count = len([n.strip() for n in names.split(',') if n.strip()])
-                self.log_message(f"📂 Dropped {name_count} names from: {os.path.basename(file_path)}")
-                self.logger.info(f"Drag & drop loaded {name_count} names from: {file_path}")
+            line_count = self.attach_file(file_path)
+            self.log_message(f"📂 Dropped {line_count} lines from: {os.path.basename(file_path)}")
+            self.logger.info(f"Drag & drop loaded {line_count} lines from: {file_path}")
         except Exception as e:
             error_msg = f"[error] Failed to load dropped file: {str(e)}"
             self.log_message(error_msg)
@@ -528,99 +474,16 @@ class RunescapeNameChecker:
     
     def update_workers(self, value):
         """Update the number of worker threads."""
-        self.max_workers = int(value)
-        self.workers_value_label.configure(text=str(self.max_workers))
-    
-    def check_single_name(self, name: str, source: str) -> dict:
-        """Check a single name with rate limiting and detailed status tracking."""
-        # Check if stop was requested before starting
-        if self.stop_event.is_set():
-            return {
-                'name': name,
-                'source': source,
-                'available': None,
-                'error': 'Cancelled by user',
-                'status': 'error'
-            }
-        
-        # Rate limiting: 100ms delay per check
-        time.sleep(0.1)
-        
-        # Check again after sleep in case stop was requested
-        if self.stop_event.is_set():
-            return {
-                'name': name,
-                'source': source,
-                'available': None,
-                'error': 'Cancelled by user',
-                'status': 'error'
-            }
-        
-        result_dict = {
-            'name': name,
-            'source': source,
-            'available': None,
-            'error': None,
-            'status': 'pending'
-        }
-        
-        try:
-            result = self.check_name_availability(name, source)
-            
-            if result is True:
-                result_dict['available'] = True
-                result_dict['status'] = 'checked'
-            elif result is False:
-                result_dict['available'] = False
-                result_dict['status'] = 'checked'
-            elif isinstance(result, tuple) and result[0] == "error":
-                result_dict['available'] = None  # Unknown due to error
-                result_dict['error'] = result[1]
-                result_dict['status'] = 'error'
-            
-            # Update name status
-            with self.data_lock:
-                self.name_status[name] = {
-                    'status': result_dict['status'],
-                    'available': result_dict['available'],
-                    'source': source,
-                    'timestamp': datetime.now().isoformat(),
-                    'error': result_dict.get('error')
-                }
-            
-            if result_dict['status'] == 'checked':
-                self.logger.info(f"Checked {name} ({source}): {'Available' if result_dict['available'] else 'Taken'}")
-            else:
-                self.logger.error(f"Error checking {name} ({source}): {result_dict['error']}")
-                
-        except Exception as e:
-            error_msg = str(e)
-            result_dict['error'] = error_msg
-            result_dict['status'] = 'error'
-            
-            # Mark as error (can be retried later)
-            with self.data_lock:
-                self.name_status[name] = {
-                    'status': 'error',
-                    'available': None,
-                    'source': source,
-                    'timestamp': datetime.now().isoformat(),
-                    'error': error_msg
-                }
-            
-            self.logger.error(f"Exception checking {name} ({source}): {error_msg}")
-        
-        return result_dict
+        self.engine.max_workers = int(value)
+        self.workers_value_label.configure(text=str(self.engine.max_workers))
     
     def export_results(self):
-        """Export results to XLSX file with enhanced status tracking."""
-        # Thread-safe: Create a copy of results_data
-        with self.data_lock:
-            if not self.results_data:
-                self.log_message("[info] No results to export")
-                self.logger.warning("Export attempted with no results")
-                return
-            results_copy = self.results_data.copy()
+        """Export the last search's results to an XLSX file, converted row by row from its CSV."""
+        run_export = self.last_run_export
+        if run_export is None or not run_export.rows_written:
+            self.log_message("[info] No results to export")
+            self.logger.warning("Export attempted with no results")
+            return
         
         # Create output directory if it doesn't exist
         if not os.path.exists('output'):
@@ -631,190 +494,56 @@ class RunescapeNameChecker:
         default_filename = f"output/rsn_results_{timestamp}.xlsx"
         
         try:
-            # Create DataFrame from thread-safe copy
-            df = pd.DataFrame(results_copy)
-            
-            # Add formatted columns
-            df['AVAILABLE'] = df['available'].apply(lambda x: 'YES' if x else ('NO' if x is False else 'ERROR'))
-            df['STATUS'] = df['status'].str.upper()
-            
-            # Select and reorder columns
-            columns = ['name', 'AVAILABLE', 'STATUS']
-            if 'error' in df.columns:
-                columns.append('error')
-            
-            export_df = df[columns].copy()
-            export_df.columns = [col.upper() for col in columns]
-            
-            # Auto-save to default filename
-            export_df.to_excel(default_filename, index=False, engine='openpyxl')
+            # Auto-save to default filename; the CSV already has the run's columns
+            rows = convert_export(run_export.path, default_filename)
             
             self.log_message(f"[success] Results exported to: {default_filename}")
-            self.logger.info(f"Results exported to {default_filename} ({len(export_df)} rows)")
+            self.logger.info(f"Results exported to {default_filename} ({rows} rows)")
         except Exception as e:
             error_msg = f"[error] Export failed: {str(e)}"
             self.log_message(error_msg)
             self.logger.error(f"Export failed: {e}")
 
-    def search_name(self, name_entry_text: str, source: str):
-        """Main search function that runs in a separate thread with multi-threading."""
+    def search_name(self, job, source: str):
+        """Run the engine on a new job, or on the unfinished one if ``job`` is None, in a separate thread."""
         try:
-            self.stop_event.clear()
-            # Clear previous results (thread-safe)
-            with self.data_lock:
-                self.results_data = []
-
-            names: List[str] = name_entry_text.split(",")
-            
-            # Filter and validate names
-            valid_names = []
-            for name in names:
-                stripped_name = name.strip()
-                
-                # Skip empty names
-                if not stripped_name:
-                    continue
-                
-                # Thread-safe check for name status
-                with self.data_lock:
-                    status_info = self.name_status.get(stripped_name, {})
-                    status = status_info.get('status', 'pending')
-                
-                # Skip if already successfully checked (available or taken)
-                if status == 'checked':
-                    available = status_info.get('available')
-                    status_text = 'Available' if available else 'Taken'
-                    self.log_message(f"[skipped] {stripped_name} - already checked ({status_text})")
-                    continue
-                
-                # Allow retries for errors
-                if status == 'error':
-                    self.log_message(f"[retry] {stripped_name} - retrying after previous error")
-                    
-                # Validate name length (RuneScape names: 1-12 characters)
-                if len(stripped_name) < 1 or len(stripped_name) > 12:
-                    self.log_message(f"[validation] {stripped_name} invalid length (must be 1-12 chars)")
-                    continue
-                    
-                # Validate characters
-                if not all(
-                    char.isalnum() or char.isspace() or char == "_" or char == "-"
-                    for char in stripped_name
-                ):
-                    self.log_message(f"[validation] {stripped_name} has invalid characters")
-                    continue
-                    
-                # Check if name is only special characters or spaces
-                if all(char in "_- " for char in stripped_name):
-                    self.log_message(f"[validation] {stripped_name} is only special characters or spaces")
-                    continue
-                
-                valid_names.append(stripped_name)
-            
-            if not valid_names:
-                self.log_message("[info] No valid names to check")
-                self.update_progress("No valid names")
-                self.root.after(0, lambda: self.search_button.configure(state="normal"))
-                self.root.after(0, lambda: self.export_button.configure(state="normal"))
+            try:
+                if job is not None:
+                    kind, spec, total, names = job
+                    self.jobs.remove(GUI_JOB)
+                    self.jobs.create(GUI_JOB, kind, spec, SOURCE_KEYS[source], total, names)
+                self.job_run = JobRun(self.jobs, GUI_JOB, on_pause=self.engine.stop)
+            except Exception as e:
+                self.log_message(f"[error] Could not start the search: {e}")
+                self.logger.error(f"Could not start job: {e}")
                 return
-            
-            total_names = len(valid_names)
-            
-            # Use optimal number of workers based on number of names
-            # Don't use more workers than names available
-            actual_workers = min(self.max_workers, total_names)
-            self.log_message(f"[info] Starting check for {total_names} names with {actual_workers} workers")
-            
-            # Use ThreadPoolExecutor for concurrent checking
-            completed = 0
-            with ThreadPoolExecutor(max_workers=actual_workers) as executor:
-                # Track active executor for proper shutdown (thread-safe)
-                with self.executor_lock:
-                    self.active_executor = executor
-                
-                # Submit all tasks
-                future_to_name = {
-                    executor.submit(self.check_single_name, name, source): name 
-                    for name in valid_names
-                }
-                
-                # Process completed tasks
-                for future in as_completed(future_to_name):
-                    if self.stop_event.is_set():
-                        self.log_message(f"{functions.time.get_time()}: Search stopped by user")
-                        self.logger.info(f"Search stopped by user at {completed}/{total_names}")
-                        
-                        # Cancel all pending futures
-                        for f in future_to_name.keys():
-                            f.cancel()
-                        
-                        # Force executor shutdown
-                        executor.shutdown(wait=False, cancel_futures=True)
-                        break
-                    
-                    name = future_to_name[future]
-                    try:
-                        result_dict = future.result()
-                        
-                        # Thread-safe: Add to results data
-                        with self.data_lock:
-                            # Only add to checked_names if successfully checked
-                            if result_dict['status'] == 'checked':
-                                self.checked_names.add(name)
-                            self.results_data.append(result_dict)
-                        
-                        # Update UI based on result
-                        if result_dict['status'] == 'checked':
-                            if result_dict['available'] is True:
-                                self.add_result(name)
-                                self.log_message(f"[result] {name} not found on {source} -> potentially available")
-                            elif result_dict['available'] is False:
-                                self.log_message(f"[result] {name} found on {source} -> taken")
-                        elif result_dict['status'] == 'error':
-                            self.log_message(f"[error] {name}: {result_dict['error']}")
-                        
-                        completed += 1
-                        self.update_progress(f"Checked {completed}/{total_names} names")
-                        
-                        # Save progress every 10 names or on last name for better performance
-                        if completed % 10 == 0 or completed == total_names:
-                            self.save_progress()
-                        
-                    except Exception as e:
-                        self.log_message(f"[error] {name}: {str(e)}")
-                        self.logger.error(f"Exception processing result for {name}: {e}")
-                        completed += 1
-            
-            # Save final progress
-            self.save_progress()
-            
-            # Calculate summary
-            with self.data_lock:
-                checked_count = sum(1 for r in self.results_data if r.get('status') == 'checked')
-                error_count = sum(1 for r in self.results_data if r.get('status') == 'error')
-                available_count = sum(1 for r in self.results_data if r.get('available') is True)
-            
-            # Search completed
-            if not self.stop_event.is_set():
-                summary = f"Complete: {checked_count} checked, {available_count} available, {error_count} errors"
-                self.update_progress(summary)
-                self.log_message(f"{functions.time.get_time()}: Search completed - {summary}")
-                self.logger.info(f"Search completed: {summary}")
-            
-        except Exception as e:
-            # Handle any unexpected errors
-            self.log_message(f"[FATAL ERROR] {str(e)}")
-            self.update_progress("Error occurred")
-            self.logger.error(f"Fatal error in search_name: {e}")
+            # A resumed search keeps the hiscores it was started on
+            source = SOURCES[self.job_run.info['source']]
+
+            # Stream every result to a CSV while the search runs
+            self.last_run_export = None
+            try:
+                if not os.path.exists('output'):
+                    os.makedirs('output')
+                run_file = f"output/rsn_run_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+                self.run_exporter = self.last_run_export = CsvExporter(run_file, export_columns(source_list(source)))
+                self.log_message(f"[info] Results are saved to {run_file} as they arrive")
+            except Exception as e:
+                self.logger.error(f"Could not open run export: {e}")
+
+            self.job_run.attach(self.engine)
+            self.job_run.start()
+            self.engine.search_name(self.job_run.names(), source)
         finally:
-            # Clear active executor reference (thread-safe)
-            with self.executor_lock:
-                self.active_executor = None
-            
+            if self.job_run:
+                runner, self.job_run = self.job_run, None
+                runner.finish()
+            if self.run_exporter:
+                exporter, self.run_exporter = self.run_exporter, None
+                exporter.close()
             # Always re-enable buttons
             self.root.after(0, lambda: self.search_button.configure(state="normal"))
             self.root.after(0, lambda: self.export_button.configure(state="normal"))
-            
 
     def check_name(self):
         """Start the name checking process in a separate thread."""
@@ -830,45 +559,53 @@ class RunescapeNameChecker:
         name_entry_text = self.name_entry.get().strip()
         source = self.selection_var.get()
         
+        # A loaded file is streamed line by line unless the entry was edited since
+        if self.resume_summary and name_entry_text == self.resume_summary:
+            job = None
+        elif self.loaded_file and name_entry_text == self.loaded_summary:
+            job = ("file", {'path': os.path.abspath(self.loaded_file)}, None, ())
+        elif name_entry_text.lower().startswith(PATTERN_PREFIX):
+            # "pattern: [a-z]{2}[0-9]" is expanded lazily while the check runs
+            try:
+                names = Pattern(name_entry_text[len(PATTERN_PREFIX):].strip())
+            except PatternError as e:
+                self.log_message(f"[error] Invalid pattern: {e}")
+                self.search_button.configure(state="normal")
+                self.export_button.configure(state="normal")
+                return
+            total = f"{len(names):,}" if names.unique else f"at most {len(names):,}"
+            self.log_message(f"[info] Pattern spells {total} names")
+            job = ("pattern", {'pattern': names.text}, len(names), ())
+        else:
+            job = ("list", {}, None, name_entry_text.split(","))
+        self.resume_summary = None
+        
         # Run search in separate thread to keep UI responsive
         search_thread = threading.Thread(
             target=self.search_name, 
-            args=(name_entry_text, source),
+            args=(job, source),
             daemon=True
         )
         search_thread.start()        
 
     def stop_search(self):
         """Stop the current search operation."""
-        self.stop_event.set()
         self.log_message(f"{functions.time.get_time()}: Stop requested by user")
         self.logger.info("Stop requested by user")
         self.update_progress("Stopping...")
-        
-        # Force shutdown of active executor if it exists (thread-safe)
-        with self.executor_lock:
-            if self.active_executor:
-                try:
-                    self.active_executor.shutdown(wait=False, cancel_futures=True)
-                    self.logger.info("Active executor shutdown initiated")
-                except Exception as e:
-                    self.logger.error(f"Error shutting down executor: {e}")
+        self.engine.stop()
     
     def on_closing(self):
         """Handle window close event - ensure all threads are stopped."""
         self.logger.info("Application closing - stopping all operations")
         
-        # Set stop event
-        self.stop_event.set()
-        
-        # Force shutdown active executor (thread-safe)
-        with self.executor_lock:
-            if self.active_executor:
-                try:
-                    self.active_executor.shutdown(wait=False, cancel_futures=True)
-                    self.logger.info("Executor shutdown on close")
-                except Exception as e:
-                    self.logger.error(f"Error during close: {e}")
+        # Stop the engine and its executor
+        self.engine.stop()
+
+        # Save where the search got to; what is still unfinished is offered on the next start
+        runner = self.job_run
+        if runner:
+            runner.finish()
         
         # Destroy the window
         self.root.destroy()